@@ -7,25 +7,38 @@ To add a new command:
 2. Import it here
 3. Add to COMMANDS dict
 4. Add to HELP dict
-5. Test it
-6. Update IMPLEMENTATION_GUIDE.md
+5. Add to READ_ONLY_COMMANDS if it has no side effects (and to
+   CACHEABLE_COMMANDS if its result only changes with the UI/project)
+   and to COMMAND_PRIORITIES if it is critical or heavy
+6. Test it
+7. Update IMPLEMENTATION_GUIDE.md
 
 DO NOT create commands anywhere else.
 """
 
+from .utils.dispatch_queue import PRIORITY_CRITICAL, PRIORITY_NORMAL, PRIORITY_HEAVY
+
 # Import command handlers
 from .commands.qgis_commands import (
     qgis_status, qgis_log, qgis_read_log, qgis_reload_plugin,
     qgis_restart, qgis_api_status, qgis_restart_api, qgis_read_python_console,
-    qgis_execute_action
+    qgis_execute_action, qgis_list_actions, qgis_wait_idle, qgis_metrics,
+    qgis_traces, qgis_profile
 )
 from .commands.crash_commands import crash_save, crash_restore, crash_list
 from .commands.widget_commands import (
     widget_list_windows, widget_find, widget_inspect, widget_click,
     widget_wait_for, error_detect, dialog_close,
-    widget_set_text, widget_select_item, widget_send_keys
+    dialog_add_rule, dialog_list_rules, dialog_remove_rule,
+    widget_set_text, widget_select_item, widget_send_keys, widget_fill_form,
+    widget_get_properties, widget_at_point
 )
 from .commands.layer_commands import layer_list
+from .commands.action_commands import action_status, action_wait
+from .commands.job_commands import job_list, job_status, job_wait, job_cancel, job_result
+from .commands.processing_commands import (
+    processing_list_algorithms, processing_get_params, processing_run
+)
 from .commands.workflow_commands import (
     workflow_record_start, workflow_record_stop, workflow_add_note,
     workflow_list, workflow_get
@@ -42,20 +55,41 @@ COMMANDS = {
     "qgis.restart_api": qgis_restart_api,
     "qgis.read_python_console": qgis_read_python_console,
     "qgis.execute_action": qgis_execute_action,
+    "qgis.list_actions": qgis_list_actions,
+    "qgis.wait_idle": qgis_wait_idle,
+    "qgis.metrics": qgis_metrics,
+    "qgis.traces": qgis_traces,
+    "qgis.profile": qgis_profile,
     "crash.save": crash_save,
     "crash.restore": crash_restore,
     "crash.list": crash_list,
     "widget.list_windows": widget_list_windows,
     "widget.find": widget_find,
     "widget.inspect": widget_inspect,
+    "widget.get_properties": widget_get_properties,
+    "widget.at_point": widget_at_point,
     "widget.click": widget_click,
     "widget.wait_for": widget_wait_for,
     "widget.set_text": widget_set_text,
     "widget.select_item": widget_select_item,
     "widget.send_keys": widget_send_keys,
+    "widget.fill_form": widget_fill_form,
     "error.detect": error_detect,
     "dialog.close": dialog_close,
+    "dialog.add_rule": dialog_add_rule,
+    "dialog.list_rules": dialog_list_rules,
+    "dialog.remove_rule": dialog_remove_rule,
     "layer.list": layer_list,
+    "action.status": action_status,
+    "action.wait": action_wait,
+    "job.list": job_list,
+    "job.status": job_status,
+    "job.wait": job_wait,
+    "job.cancel": job_cancel,
+    "job.result": job_result,
+    "processing.list_algorithms": processing_list_algorithms,
+    "processing.get_params": processing_get_params,
+    "processing.run": processing_run,
     "workflow.record_start": workflow_record_start,
     "workflow.record_stop": workflow_record_stop,
     "workflow.add_note": workflow_add_note,
@@ -63,6 +97,78 @@ COMMANDS = {
     "workflow.get": workflow_get,
 }
 
+# READ_ONLY_COMMANDS - Commands without side effects whose concurrent
+# identical calls (same params) may share one execution. Waiting commands
+# (wait_for, wait_idle, *.wait) are excluded: each caller has its own timeout.
+READ_ONLY_COMMANDS = frozenset({
+    "qgis.status",
+    "qgis.read_log",
+    "qgis.api_status",
+    "qgis.metrics",
+    "qgis.traces",
+    "qgis.read_python_console",
+    "qgis.list_actions",
+    "crash.list",
+    "widget.list_windows",
+    "widget.find",
+    "widget.inspect",
+    "widget.get_properties",
+    "widget.at_point",
+    "error.detect",
+    "dialog.list_rules",
+    "layer.list",
+    "action.status",
+    "job.list",
+    "job.status",
+    "job.result",
+    "processing.list_algorithms",
+    "processing.get_params",
+    "workflow.list",
+    "workflow.get",
+})
+
+# CACHEABLE_COMMANDS - Read-only commands whose results only change with the
+# UI or the project, so they can be served from the UI-epoch response cache
+CACHEABLE_COMMANDS = frozenset({
+    "qgis.list_actions",
+    "widget.find",
+    "widget.inspect",
+    "widget.get_properties",
+    "widget.at_point",
+    "layer.list",
+    "processing.list_algorithms",
+    "processing.get_params",
+})
+
+# COMMAND_PRIORITIES - Dispatch queue priority (commands not listed are
+# PRIORITY_NORMAL). Critical commands are cheap and must stay responsive
+# under load; heavy ones are tree dumps, waits and long-running work.
+COMMAND_PRIORITIES = {
+    "qgis.status": PRIORITY_CRITICAL,
+    "qgis.log": PRIORITY_CRITICAL,
+    "qgis.read_log": PRIORITY_CRITICAL,
+    "qgis.api_status": PRIORITY_CRITICAL,
+    "qgis.metrics": PRIORITY_CRITICAL,
+    "error.detect": PRIORITY_CRITICAL,
+    "dialog.close": PRIORITY_CRITICAL,
+    "dialog.list_rules": PRIORITY_CRITICAL,
+    "action.status": PRIORITY_CRITICAL,
+    "job.list": PRIORITY_CRITICAL,
+    "job.status": PRIORITY_CRITICAL,
+    "job.cancel": PRIORITY_CRITICAL,
+    "widget.find": PRIORITY_HEAVY,
+    "widget.inspect": PRIORITY_HEAVY,
+    "widget.wait_for": PRIORITY_HEAVY,
+    "qgis.wait_idle": PRIORITY_HEAVY,
+    "qgis.read_python_console": PRIORITY_HEAVY,
+    "qgis.profile": PRIORITY_HEAVY,
+    "action.wait": PRIORITY_HEAVY,
+    "job.wait": PRIORITY_HEAVY,
+    "processing.run": PRIORITY_HEAVY,
+    "crash.save": PRIORITY_HEAVY,
+    "crash.restore": PRIORITY_HEAVY,
+}
+
 
 # HELP - Provides help text for all commands
 HELP = {
@@ -149,13 +255,79 @@ HELP = {
             "success": "bool",
             "api_running": "bool",
             "port": "int",
-            "host": "str"
+            "host": "str",
+            "coalescing": "dict (in_flight, executed, coalesced read-only requests)"
         },
         "example": {
             "command": "qgis.api_status"
         },
         "description": "Check if API server is running"
     },
+    "qgis.metrics": {
+        "params": {},
+        "returns": {
+            "success": "bool",
+            "dispatch": "dict (workers, pending per priority, executed, rejected, timed_out)",
+            "response_cache": "dict (entries, hits, misses, hit_ratio, epoch, epoch_bumps, ttl_seconds)",
+            "coalescing": "dict (in_flight, executed, coalesced)",
+            "geometry_cache": "dict (passes)",
+            "spatial_index": "dict (windows, widgets, rebuilds, incremental_updates)"
+        },
+        "example": {
+            "command": "qgis.metrics"
+        },
+        "description": "Server-side performance counters: dispatch queue, response cache hit ratio and UI epoch, request coalescing, geometry/spatial index work"
+    },
+    "qgis.traces": {
+        "params": {
+            "trace_id": "str (optional: return all spans of this trace)",
+            "command": "str (optional: only traces of this command)",
+            "min_duration_ms": "float (optional: only traces at least this slow)",
+            "limit": "int (optional: traces to list, defaults to 20)"
+        },
+        "returns": {
+            "success": "bool",
+            "traces": "list (trace_id, command, status, timestamp, duration_ms, spans, breakdown_ms)",
+            "spans": "list (with trace_id: Zipkin v2 spans)",
+            "breakdown_ms": "dict (with trace_id: milliseconds per step)"
+        },
+        "example": {
+            "command": "qgis.traces",
+            "params": {
+                "min_duration_ms": 500
+            }
+        },
+        "description": "Latency breakdown of recent requests: dispatch.queue, handler, main_thread.queue/run, encode. Every response carries X-Trace-Id; spans are also written to traces/spans.jsonl (Zipkin v2)"
+    },
+    "qgis.profile": {
+        "params": {
+            "mode": "str (optional: 'sample' (default), 'commands', 'result' or 'cancel')",
+            "duration": "float (optional, sample: seconds, defaults to 5, max 300; capped by the request deadline unless background)",
+            "interval_ms": "float (optional, sample: milliseconds between samples, defaults to 5)",
+            "background": "bool (optional, sample: run as a job and return job_id)",
+            "count": "int (commands: profile the next N commands)",
+            "command": "str (optional, commands: only profile this command)",
+            "sort": "str (optional, result: pstats sort key, defaults to 'cumulative')",
+            "top": "int (optional: hot functions / pstats rows, defaults to 30)"
+        },
+        "returns": {
+            "success": "bool",
+            "collapsed": "str (sample: 'outer;inner;leaf count' lines, flamegraph input)",
+            "hot_functions": "list (sample: function, samples, percent)",
+            "idle_samples": "int (sample: GUI thread not running Python)",
+            "job_id": "int (sample with background)",
+            "armed": "int (commands)",
+            "pstats": "str (result: cProfile summary of the profiled commands)"
+        },
+        "example": {
+            "command": "qgis.profile",
+            "params": {
+                "mode": "sample",
+                "duration": 5
+            }
+        },
+        "description": "Profile a running session in place: sample the main thread's Python stack for N seconds, or run the next K commands under cProfile and read the pstats summary with mode='result'"
+    },
     "qgis.restart_api": {
         "params": {},
         "returns": {
@@ -191,14 +363,19 @@ HELP = {
     },
     "qgis.execute_action": {
         "params": {
-            "action_name": "str (required: action name like 'showPythonDialog', 'mActionNewProject')",
-            "wait": "float (optional: time to wait after execution in seconds, defaults to 0.5)"
+            "action_name": "str (required: objectName like 'mActionNewProject', menu path like 'Project > New', or menu text)",
+            "wait": "float (optional: max seconds to wait for the action to finish, defaults to 0.5)"
         },
         "returns": {
             "success": "bool",
             "action_name": "str",
             "found": "bool",
-            "executed": "bool"
+            "matched_by": "str ('name', 'menu_path', 'text', 'fuzzy' or 'object_name')",
+            "candidates": "list (only when the name is ambiguous)",
+            "executed": "bool",
+            "action_id": "int (use with action.wait / action.status)",
+            "status": "str ('done', 'running', 'blocked_on_dialog')",
+            "dialog": "dict or None (modal dialog the action opened)"
         },
         "example": {
             "command": "qgis.execute_action",
@@ -208,6 +385,49 @@ HELP = {
         },
         "description": "Execute QGIS menu/toolbar action by name (e.g., open Python console, new project)"
     },
+    "qgis.list_actions": {
+        "params": {
+            "search": "str (optional: words matched against name, text, menu path and shortcut)",
+            "include_disabled": "bool (optional: include disabled actions, defaults to True)",
+            "limit": "int (optional: max actions returned, defaults to 200)"
+        },
+        "returns": {
+            "success": "bool",
+            "actions": "list (name, text, menu_path, shortcut, enabled, checkable, checked)",
+            "count": "int",
+            "total": "int",
+            "truncated": "bool"
+        },
+        "example": {
+            "command": "qgis.list_actions",
+            "params": {
+                "search": "project save"
+            }
+        },
+        "description": "List QGIS menu/toolbar actions usable with qgis.execute_action"
+    },
+    "qgis.wait_idle": {
+        "params": {
+            "timeout": "float (optional: max seconds to wait, defaults to 10)",
+            "settle_ms": "float (optional: how long QGIS must stay idle, defaults to 150)",
+            "include_tasks": "bool (optional: wait for running QgsTasks, defaults to True)",
+            "include_canvas": "bool (optional: wait for canvas rendering, defaults to True)"
+        },
+        "returns": {
+            "success": "bool",
+            "idle": "bool",
+            "elapsed_time": "float",
+            "samples": "int",
+            "state": "dict (latency_ms, pending_events, active_tasks, canvas_rendering)"
+        },
+        "example": {
+            "command": "qgis.wait_idle",
+            "params": {
+                "timeout": 5
+            }
+        },
+        "description": "Wait until QGIS is idle (empty event queue, no running tasks, canvas rendered) instead of sleeping"
+    },
     "crash.save": {
         "params": {
             "operation": "str (required)"
@@ -215,7 +435,9 @@ HELP = {
         "returns": {
             "success": "bool",
             "checkpoint_id": "str",
-            "project_path": "str"
+            "project_path": "str",
+            "status": "str ('pending' - written to disk in the background)",
+            "capture_ms": "float"
         },
         "example": {
             "command": "crash.save",
@@ -223,11 +445,12 @@ HELP = {
                 "operation": "opening risky dialog"
             }
         },
-        "description": "Save QGIS state before risky operations"
+        "description": "Capture project, window and layer tree state; checkpoint is written to disk in the background"
     },
     "crash.restore": {
         "params": {
-            "checkpoint_id": "str (required)"
+            "checkpoint_id": "str (required)",
+            "timeout": "float (optional: seconds to wait for a pending checkpoint, defaults to 30)"
         },
         "returns": {
             "success": "bool",
@@ -237,48 +460,63 @@ HELP = {
         "example": {
             "command": "crash.restore",
             "params": {
-                "checkpoint_id": "checkpoint_20260129_143022"
+                "checkpoint_id": "checkpoint_20260129_143022_123456_a1b2c3"
             }
         },
-        "description": "Restore QGIS state from checkpoint"
+        "description": "Reload project, window and layer tree state from a checkpoint"
     },
     "crash.list": {
-        "params": {},
+        "params": {
+            "checkpoint_id": "str (optional: only report this checkpoint)"
+        },
         "returns": {
             "success": "bool",
-            "checkpoints": "list",
-            "count": "int"
+            "checkpoints": "list (each with status: pending/writing/complete/failed, size_bytes, stored_bytes, save_ms)",
+            "count": "int",
+            "pending": "int",
+            "disk_usage_bytes": "int"
         },
         "example": {
             "command": "crash.list"
         },
-        "description": "List all saved checkpoints"
+        "description": "List all saved checkpoints (persisted across QGIS restarts) and pending writes"
     },
     "widget.list_windows": {
         "params": {
-            "visible_only": "bool (optional: defaults to True)"
+            "visible_only": "bool (optional: defaults to True)",
+            "since": "int (optional: token from an earlier call - also return lifecycle changes after it)"
         },
         "returns": {
             "success": "bool",
-            "windows": "list",
-            "count": "int"
+            "windows": "list (topmost first; handle, opened_at, z, dialog, ...)",
+            "count": "int",
+            "token": "int (pass as since next time)",
+            "changes": "list (with since: opened/closed/title/destroyed events)",
+            "complete": "bool (with since: False if older changes were dropped)"
         },
         "example": {
-            "command": "widget.list_windows"
+            "command": "widget.list_windows",
+            "params": {
+                "since": 42
+            }
         },
-        "description": "List all top-level windows/dialogs with details"
+        "description": "List all top-level windows/dialogs with details. Served from a window registry kept current by UI events; use since to detect new dialogs without diffing"
     },
     "widget.find": {
         "params": {
             "type": "str (required: 'objectName', 'title', 'class', 'text')",
             "value": "str (required: search value)",
             "parent": "str (optional: parent objectName)",
-            "exact": "bool (optional: exact match, defaults to False)"
+            "exact": "bool (optional: exact match, defaults to False)",
+            "fields": "list (optional: only return these fields, e.g. ['objectName', 'class'])",
+            "max_text_len": "int (optional: truncate text fields, defaults to 4096, 0 = no limit)",
+            "max_results": "int (optional: stop after this many matches)"
         },
         "returns": {
             "success": "bool",
-            "widgets": "list",
-            "count": "int"
+            "widgets": "list (each with a handle for follow-up commands)",
+            "count": "int",
+            "truncated": "bool"
         },
         "example": {
             "command": "widget.find",
@@ -291,13 +529,18 @@ HELP = {
     },
     "widget.inspect": {
         "params": {
-            "objectName": "str (required: widget to inspect)",
-            "include_children": "bool (optional: defaults to False)"
+            "objectName": "str (required unless handle is given: widget to inspect)",
+            "handle": "int (optional: widget handle from widget.find/inspect/get_properties, instead of objectName)",
+            "include_children": "bool (optional: defaults to False)",
+            "fields": "list (optional: only return these properties)",
+            "max_text_len": "int (optional: truncate text properties, defaults to 4096, 0 = no limit)",
+            "max_results": "int (optional: maximum number of children)"
         },
         "returns": {
             "success": "bool",
-            "widget": "dict",
-            "children": "list"
+            "widget": "dict (includes handle)",
+            "children": "list",
+            "truncated": "bool"
         },
         "example": {
             "command": "widget.inspect",
@@ -308,15 +551,66 @@ HELP = {
         },
         "description": "Get detailed properties of a widget"
     },
+    "widget.get_properties": {
+        "params": {
+            "objectNames": "list (optional: widgets to read by objectName)",
+            "handles": "list (optional: widgets to read by handle; give objectNames, handles or both)",
+            "properties": "list or str (optional: Qt property names like 'text', 'value', 'checked', 'currentText', 'geometry'; '*' for all; defaults to a common set)",
+            "max_text_len": "int (optional: truncate text properties, defaults to 4096, 0 = no limit)"
+        },
+        "returns": {
+            "success": "bool",
+            "widgets": "list (handle, objectName plus requested properties the widget has)",
+            "not_found": "list",
+            "stale_handles": "list (handles whose widget was destroyed)",
+            "invalid_handles": "list ({handle, error} for handles that are not integers)",
+            "count": "int",
+            "truncated": "bool"
+        },
+        "example": {
+            "command": "widget.get_properties",
+            "params": {
+                "objectNames": ["mOutputDirLineEdit", "mSolverComboBox", "mSaveMaxCheckBox"],
+                "properties": ["text", "currentText", "checked", "enabled"]
+            }
+        },
+        "description": "Bulk-read Qt properties of many widgets in one call"
+    },
+    "widget.at_point": {
+        "params": {
+            "x": "int (required: screen X coordinate)",
+            "y": "int (required: screen Y coordinate)",
+            "include_ancestors": "bool (optional: include the parent chain up to the window, defaults to True)"
+        },
+        "returns": {
+            "success": "bool",
+            "found": "bool",
+            "widget": "dict (handle, objectName, class, text, screen_rect)",
+            "ancestors": "list (handle, objectName, class - innermost parent first)"
+        },
+        "example": {
+            "command": "widget.at_point",
+            "params": {
+                "x": 640,
+                "y": 412
+            }
+        },
+        "description": "Hit-test a screen point (e.g. from a screenshot) to find the topmost widget there"
+    },
     "widget.click": {
         "params": {
-            "objectName": "str (required: widget to click)",
-            "button": "str (optional: 'left', 'right', 'middle', defaults to 'left')"
+            "objectName": "str (required unless handle is given: widget to click)",
+            "handle": "int (optional: widget handle from widget.find/inspect/get_properties, instead of objectName)",
+            "button": "str (optional: 'left', 'right', 'middle', defaults to 'left')",
+            "wait": "float (optional: max seconds to wait for the click to finish, defaults to 0.5)"
         },
         "returns": {
             "success": "bool",
             "clicked": "bool",
-            "widget_class": "str"
+            "widget_class": "str",
+            "action_id": "int (use with action.wait / action.status)",
+            "status": "str ('done', 'running', 'blocked_on_dialog')",
+            "dialog": "dict or None (modal dialog the click opened)"
         },
         "example": {
             "command": "widget.click",
@@ -324,11 +618,12 @@ HELP = {
                 "objectName": "QPushButton_ok"
             }
         },
-        "description": "Click a widget programmatically"
+        "description": "Click a widget programmatically (returns early with an action_id if a modal dialog opens)"
     },
     "widget.wait_for": {
         "params": {
             "objectName": "str (optional: widget to wait for)",
+            "handle": "int (optional: widget handle to watch; a destroyed widget counts as 'gone')",
             "type": "str (optional: search type if not using objectName)",
             "value": "str (optional: search value if not using objectName)",
             "state": "str (required: 'visible', 'hidden', 'enabled', 'disabled', 'exists', 'gone')",
@@ -351,7 +646,8 @@ HELP = {
     },
     "widget.set_text": {
         "params": {
-            "objectName": "str (required: widget to set text in)",
+            "objectName": "str (required unless handle is given: widget to set text in)",
+            "handle": "int (optional: widget handle from widget.find/inspect/get_properties, instead of objectName)",
             "text": "str (required: text to set)",
             "clear_first": "bool (optional: clear existing text first, defaults to True)"
         },
@@ -372,7 +668,8 @@ HELP = {
     },
     "widget.select_item": {
         "params": {
-            "objectName": "str (required: widget to select from)",
+            "objectName": "str (required unless handle is given: widget to select from)",
+            "handle": "int (optional: widget handle from widget.find/inspect/get_properties, instead of objectName)",
             "value": "str or int (required: item text or index to select)",
             "by_index": "bool (optional: select by index instead of text, defaults to False)"
         },
@@ -394,35 +691,84 @@ HELP = {
     },
     "widget.send_keys": {
         "params": {
-            "objectName": "str (optional: widget to send keys to, if None sends globally)",
-            "keys": "str (required: keys to send, e.g., 'Ctrl+S', 'Enter', 'text')",
-            "delay": "float (optional: delay between key presses in seconds, defaults to 0.1)"
+            "objectName": "str (optional: widget to send keys to, if None sends to the focused widget)",
+            "handle": "int (optional: widget handle from widget.find/inspect/get_properties, instead of objectName)",
+            "keys": "str or list (required: 'Ctrl+S' / 'Enter' / 'text', or a macro like ['Ctrl+A', 'text:C:/data/in.shp', 'Tab', 'Enter', 'delay:0.5'])",
+            "delay": "float (optional: delay between key presses in seconds, defaults to 0)",
+            "fast_text": "bool (optional: insert text directly into editable widgets, defaults to True)",
+            "wait_idle": "bool (optional: wait for QGIS to go idle afterwards, defaults to False)",
+            "idle_timeout": "float (optional: max seconds to wait with wait_idle, defaults to 2)"
         },
         "returns": {
             "success": "bool",
-            "keys_sent": "str",
-            "target": "str"
+            "keys_sent": "str or list",
+            "target": "str",
+            "steps": "int",
+            "steps_done": "int (steps sent before the request deadline)",
+            "cancelled": "bool (the deadline cut the macro short; success is then false)",
+            "keystrokes": "int (synthesized key events)",
+            "chars_inserted": "int (characters inserted directly)",
+            "focus": "str (objectName of the focused widget afterwards)",
+            "elapsed_ms": "float",
+            "idle": "bool (only with wait_idle)"
         },
         "example": {
             "command": "widget.send_keys",
             "params": {
-                "keys": "Ctrl+S"
+                "objectName": "mInputLineEdit",
+                "keys": ["Ctrl+A", "text:C:/data/boundary.shp", "Tab", "Enter"]
             }
         },
-        "description": "Send keyboard input to a widget or globally"
+        "description": "Send keyboard input or a key macro (keys, chords, text:, delay: steps) in one batch"
+    },
+    "widget.fill_form": {
+        "params": {
+            "fields": "dict (required: objectName -> value; combos/lists take text or {'index': n}, checkboxes bool, QGIS file/CRS/layer widgets a path, auth ID or layer ID/name)",
+            "window_title": "str (optional: only search windows whose title contains this)",
+            "block_signals": "bool (optional: set silently then emit one change notification per field, defaults to False)"
+        },
+        "returns": {
+            "success": "bool (False if any field was not found or failed)",
+            "count": "int",
+            "set": "dict (objectName -> widget_class, property)",
+            "not_found": "list",
+            "errors": "dict (objectName -> error)",
+            "elapsed_ms": "float"
+        },
+        "example": {
+            "command": "widget.fill_form",
+            "params": {
+                "fields": {
+                    "mSimulationTimeSpinBox": 3600,
+                    "mOutputDirLineEdit": "C:/runs/case1",
+                    "mSolverComboBox": "GPU",
+                    "mSaveMaxCheckBox": True
+                },
+                "block_signals": True
+            }
+        },
+        "description": "Fill many form fields in one round trip (single lookup pass, one event-loop pump)"
     },
     "error.detect": {
-        "params": {},
+        "params": {
+            "since": "float (optional: also return errors shown after this epoch time, even if already closed - pass the previous server_time)"
+        },
         "returns": {
             "success": "bool",
-            "errors": "list",
+            "errors": "list (currently open: class, title, text, icon_name, shown_at, handle)",
             "count": "int",
-            "has_errors": "bool"
+            "has_errors": "bool",
+            "recent_errors": "list (with since: every error shown since then, with closed_at)",
+            "source": "str ('monitor' or 'scan')",
+            "server_time": "float (use as the next since)"
         },
         "example": {
-            "command": "error.detect"
+            "command": "error.detect",
+            "params": {
+                "since": 1767225600.0
+            }
         },
-        "description": "Detect error dialogs currently visible"
+        "description": "Detect error dialogs (answered from an event-driven monitor with history)"
     },
     "dialog.close": {
         "params": {
@@ -443,6 +789,61 @@ HELP = {
         },
         "description": "Close a dialog by objectName or title"
     },
+    "dialog.add_rule": {
+        "params": {
+            "match": "dict (title substring, class name, text regex and/or objectName - all given keys must match)",
+            "action": "str ('accept', 'reject', 'close' or 'click')",
+            "button": "str (required for 'click': button text, objectName or standard button name)",
+            "name": "str (optional: label for the decision log)",
+            "once": "bool (optional: disable after the first match, defaults to False)"
+        },
+        "returns": {
+            "success": "bool",
+            "rule": "dict (id, name, match, action, button, once, enabled, source, hits)",
+            "engine_running": "bool"
+        },
+        "example": {
+            "command": "dialog.add_rule",
+            "params": {
+                "match": {"class": "QMessageBox", "text": "(?i)save changes"},
+                "action": "click",
+                "button": "Discard"
+            }
+        },
+        "description": "Answer matching dialogs automatically when they are shown (no round trip). Rules can also be listed in config.json under dialog_rules.rules"
+    },
+    "dialog.list_rules": {
+        "params": {
+            "decisions": "int (optional: recent decisions to include, defaults to 20)"
+        },
+        "returns": {
+            "success": "bool",
+            "rules": "list",
+            "decisions": "list (time, rule_id, rule, class, objectName, title, action, method, success)",
+            "engine_running": "bool"
+        },
+        "example": {
+            "command": "dialog.list_rules",
+            "params": {}
+        },
+        "description": "List dialog auto-response rules and the log of dialogs they answered"
+    },
+    "dialog.remove_rule": {
+        "params": {
+            "rule_id": "int (rule to remove)"
+        },
+        "returns": {
+            "success": "bool",
+            "removed": "dict"
+        },
+        "example": {
+            "command": "dialog.remove_rule",
+            "params": {
+                "rule_id": 1
+            }
+        },
+        "description": "Remove a dialog auto-response rule"
+    },
     "layer.list": {
         "params": {
             "include_metadata": "bool (optional: include detailed metadata, defaults to True)"
@@ -460,6 +861,209 @@ HELP = {
         },
         "description": "List all layers in current QGIS project with metadata"
     },
+    "action.status": {
+        "params": {
+            "action_id": "int (required: from widget.click or qgis.execute_action)"
+        },
+        "returns": {
+            "success": "bool",
+            "action_id": "int",
+            "description": "str",
+            "status": "str ('queued', 'running', 'blocked_on_dialog', 'done', 'error')",
+            "dialog": "dict or None",
+            "error": "str or None"
+        },
+        "example": {
+            "command": "action.status",
+            "params": {
+                "action_id": 12
+            }
+        },
+        "description": "Get the state of a queued click/action trigger"
+    },
+    "action.wait": {
+        "params": {
+            "action_id": "int (required: from widget.click or qgis.execute_action)",
+            "until": "str (optional: 'done' or 'dialog', defaults to 'done')",
+            "timeout": "float (optional: timeout in seconds, defaults to 5)"
+        },
+        "returns": {
+            "success": "bool",
+            "condition_met": "bool",
+            "status": "str",
+            "dialog": "dict or None"
+        },
+        "example": {
+            "command": "action.wait",
+            "params": {
+                "action_id": 12,
+                "until": "done",
+                "timeout": 10
+            }
+        },
+        "description": "Wait for a queued click/action trigger to finish or to open a modal dialog"
+    },
+    "job.list": {
+        "params": {
+            "status": "str (optional: only 'queued', 'running', 'completed', 'failed' or 'cancelled' jobs)"
+        },
+        "returns": {
+            "success": "bool",
+            "jobs": "list (job_id, description, status, progress, timestamps)",
+            "count": "int"
+        },
+        "example": {
+            "command": "job.list",
+            "params": {
+                "status": "running"
+            }
+        },
+        "description": "List background jobs started by long-running commands"
+    },
+    "job.status": {
+        "params": {
+            "job_id": "int (required: ID returned by the submitting command)"
+        },
+        "returns": {
+            "success": "bool",
+            "job_id": "int",
+            "description": "str",
+            "status": "str ('queued', 'running', 'completed', 'failed', 'cancelled')",
+            "progress": "float (0-100)",
+            "error": "str or None"
+        },
+        "example": {
+            "command": "job.status",
+            "params": {
+                "job_id": 3
+            }
+        },
+        "description": "Get status and progress of a background job"
+    },
+    "job.wait": {
+        "params": {
+            "job_id": "int (required)",
+            "timeout": "float (optional: seconds to wait, defaults to 30, max 60)",
+            "include_result": "bool (optional: include result when finished, defaults to True)"
+        },
+        "returns": {
+            "success": "bool",
+            "finished": "bool",
+            "status": "str",
+            "progress": "float",
+            "result": "any (when finished)"
+        },
+        "example": {
+            "command": "job.wait",
+            "params": {
+                "job_id": 3,
+                "timeout": 30
+            }
+        },
+        "description": "Long-poll until a background job finishes (repeat while finished is False)"
+    },
+    "job.cancel": {
+        "params": {
+            "job_id": "int (required)"
+        },
+        "returns": {
+            "success": "bool",
+            "cancel_requested": "bool",
+            "status": "str"
+        },
+        "example": {
+            "command": "job.cancel",
+            "params": {
+                "job_id": 3
+            }
+        },
+        "description": "Cancel a background job (running jobs stop at their next cancellation check)"
+    },
+    "job.result": {
+        "params": {
+            "job_id": "int (required)"
+        },
+        "returns": {
+            "success": "bool (False if the job failed, was cancelled or is still running)",
+            "status": "str",
+            "result": "any",
+            "error": "str or None"
+        },
+        "example": {
+            "command": "job.result",
+            "params": {
+                "job_id": 3
+            }
+        },
+        "description": "Get the result of a finished background job"
+    },
+    "processing.list_algorithms": {
+        "params": {
+            "search": "str (optional: words matched against id, name, group and tags)",
+            "provider": "str (optional: provider ID like 'native', 'gdal', 'qgis')",
+            "include_params": "bool (optional: include parameter definitions, defaults to False)",
+            "limit": "int (optional: max algorithms returned, defaults to 100)",
+            "offset": "int (optional: skip this many matches, defaults to 0)"
+        },
+        "returns": {
+            "success": "bool",
+            "algorithms": "list (id, name, provider, group)",
+            "count": "int",
+            "total": "int (matches before limit/offset)",
+            "truncated": "bool"
+        },
+        "example": {
+            "command": "processing.list_algorithms",
+            "params": {
+                "search": "buffer",
+                "provider": "native"
+            }
+        },
+        "description": "Search Processing algorithms (catalog is cached and refreshed when providers change)"
+    },
+    "processing.get_params": {
+        "params": {
+            "algorithm_id": "str (required: e.g. 'native:buffer')"
+        },
+        "returns": {
+            "success": "bool",
+            "algorithm": "dict (id, name, provider, group, tags, help, no_threading, parameters, outputs)"
+        },
+        "example": {
+            "command": "processing.get_params",
+            "params": {
+                "algorithm_id": "native:buffer"
+            }
+        },
+        "description": "Describe an algorithm's parameters (name, type, optional, default, options) and outputs"
+    },
+    "processing.run": {
+        "params": {
+            "algorithm_id": "str (required unless batch is given)",
+            "parameters": "dict (algorithm parameters; use file paths for outputs)",
+            "batch": "list (optional: [{algorithm_id, parameters}, ...] run in parallel)",
+            "max_concurrency": "int (optional: items running at once, defaults to config processing.max_concurrency or CPU count)",
+            "wait": "float (optional: seconds to wait before returning, defaults to 0)"
+        },
+        "returns": {
+            "success": "bool",
+            "job_id": "int (use with job.wait / job.result)",
+            "status": "str",
+            "finished": "bool",
+            "result": "dict (when finished: items with per-item status, results and error; completed/failed/cancelled counts)"
+        },
+        "example": {
+            "command": "processing.run",
+            "params": {
+                "batch": [
+                    {"algorithm_id": "native:buffer", "parameters": {"INPUT": "/data/a.shp", "DISTANCE": 10, "OUTPUT": "/data/a_buf.gpkg"}},
+                    {"algorithm_id": "native:buffer", "parameters": {"INPUT": "/data/b.shp", "DISTANCE": 10, "OUTPUT": "/data/b_buf.gpkg"}}
+                ],
+                "max_concurrency": 4
+            }
+        },
+        "description": "Run Processing algorithms as background QgsTasks (batches run in parallel); returns a job_id"
+    },
     "workflow.record_start": {
         "params": {
             "workflow_name": "str (required: name for the workflow)",
@@ -556,6 +1160,45 @@ def get(command):
     return COMMANDS.get(command)
 
 
+def is_read_only(command):
+    """
+    Check whether a command is declared side-effect free
+
+    Args:
+        command (str): Command string
+
+    Returns:
+        bool: True if the command is in READ_ONLY_COMMANDS
+    """
+    return command in READ_ONLY_COMMANDS
+
+
+def is_cacheable(command):
+    """
+    Check whether a command's results may be served from the response cache
+
+    Args:
+        command (str): Command string
+
+    Returns:
+        bool: True if the command is in CACHEABLE_COMMANDS
+    """
+    return command in CACHEABLE_COMMANDS
+
+
+def get_priority(command):
+    """
+    Get the dispatch queue priority of a command
+
+    Args:
+        command (str): Command string
+
+    Returns:
+        int: PRIORITY_CRITICAL, PRIORITY_NORMAL or PRIORITY_HEAVY
+    """
+    return COMMAND_PRIORITIES.get(command, PRIORITY_NORMAL)
+
+
 def list_commands():
     """
     List all available command strings
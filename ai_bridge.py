@@ -55,6 +55,18 @@ class QgisAiBridge:
             Qgis.Info
         )
 
+        # Shared app-wide event filter used to invalidate UI caches
+        from .utils import ui_events
+        from .utils.error_monitor import monitor as error_monitor
+        from .utils.dialog_rules import engine as dialog_rules
+        from .utils.window_registry import registry as window_registry
+        from .utils.response_cache import response_cache
+        ui_events.install()
+        window_registry.start()
+        response_cache.start()
+        error_monitor.start()
+        dialog_rules.start()
+
         # Auto-start server
         self.start_server()
 
@@ -66,6 +78,23 @@ class QgisAiBridge:
         # Remove menu item
         self.iface.removePluginMenu("AI Bridge", self.action)
 
+        # Detach event filters before the modules go away
+        try:
+            from .utils.action_index import index as action_index
+            action_index.shutdown()
+        except Exception:
+            pass
+        try:
+            from .utils import ui_events
+            ui_events.uninstall()
+        except Exception:
+            pass
+        try:
+            from .utils.tracing import tracer
+            tracer.shutdown()
+        except Exception:
+            pass
+
         # Clear module cache for hot reload
         self._clear_module_cache()
 
@@ -2,10 +2,13 @@
 import json
 import socket
 from pathlib import Path
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, request
 from flask_cors import CORS
 from werkzeug.serving import make_server
 from . import COMMAND_REGISTRY
+from .utils.response_encoder import ResponseEncoder
+from .utils.dispatch_queue import DispatchQueue, QueueFullError, QueueTimeoutError
+from .utils import cancellation, tracing
 
 class APIServer:
     def __init__(self, config_path: Path = None):
@@ -19,15 +22,79 @@ class APIServer:
         self.port = self.config["server"]["port"]
         self.app = Flask(__name__)
         CORS(self.app)
+        self.encoder = ResponseEncoder(self.config.get("encoding"))
+        self.dispatcher = DispatchQueue(self.config.get("dispatch"))
 
         self.server = None
         self.running = False
 
         self._register_routes()
 
+    def _respond(self, payload, status=200, extra_headers=None):
+        """Encode a result per the request's Accept/Accept-Encoding headers"""
+        span = tracing.tracer.start_span("encode", g.trace_span)
+        body, headers = self.encoder.encode(
+            payload,
+            request.headers.get('Accept'),
+            request.headers.get('Accept-Encoding')
+        )
+        span.tag("bytes", len(body))
+        span.finish()
+        if extra_headers:
+            headers.update(extra_headers)
+        return Response(body, status=status, headers=headers)
+
+    @classmethod
+    def _execute(cls, command, params, token, root_span, queued_span):
+        """Run a validated command (on a dispatch worker) under the request's token and trace"""
+        queued_span.finish()
+        if token.cancelled:
+            # The client stopped waiting while the command was queued
+            return {
+                "success": False,
+                "error": "Request deadline exceeded before the command started",
+                "cancelled": True
+            }
+
+        from .utils.profiler import command_profiler
+
+        with cancellation.activate(token), tracing.activate(root_span), \
+                tracing.tracer.span("handler", command=command) as span:
+            result = command_profiler.run(command, lambda: cls._run_handler(command, params))
+            span.tag("success", bool(result.get('success')))
+        return result
+
+    @staticmethod
+    def _run_handler(command, params):
+        from .utils.request_coalescer import coalescer
+        from .utils.response_cache import response_cache
+
+        handler = COMMAND_REGISTRY.get(command)
+        if COMMAND_REGISTRY.is_read_only(command):
+            # Identical concurrent reads share one execution
+            def execute(p):
+                return coalescer.run(command, p, handler)
+            if COMMAND_REGISTRY.is_cacheable(command):
+                return response_cache.run(command, params, execute)
+            return execute(params)
+
+        try:
+            return handler(params)
+        finally:
+            # Anything may have changed - cached introspection results are stale
+            response_cache.command_executed()
+
     def _register_routes(self):
         """Register command router - ONLY route"""
 
+        @self.app.before_request
+        def start_trace():
+            # Continue the caller's trace (W3C traceparent) or start a new one
+            trace_id, parent_id = tracing.parse_traceparent(request.headers.get('traceparent'))
+            g.trace_span = tracing.tracer.start_span(
+                "api.request", trace_id=trace_id, parent_id=parent_id, kind="SERVER"
+            )
+
         @self.app.route('/api/command', methods=['POST'])
         def execute_command():
             from qgis.core import QgsMessageLog, Qgis
@@ -36,10 +103,11 @@ class APIServer:
             data = request.get_json()
             command = data.get('command')
             params = data.get('params', {})
+            g.trace_span.tag("command", command)
 
             # Special case: help doesn't need logging
             if command == 'help':
-                return jsonify(COMMAND_REGISTRY.get_help())
+                return self._respond(COMMAND_REGISTRY.get_help())
 
             # Validate command
             is_valid, error = COMMAND_REGISTRY.validate_command(command)
@@ -47,11 +115,29 @@ class APIServer:
                 msg = f"❌ Invalid command: {command}"
                 QgsMessageLog.logMessage(msg, 'QGIS AI Bridge', Qgis.Warning)
                 log_buffer.add_message(msg, 'warning', 'QGIS AI Bridge')
-                return jsonify({"success": False, "error": error}), 404
-
-            # Execute command
-            handler = COMMAND_REGISTRY.get(command)
-            result = handler(params)
+                return self._respond({"success": False, "error": error}, 404)
+
+            # Execute command on the bounded dispatch queue
+            token = cancellation.from_header(request.headers.get(cancellation.DEADLINE_HEADER))
+            root_span = g.trace_span
+            queued_span = tracing.tracer.start_span("dispatch.queue", root_span)
+            try:
+                future = self.dispatcher.submit(
+                    COMMAND_REGISTRY.get_priority(command),
+                    lambda: self._execute(command, params, token, root_span, queued_span)
+                )
+                result = future.result()
+            except (QueueFullError, QueueTimeoutError) as e:
+                queued_span.finish()
+                status = 429 if isinstance(e, QueueFullError) else 503
+                msg = f"✗ {command} rejected ({status}): {e}"
+                QgsMessageLog.logMessage(msg, 'QGIS AI Bridge', Qgis.Warning)
+                log_buffer.add_message(msg, 'warning', 'QGIS AI Bridge')
+                return self._respond(
+                    {"success": False, "error": str(e), "retry_after": e.retry_after},
+                    status,
+                    {"Retry-After": str(e.retry_after)}
+                )
 
             # Log command execution (skip logging for qgis.log and qgis.read_log to avoid issues)
             if command not in ['qgis.log', 'qgis.read_log']:
@@ -67,13 +153,25 @@ class APIServer:
                     QgsMessageLog.logMessage(msg, 'QGIS AI Bridge', Qgis.Warning)
                     log_buffer.add_message(msg, 'warning', 'QGIS AI Bridge')
 
-            return jsonify(result)
+            return self._respond(result)
 
         @self.app.after_request
         def add_headers(response):
             response.headers['Connection'] = 'close'
+            span = g.get('trace_span')
+            if span is not None:
+                span.tag("http.status_code", response.status_code)
+                response.headers['X-Trace-Id'] = span.trace_id
             return response
 
+        @self.app.teardown_request
+        def finish_trace(error=None):
+            span = g.get('trace_span')
+            if span is not None:
+                if error is not None:
+                    span.tag("error", error)
+                span.finish()
+
     def start(self):
         if self.running:
             return
@@ -84,6 +182,7 @@ class APIServer:
             self.server.serve_forever()
 
         self.running = True
+        self.dispatcher.start()
         from threading import Thread
         self.server_thread = Thread(target=run_server, daemon=True)
         self.server_thread.start()
@@ -94,6 +193,7 @@ class APIServer:
         self.running = False
         if self.server:
             self.server.shutdown()
+        self.dispatcher.stop()
 
     def is_running(self):
         return self.running
@@ -0,0 +1,81 @@
+"""Action handle commands - follow up on queued clicks and action triggers"""
+
+
+def action_status(params):
+    """
+    Get the current state of a queued interaction
+
+    Args:
+        params (dict): Command parameters
+            - action_id (int): ID returned by widget.click / qgis.execute_action
+
+    Returns:
+        dict: {"success": bool, "action_id": int, "status": str, "dialog": dict}
+    """
+    if 'action_id' not in params:
+        return {
+            "success": False,
+            "error": "Missing required parameter: action_id"
+        }
+
+    try:
+        from ..utils.action_tracker import tracker
+
+        action = tracker.get(int(params['action_id']))
+        return {
+            "success": True,
+            **action
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def action_wait(params):
+    """
+    Wait for a queued interaction to finish or to open a modal dialog
+
+    Args:
+        params (dict): Command parameters
+            - action_id (int): ID returned by widget.click / qgis.execute_action
+            - until (str, optional): 'done' (interaction returned) or 'dialog'
+              (also stop once it opened a modal dialog), defaults to 'done'
+            - timeout (float, optional): Timeout in seconds, defaults to 5
+
+    Returns:
+        dict: {"success": bool, "condition_met": bool, "status": str, "dialog": dict}
+    """
+    if 'action_id' not in params:
+        return {
+            "success": False,
+            "error": "Missing required parameter: action_id"
+        }
+
+    until = params.get('until', 'done')
+    if until not in ('done', 'dialog'):
+        return {
+            "success": False,
+            "error": f"Invalid until: {until} (expected 'done' or 'dialog')"
+        }
+
+    try:
+        from ..utils.action_tracker import tracker, TERMINAL_STATES
+
+        action = tracker.wait(int(params['action_id']), params.get('timeout', 5), until=until)
+
+        condition_met = action["status"] in TERMINAL_STATES or (
+            until == 'dialog' and action["status"] == "blocked_on_dialog"
+        )
+
+        return {
+            "success": True,
+            "condition_met": condition_met,
+            **action
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
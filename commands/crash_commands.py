@@ -1,22 +1,56 @@
 """Crash recovery commands"""
-import json
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
 from pathlib import Path
 
-# In-memory checkpoint storage (survives until QGIS restart)
-_checkpoints = {}
+from ..utils import main_thread
+from ..utils.checkpoint_store import CheckpointStore
+from ..utils.config import get_section
+
+# Persistent checkpoint storage (survives QGIS crashes and restarts)
+_store = CheckpointStore()
+
+# Single background writer: chunking, compression, disk writes and GC all
+# happen here, one checkpoint at a time, off the request and GUI threads
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint-writer")
+
+# Checkpoints captured but not yet on disk (or whose write failed)
+_pending = {}
+_pending_lock = threading.Lock()
+
+# Failed writes kept in _pending so crash.list/crash.restore can report them
+MAX_FAILED = 20
+
+# Restores share the store's restore directory: one at a time
+_restore_lock = threading.Lock()
+
+SNAPSHOT_FILE = "project.qgs"
+
+# Used when config.json has no "checkpoints" section
+RETENTION_DEFAULTS = {
+    "max_count": 50,
+    "max_age_hours": 72,
+    "max_bytes": 500 * 1024 * 1024
+}
 
 
 def crash_save(params):
     """
     Save QGIS state before risky operations
 
+    Captures the project in memory on the GUI thread and returns immediately;
+    the checkpoint is written to disk in the background. Poll crash.list with
+    the returned checkpoint_id to see when it is complete.
+
     Args:
         params (dict): Command parameters
             - operation (str): Description of risky operation about to perform
 
     Returns:
-        dict: {"success": bool, "checkpoint_id": str, "project_path": str}
+        dict: {"success": bool, "checkpoint_id": str, "project_path": str, "status": str}
     """
     if 'operation' not in params:
         return {
@@ -25,12 +59,14 @@ def crash_save(params):
         }
 
     try:
-        checkpoint_id, project_path = _save_checkpoint_internal(params['operation'])
+        checkpoint_id, project_path, capture_ms = _save_checkpoint_internal(params['operation'])
         return {
             "success": True,
             "checkpoint_id": checkpoint_id,
             "project_path": project_path,
-            "operation": params['operation']
+            "operation": params['operation'],
+            "status": "pending",
+            "capture_ms": capture_ms
         }
     except Exception as e:
         return {
@@ -46,6 +82,8 @@ def crash_restore(params):
     Args:
         params (dict): Command parameters
             - checkpoint_id (str): ID from crash.save
+            - timeout (float, optional): Seconds to wait for a pending checkpoint
+              to finish writing, defaults to 30
 
     Returns:
         dict: {"success": bool, "restored": bool, "project_path": str}
@@ -57,7 +95,10 @@ def crash_restore(params):
         }
 
     try:
-        restored, project_path = _restore_checkpoint_internal(params['checkpoint_id'])
+        restored, project_path = _restore_checkpoint_internal(
+            params['checkpoint_id'],
+            params.get('timeout', 30)
+        )
         return {
             "success": True,
             "restored": restored,
@@ -72,28 +113,60 @@ def crash_restore(params):
 
 def crash_list(params):
     """
-    List all saved checkpoints
+    List all saved checkpoints, including ones still being written
 
     Args:
-        params (dict): No parameters required
+        params (dict): Command parameters
+            - checkpoint_id (str, optional): Only report this checkpoint
 
     Returns:
         dict: {"success": bool, "checkpoints": list}
     """
     try:
+        checkpoint_id = params.get('checkpoint_id')
+
+        with _pending_lock:
+            pending = [
+                {
+                    "checkpoint_id": cid,
+                    "operation": data["operation"],
+                    "timestamp": data["timestamp"],
+                    "project_path": data["project_path"],
+                    "status": data["status"],
+                    "error": data.get("error")
+                }
+                for cid, data in _pending.items()
+            ]
+
         checkpoints = [
             {
-                "checkpoint_id": cid,
+                "checkpoint_id": data["checkpoint_id"],
                 "operation": data["operation"],
                 "timestamp": data["timestamp"],
-                "project_path": data["project_path"]
+                "project_path": data["project_path"],
+                "status": "complete",
+                "size_bytes": data["size_bytes"],
+                "stored_bytes": data["stored_bytes"],
+                "capture_ms": data.get("capture_ms"),
+                "save_ms": data["save_ms"]
             }
-            for cid, data in _checkpoints.items()
-        ]
+            for data in _store.list()
+        ] + pending
+
+        if checkpoint_id:
+            checkpoints = [c for c in checkpoints if c["checkpoint_id"] == checkpoint_id]
+            if not checkpoints:
+                return {
+                    "success": False,
+                    "error": f"Checkpoint not found: {checkpoint_id}"
+                }
+
         return {
             "success": True,
             "checkpoints": checkpoints,
-            "count": len(checkpoints)
+            "count": len(checkpoints),
+            "pending": sum(1 for c in checkpoints if c["status"] in ("pending", "writing")),
+            "disk_usage_bytes": _store.disk_usage()
         }
     except Exception as e:
         return {
@@ -104,51 +177,330 @@ def crash_list(params):
 
 def _save_checkpoint_internal(operation):
     """
-    Save current QGIS state to checkpoint
+    Capture current QGIS state and queue it for writing
+
+    Only the capture runs on the GUI thread; chunking, compression and disk
+    writes happen on the background writer.
 
     Args:
         operation (str): Description of operation
 
     Returns:
-        tuple: (checkpoint_id, project_path)
+        tuple: (checkpoint_id, project_path, capture_ms)
+    """
+    start = time.perf_counter()
+    capture = main_thread.call(_capture_checkpoint)
+    capture_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    checkpoint_id = _store.new_id()
+    with _pending_lock:
+        _pending[checkpoint_id] = {
+            "operation": operation,
+            "timestamp": datetime.now().isoformat(),
+            "project_path": capture["project_path"],
+            "status": "pending"
+        }
+        _pending[checkpoint_id]["future"] = _writer.submit(
+            _write_checkpoint, checkpoint_id, operation, capture, capture_ms
+        )
+
+    return checkpoint_id, capture["project_path"], capture_ms
+
+
+def _capture_checkpoint():
+    """
+    Capture the project and UI state into memory (GUI thread only)
+
+    QgsProject offers no Python API to serialize into an in-memory
+    QDomDocument, so the project is written as plain .qgs XML to a temp
+    directory and read straight back. No compression happens here.
+
+    Returns:
+        dict: {"project_path": str, "is_dirty": bool, "files": dict, "ui_state": dict}
     """
     from qgis.core import QgsProject
 
     project = QgsProject.instance()
     project_path = project.fileName() or "[Unsaved Project]"
 
-    # Generate checkpoint ID
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    checkpoint_id = f"checkpoint_{timestamp}"
+    with tempfile.TemporaryDirectory(prefix="qgis_ai_bridge_") as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        # Plain .qgs keeps the XML uncompressed so unchanged parts dedup
+        is_dirty = _write_project_snapshot(project, tmp_path / SNAPSHOT_FILE)
+        files = {
+            path.relative_to(tmp_path).as_posix(): path.read_bytes()
+            for path in tmp_path.rglob("*") if path.is_file()
+        }
 
-    # Store checkpoint data
-    _checkpoints[checkpoint_id] = {
-        "checkpoint_id": checkpoint_id,
-        "timestamp": timestamp,
-        "operation": operation,
+    return {
         "project_path": project_path,
-        "is_dirty": project.isDirty()
+        "is_dirty": is_dirty,
+        "files": files,
+        "ui_state": _capture_ui_state(project)
     }
 
-    return checkpoint_id, project_path
+
+def _write_checkpoint(checkpoint_id, operation, capture, capture_ms):
+    """
+    Write a captured checkpoint into the store (background writer thread)
+
+    Only chunks that changed since earlier checkpoints are written to disk.
+    Retention and chunk GC run afterwards on the same thread, so they never
+    race with a write in progress.
+
+    Args:
+        checkpoint_id (str): ID returned to the caller
+        operation (str): Description of operation
+        capture (dict): Result of _capture_checkpoint
+        capture_ms (float): Time spent capturing on the GUI thread
+    """
+    start = time.perf_counter()
+    with _pending_lock:
+        _pending[checkpoint_id]["status"] = "writing"
+        timestamp = _pending[checkpoint_id]["timestamp"]
+
+    try:
+        stored = _store.put_files(capture["files"])
+
+        # Manifest is written last - it marks the checkpoint as complete
+        _store.write_manifest(checkpoint_id, {
+            "checkpoint_id": checkpoint_id,
+            "timestamp": timestamp,
+            "created": time.time(),
+            "operation": operation,
+            "project_path": capture["project_path"],
+            "is_dirty": capture["is_dirty"],
+            "snapshot": SNAPSHOT_FILE,
+            "files": stored["files"],
+            "size_bytes": stored["size_bytes"],
+            "stored_bytes": stored["stored_bytes"],
+            "capture_ms": capture_ms,
+            "save_ms": round(capture_ms + (time.perf_counter() - start) * 1000, 1),
+            **capture["ui_state"]
+        })
+    except Exception as e:
+        with _pending_lock:
+            _pending[checkpoint_id]["status"] = "failed"
+            _pending[checkpoint_id]["error"] = str(e)
+            failed = [cid for cid, data in _pending.items() if data["status"] == "failed"]
+            for cid in failed[:-MAX_FAILED]:
+                del _pending[cid]
+        raise
+
+    with _pending_lock:
+        del _pending[checkpoint_id]
+
+    retention = get_section("checkpoints", RETENTION_DEFAULTS)
+    _store.apply_retention(
+        max_count=retention["max_count"],
+        max_age_hours=retention["max_age_hours"],
+        max_bytes=retention["max_bytes"],
+        keep=(checkpoint_id,)
+    )
 
 
-def _restore_checkpoint_internal(checkpoint_id):
+def _restore_checkpoint_internal(checkpoint_id, timeout=30):
     """
     Restore QGIS state from checkpoint
 
+    Waits for a pending checkpoint to finish writing, reassembles the
+    project snapshot from stored chunks, then reloads it and re-applies
+    window and layer tree state on the GUI thread. The project keeps its
+    original file name, so a later save goes to the user's file rather than
+    into the checkpoint store.
+
+    The snapshot is reassembled on the background writer, so retention and
+    chunk GC of a concurrent save cannot delete chunks mid-restore, and
+    restores run one at a time because each one clears the restore directory.
+
     Args:
         checkpoint_id (str): Checkpoint to restore
+        timeout (float): Seconds to wait for a pending write
+
+    Returns:
+        tuple: (restored: bool, project_path: str)
+    """
+    with _pending_lock:
+        pending = _pending.get(checkpoint_id)
+    if pending:
+        # Re-raises the writer's exception if the write failed
+        try:
+            pending["future"].result(timeout=timeout)
+        except FutureTimeoutError:
+            raise RuntimeError(
+                f"Checkpoint {checkpoint_id} is still being written (waited {timeout}s)"
+            ) from None
+
+    with _restore_lock:
+        checkpoint, restore_dir = _writer.submit(_materialize_checkpoint, checkpoint_id).result()
+        return main_thread.call(_reload_checkpoint, checkpoint, restore_dir / checkpoint["snapshot"])
+
+
+def _materialize_checkpoint(checkpoint_id):
+    """
+    Read a checkpoint's manifest and reassemble its files (background writer thread)
+
+    Returns:
+        tuple: (manifest: dict, restore_dir: Path)
+    """
+    return _store.read_manifest(checkpoint_id), _store.materialize(checkpoint_id)
+
+
+def _reload_checkpoint(checkpoint, snapshot_path):
+    """
+    Load a materialized snapshot into the live project (GUI thread only)
+
+    Args:
+        checkpoint (dict): Checkpoint manifest
+        snapshot_path (Path): Reassembled .qgs file
 
     Returns:
         tuple: (restored: bool, project_path: str)
     """
-    if checkpoint_id not in _checkpoints:
-        raise ValueError(f"Checkpoint not found: {checkpoint_id}")
+    from qgis.core import QgsProject
 
-    checkpoint = _checkpoints[checkpoint_id]
     project_path = checkpoint["project_path"]
 
-    # For now, just return checkpoint info
-    # Future: Could reload project, restore window state, etc.
+    project = QgsProject.instance()
+    if not project.read(str(snapshot_path)):
+        raise RuntimeError(f"Failed to read checkpoint snapshot: {project.error()}")
+
+    original_file = "" if project_path == "[Unsaved Project]" else project_path
+    project.setFileName(original_file)
+
+    _apply_ui_state(project, checkpoint)
+
+    # Restored content differs from whatever is on disk at the original path
+    project.setDirty(True)
+
     return True, project_path
+
+
+def _write_project_snapshot(project, snapshot_path):
+    """
+    Write the project to a snapshot file without disturbing the live project
+
+    QgsProject.write(path) re-targets the project at the new path, so the
+    original file name, dirty flag and path storage mode are put back after
+    writing. Layer paths are stored absolute so the snapshot still resolves
+    its data sources from inside the checkpoint store.
+
+    Args:
+        project (QgsProject): Project to snapshot
+        snapshot_path (Path): Target .qgs file
+
+    Returns:
+        bool: Whether the project had unsaved changes
+    """
+    original_file = project.fileName()
+    is_dirty = project.isDirty()
+
+    if hasattr(project, 'filePathStorage'):
+        from qgis.core import Qgis
+        original_storage = project.filePathStorage()
+        project.setFilePathStorage(Qgis.FilePathType.Absolute)
+    else:
+        original_storage = project.readBoolEntry("Paths", "/Absolute", False)[0]
+        project.writeEntry("Paths", "/Absolute", True)
+
+    try:
+        if not project.write(str(snapshot_path)):
+            raise RuntimeError(f"Failed to write project snapshot: {project.error()}")
+    finally:
+        if hasattr(project, 'filePathStorage'):
+            project.setFilePathStorage(original_storage)
+        else:
+            project.writeEntry("Paths", "/Absolute", original_storage)
+        project.setFileName(original_file)
+        project.setDirty(is_dirty)
+
+    return is_dirty
+
+
+def _capture_ui_state(project):
+    """
+    Capture main window and layer tree state
+
+    Args:
+        project (QgsProject): Current project
+
+    Returns:
+        dict: JSON-serializable UI state
+    """
+    from qgis.utils import iface
+
+    state = {
+        "window_geometry": None,
+        "window_state": None,
+        "active_layer": None,
+        "canvas_extent": None,
+        "layer_tree": {}
+    }
+
+    for node in project.layerTreeRoot().findLayers():
+        state["layer_tree"][node.layerId()] = {
+            "visible": node.itemVisibilityChecked(),
+            "expanded": node.isExpanded()
+        }
+
+    if iface is None:
+        return state
+
+    main_window = iface.mainWindow()
+    state["window_geometry"] = bytes(main_window.saveGeometry().toBase64()).decode('ascii')
+    state["window_state"] = bytes(main_window.saveState().toBase64()).decode('ascii')
+
+    active_layer = iface.activeLayer()
+    if active_layer is not None:
+        state["active_layer"] = active_layer.id()
+
+    extent = iface.mapCanvas().extent()
+    state["canvas_extent"] = [
+        extent.xMinimum(), extent.yMinimum(),
+        extent.xMaximum(), extent.yMaximum()
+    ]
+
+    return state
+
+
+def _apply_ui_state(project, checkpoint):
+    """
+    Re-apply main window and layer tree state captured by _capture_ui_state
+
+    Args:
+        project (QgsProject): Freshly restored project
+        checkpoint (dict): Checkpoint metadata
+    """
+    from qgis.core import QgsRectangle
+    from qgis.utils import iface
+    from PyQt5.QtCore import QByteArray
+
+    root = project.layerTreeRoot()
+    for layer_id, node_state in checkpoint.get("layer_tree", {}).items():
+        node = root.findLayer(layer_id)
+        if node:
+            node.setItemVisibilityChecked(node_state["visible"])
+            node.setExpanded(node_state["expanded"])
+
+    if iface is None:
+        return
+
+    main_window = iface.mainWindow()
+    if checkpoint.get("window_geometry"):
+        main_window.restoreGeometry(
+            QByteArray.fromBase64(checkpoint["window_geometry"].encode('ascii'))
+        )
+    if checkpoint.get("window_state"):
+        main_window.restoreState(
+            QByteArray.fromBase64(checkpoint["window_state"].encode('ascii'))
+        )
+
+    if checkpoint.get("active_layer"):
+        layer = project.mapLayer(checkpoint["active_layer"])
+        if layer is not None:
+            iface.setActiveLayer(layer)
+
+    if checkpoint.get("canvas_extent"):
+        canvas = iface.mapCanvas()
+        canvas.setExtent(QgsRectangle(*checkpoint["canvas_extent"]))
+        canvas.refresh()
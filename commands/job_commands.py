@@ -0,0 +1,186 @@
+"""Job commands - track long-running background work by job ID"""
+
+# Upper bound for a single job.wait long-poll (seconds)
+MAX_WAIT = 60
+
+
+def job_list(params):
+    """
+    List tracked background jobs
+
+    Args:
+        params (dict): Command parameters
+            - status (str, optional): Only jobs in this state
+              ('queued', 'running', 'completed', 'failed', 'cancelled')
+
+    Returns:
+        dict: {"success": bool, "jobs": list, "count": int}
+    """
+    try:
+        from ..utils.job_manager import manager
+
+        status = params.get('status')
+        jobs = [
+            job.snapshot() for job in manager.list()
+            if not status or job.status == status
+        ]
+
+        return {
+            "success": True,
+            "jobs": jobs,
+            "count": len(jobs)
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def job_status(params):
+    """
+    Get status and progress of a background job
+
+    Args:
+        params (dict): Command parameters
+            - job_id (int): Job to query
+
+    Returns:
+        dict: {"success": bool, "job_id": int, "status": str, "progress": float}
+    """
+    if 'job_id' not in params:
+        return {
+            "success": False,
+            "error": "Missing required parameter: job_id"
+        }
+
+    try:
+        from ..utils.job_manager import manager
+
+        job = manager.get(int(params['job_id']))
+        return {
+            "success": True,
+            **job.snapshot()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def job_wait(params):
+    """
+    Long-poll until a background job finishes or the timeout expires
+
+    Args:
+        params (dict): Command parameters
+            - job_id (int): Job to wait for
+            - timeout (float, optional): Seconds to wait, defaults to 30 (max 60)
+            - include_result (bool, optional): Include the result when finished, defaults to True
+
+    Returns:
+        dict: {"success": bool, "finished": bool, "status": str, "progress": float, "result": any}
+    """
+    if 'job_id' not in params:
+        return {
+            "success": False,
+            "error": "Missing required parameter: job_id"
+        }
+
+    try:
+        from ..utils.job_manager import manager
+        from ..utils import cancellation
+
+        job = manager.get(int(params['job_id']))
+        timeout = cancellation.current().clamp(min(params.get('timeout', 30), MAX_WAIT))
+
+        finished = job.wait(timeout)
+
+        return {
+            "success": True,
+            "finished": finished,
+            **job.snapshot(include_result=finished and params.get('include_result', True))
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def job_cancel(params):
+    """
+    Request cancellation of a background job
+
+    Queued jobs are cancelled immediately; running jobs stop at their next
+    cancellation check.
+
+    Args:
+        params (dict): Command parameters
+            - job_id (int): Job to cancel
+
+    Returns:
+        dict: {"success": bool, "job_id": int, "status": str}
+    """
+    if 'job_id' not in params:
+        return {
+            "success": False,
+            "error": "Missing required parameter: job_id"
+        }
+
+    try:
+        from ..utils.job_manager import manager
+
+        job = manager.cancel(int(params['job_id']))
+        return {
+            "success": True,
+            "cancel_requested": True,
+            **job.snapshot()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def job_result(params):
+    """
+    Get the result of a finished background job
+
+    Args:
+        params (dict): Command parameters
+            - job_id (int): Job to fetch
+
+    Returns:
+        dict: {"success": bool, "job_id": int, "status": str, "result": any}
+    """
+    if 'job_id' not in params:
+        return {
+            "success": False,
+            "error": "Missing required parameter: job_id"
+        }
+
+    try:
+        from ..utils.job_manager import manager
+
+        job = manager.get(int(params['job_id']))
+        if not job.is_done():
+            return {
+                "success": False,
+                "job_id": job.job_id,
+                "status": job.status,
+                "progress": round(job.progress, 1),
+                "error": f"Job {job.job_id} has not finished yet (status: {job.status})"
+            }
+
+        return {
+            "success": job.status == "completed",
+            **job.snapshot(include_result=True)
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
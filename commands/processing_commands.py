@@ -0,0 +1,166 @@
+"""
+Processing commands for QGIS AI Bridge
+
+Handles Processing algorithms: list_algorithms, get_params, run
+"""
+
+import os
+
+from ..utils.config import get_section
+
+PROCESSING_DEFAULTS = {
+    # None = one item per CPU core
+    "max_concurrency": None
+}
+
+
+def _default_concurrency() -> int:
+    configured = get_section("processing", PROCESSING_DEFAULTS).get("max_concurrency")
+    return configured or os.cpu_count() or 1
+
+
+def processing_list_algorithms(params):
+    """
+    List/search Processing algorithms from the cached catalog
+
+    Args:
+        params (dict): Command parameters
+            - search (str, optional): Words that must all appear in the id, name, group or tags
+            - provider (str, optional): Provider ID (e.g. 'native', 'gdal', 'qgis')
+            - include_params (bool, optional): Include parameter definitions, defaults to False
+            - limit (int, optional): Maximum algorithms to return, defaults to 100
+            - offset (int, optional): Skip this many matches, defaults to 0
+
+    Returns:
+        dict: {"success": bool, "algorithms": list, "count": int, "total": int}
+    """
+    try:
+        from ..utils.algorithm_catalog import catalog
+
+        matches = catalog.search(params.get('search'), params.get('provider'))
+        offset = params.get('offset', 0)
+        limit = params.get('limit', 100)
+        page = matches[offset:offset + limit]
+
+        if params.get('include_params', False):
+            algorithms = page
+        else:
+            algorithms = [
+                {
+                    "id": e["id"],
+                    "name": e["name"],
+                    "provider": e["provider"],
+                    "group": e["group"]
+                }
+                for e in page
+            ]
+
+        return {
+            "success": True,
+            "algorithms": algorithms,
+            "count": len(algorithms),
+            "total": len(matches),
+            "truncated": offset + len(page) < len(matches)
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def processing_get_params(params):
+    """
+    Describe an algorithm's parameters and outputs
+
+    Args:
+        params (dict): Command parameters
+            - algorithm_id (str): Algorithm ID (e.g. 'native:buffer')
+
+    Returns:
+        dict: {"success": bool, "algorithm": dict}
+    """
+    if 'algorithm_id' not in params:
+        return {
+            "success": False,
+            "error": "Missing required parameter: algorithm_id"
+        }
+
+    try:
+        from ..utils.algorithm_catalog import catalog
+
+        return {
+            "success": True,
+            "algorithm": catalog.get(params['algorithm_id'])
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def processing_run(params):
+    """
+    Run one algorithm, or a batch of them in parallel, as a background job
+
+    Args:
+        params (dict): Command parameters
+            - algorithm_id (str): Algorithm to run (single run)
+            - parameters (dict): Algorithm parameters (single run)
+            - batch (list, optional): Instead of the above, a list of
+              {"algorithm_id": str, "parameters": dict}
+            - max_concurrency (int, optional): Items running at once,
+              defaults to config processing.max_concurrency or the CPU count
+            - wait (float, optional): Seconds to wait for the job before
+              returning, defaults to 0 (return the job_id immediately)
+
+    Returns:
+        dict: {"success": bool, "job_id": int, "status": str, "finished": bool, "result": dict}
+    """
+    if 'batch' in params:
+        items = params['batch']
+        if not isinstance(items, list) or not items:
+            return {
+                "success": False,
+                "error": "batch must be a non-empty list of {algorithm_id, parameters}"
+            }
+    elif 'algorithm_id' in params:
+        items = [{
+            "algorithm_id": params['algorithm_id'],
+            "parameters": params.get('parameters', {})
+        }]
+    else:
+        return {
+            "success": False,
+            "error": "Missing required parameter: algorithm_id (or batch)"
+        }
+
+    try:
+        from ..utils.algorithm_catalog import catalog
+        from ..utils.processing_batch import run_batch
+        from ..utils import cancellation
+
+        # Reject unknown algorithms before anything starts
+        for item in items:
+            if 'algorithm_id' not in item:
+                raise ValueError("Every batch item needs an algorithm_id")
+            catalog.get(item['algorithm_id'])
+
+        max_concurrency = params.get('max_concurrency') or _default_concurrency()
+        job = run_batch(items, max_concurrency)
+
+        wait = cancellation.current().clamp(params.get('wait', 0))
+        finished = job.wait(wait) if wait else job.is_done()
+
+        return {
+            "success": job.status != "failed",
+            "finished": finished,
+            "max_concurrency": max_concurrency,
+            **job.snapshot(include_result=finished)
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
@@ -214,7 +214,8 @@ def qgis_api_status(params):
         params (dict): No parameters required
 
     Returns:
-        dict: {"success": bool, "api_running": bool, "port": int, "host": str}
+        dict: {"success": bool, "api_running": bool, "port": int, "host": str,
+               "coalescing": dict (in_flight, executed, coalesced)}
     """
     try:
         from qgis.utils import plugins
@@ -231,11 +232,14 @@ def qgis_api_status(params):
 
         # Check if API server exists and is running
         if hasattr(plugin, 'api_server') and plugin.api_server:
+            from ..utils.request_coalescer import coalescer
+
             return {
                 "success": True,
                 "api_running": plugin.api_server.is_running(),
                 "port": plugin.api_server.port,
-                "host": plugin.api_server.host
+                "host": plugin.api_server.host,
+                "coalescing": coalescer.stats()
             }
         else:
             return {
@@ -467,7 +471,9 @@ def qgis_execute_action(params):
 
     Args:
         params (dict): Command parameters
-            - action_name (str): Name of the action to execute
+            - action_name (str): objectName of the action, or its menu path
+              ('Project > New', partial paths like 'Vector > Buffer' work)
+              or menu text; fuzzy matches are used when unambiguous
               Common actions:
               - 'showPythonDialog' - Open Python console
               - 'mActionNewProject' - New project
@@ -475,14 +481,21 @@ def qgis_execute_action(params):
               - 'mActionSaveProject' - Save project
               - 'mActionShowPluginManager' - Plugin manager
               - 'mActionOptions' - Settings
-            - wait (float, optional): Time to wait after execution (seconds), defaults to 0.5
+            - wait (float, optional): Max seconds to wait for the action to finish, defaults to 0.5
+
+    The trigger is queued on the GUI thread. If the action opens a modal
+    dialog the command returns as soon as the dialog is up (instead of
+    hanging until it closes) with an action_id for action.wait / action.status.
 
     Returns:
         dict: {
             "success": bool,
             "action_name": str,
             "executed": bool,
-            "found": bool
+            "found": bool,
+            "matched_by": str,
+            "action_id": int,
+            "status": str
         }
     """
     if 'action_name' not in params:
@@ -493,40 +506,40 @@ def qgis_execute_action(params):
 
     try:
         from qgis.utils import iface
-        from PyQt5.QtWidgets import QApplication
-        import time
+        from PyQt5.QtCore import QObject
+        from ..utils.action_tracker import tracker
+        from ..utils.action_index import index as action_index
 
         action_name = params['action_name']
         wait_time = params.get('wait', 0.5)
 
-        # Get the main window
-        main_window = iface.mainWindow()
-
-        # Find the action by object name
-        action = main_window.findChild(object, action_name)
+        # Look the action up in the cached index (objectName, menu path or text)
+        lookup = action_index.find(action_name)
+        action = lookup["action"]
 
         if action is None:
-            # Try finding in all actions
-            for child_action in main_window.findChildren(object):
-                if hasattr(child_action, 'objectName') and child_action.objectName() == action_name:
-                    action = child_action
-                    break
+            # Non-QAction objects exposing trigger()/activate()
+            action = iface.mainWindow().findChild(QObject, action_name)
 
         if action is None:
-            return {
+            response = {
                 "success": False,
                 "action_name": action_name,
                 "found": False,
                 "executed": False,
                 "error": f"Action '{action_name}' not found"
             }
+            if lookup["candidates"]:
+                response["candidates"] = lookup["candidates"]
+                response["error"] += " (ambiguous - see candidates)"
+            return response
 
         # Execute the action
         if hasattr(action, 'trigger'):
-            action.trigger()
+            do_trigger = action.trigger
         elif hasattr(action, 'activate'):
             from PyQt5.QtWidgets import QAction
-            action.activate(QAction.Trigger)
+            do_trigger = lambda: action.activate(QAction.Trigger)
         else:
             return {
                 "success": False,
@@ -536,19 +549,29 @@ def qgis_execute_action(params):
                 "error": "Action found but has no trigger method"
             }
 
-        # Process events to ensure action completes
-        QApplication.processEvents()
+        # Queue the trigger and wait until it finishes or opens a modal dialog
+        action_id = tracker.post(f"qgis.execute_action {action_name}", do_trigger)
+        result = tracker.wait(action_id, wait_time, until="dialog")
 
-        # Wait if specified
-        if wait_time > 0:
-            time.sleep(wait_time)
-            QApplication.processEvents()
+        if result["status"] == "error":
+            return {
+                "success": False,
+                "action_name": action_name,
+                "found": True,
+                "executed": False,
+                "action_id": action_id,
+                "error": result["error"]
+            }
 
         return {
             "success": True,
             "action_name": action_name,
             "found": True,
-            "executed": True
+            "matched_by": lookup["match"] or "object_name",
+            "executed": True,
+            "action_id": action_id,
+            "status": result["status"],
+            "dialog": result["dialog"]
         }
     except Exception as e:
         return {
@@ -556,3 +579,229 @@ def qgis_execute_action(params):
             "action_name": params.get('action_name', 'unknown'),
             "error": str(e)
         }
+
+
+def qgis_list_actions(params):
+    """
+    List QGIS actions (menu items, toolbar buttons) from the action index
+
+    Args:
+        params (dict): Command parameters
+            - search (str, optional): Words that must all appear in the name,
+              text, menu path or shortcut
+            - include_disabled (bool, optional): Include disabled actions, defaults to True
+            - limit (int, optional): Maximum actions to return, defaults to 200
+
+    Returns:
+        dict: {"success": bool, "actions": list, "count": int, "total": int}
+    """
+    try:
+        from ..utils.action_index import index as action_index
+
+        actions = action_index.list(params.get('search'))
+        if not params.get('include_disabled', True):
+            actions = [a for a in actions if a["enabled"]]
+
+        limit = params.get('limit', 200)
+        return {
+            "success": True,
+            "actions": actions[:limit],
+            "count": min(len(actions), limit),
+            "total": len(actions),
+            "truncated": len(actions) > limit
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def qgis_wait_idle(params):
+    """
+    Wait until QGIS is idle (event loop quiet, no running tasks, canvas rendered)
+
+    Use instead of fixed sleeps after actions that kick off background work.
+
+    Args:
+        params (dict): Command parameters
+            - timeout (float, optional): Max seconds to wait, defaults to 10
+            - settle_ms (float, optional): How long QGIS must stay idle, defaults to 150
+            - include_tasks (bool, optional): Wait for running QgsTasks, defaults to True
+            - include_canvas (bool, optional): Wait for canvas rendering, defaults to True
+
+    Returns:
+        dict: {"success": bool, "idle": bool, "elapsed_time": float, "state": dict}
+    """
+    try:
+        from ..utils import idle_detector
+
+        result = idle_detector.wait_for_idle(
+            timeout=params.get('timeout', 10),
+            settle_ms=params.get('settle_ms', idle_detector.DEFAULT_SETTLE_MS),
+            include_tasks=params.get('include_tasks', True),
+            include_canvas=params.get('include_canvas', True)
+        )
+
+        return {
+            "success": True,
+            **result
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def qgis_metrics(params):
+    """
+    Get server-side performance counters
+
+    Args:
+        params (dict): No parameters required
+
+    Returns:
+        dict: {"success": bool, "dispatch": dict, "response_cache": dict,
+               "coalescing": dict, "geometry_cache": dict, "spatial_index": dict}
+    """
+    try:
+        from ..utils.response_cache import response_cache
+        from ..utils.request_coalescer import coalescer
+        from ..utils.coordinate_helper import geometry_cache
+        from ..utils.spatial_index import spatial_index
+        from qgis.utils import plugins
+
+        plugin = plugins.get('qgis_ai_bridge')
+        api_server = getattr(plugin, 'api_server', None)
+
+        return {
+            "success": True,
+            "dispatch": api_server.dispatcher.stats() if api_server else None,
+            "response_cache": response_cache.stats(),
+            "coalescing": coalescer.stats(),
+            "geometry_cache": {"passes": geometry_cache.passes},
+            "spatial_index": spatial_index.stats()
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def qgis_traces(params):
+    """
+    Query recorded request traces (latency breakdown per step)
+
+    Args:
+        params (dict): Command parameters
+            - trace_id (str, optional): Return all spans of this trace
+            - command (str, optional): Only traces of this command
+            - min_duration_ms (float, optional): Only traces at least this slow
+            - limit (int, optional): Maximum traces to list, defaults to 20
+
+    Returns:
+        dict: {"success": bool, "traces": list, "count": int} or, with trace_id,
+              {"success": bool, "trace_id": str, "spans": list, "breakdown_ms": dict}
+    """
+    try:
+        from ..utils.tracing import tracer, breakdown
+
+        trace_id = params.get('trace_id')
+        if trace_id:
+            spans = tracer.spans(trace_id.lower())
+            if not spans:
+                return {"success": False, "error": f"Unknown trace: {trace_id}"}
+            return {
+                "success": True,
+                "trace_id": trace_id,
+                "spans": spans,
+                "breakdown_ms": breakdown(spans)
+            }
+
+        traces = tracer.traces(
+            limit=int(params.get('limit', 20)),
+            command=params.get('command'),
+            min_duration_ms=float(params.get('min_duration_ms', 0))
+        )
+        return {
+            "success": True,
+            "traces": traces,
+            "count": len(traces),
+            "enabled": tracer.enabled
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def qgis_profile(params):
+    """
+    Profile the QGIS main thread or the next API commands in place
+
+    Args:
+        params (dict): Command parameters
+            - mode (str, optional): 'sample' (default) - sample the GUI thread's stack,
+              'commands' - run the next count commands under cProfile,
+              'result' - get the command profile, 'cancel' - stop command profiling
+            - duration (float, optional): sample: seconds to sample, defaults to 5 (max 300)
+            - interval_ms (float, optional): sample: milliseconds between samples, defaults to 5
+            - background (bool, optional): sample: run as a job and return its job_id
+            - count (int): commands: number of commands to profile
+            - command (str, optional): commands: only profile this command
+            - sort (str, optional): result: pstats sort key, defaults to 'cumulative'
+            - top (int, optional): Rows of hot functions / pstats lines, defaults to 30
+
+    Returns:
+        dict: sample: {"success": bool, "samples": int, "idle_samples": int,
+                       "collapsed": str, "hot_functions": list} (or "job_id" with background)
+              commands: {"success": bool, "armed": int}
+              result: {"success": bool, "remaining": int, "finished": bool, "commands": list, "pstats": str}
+    """
+    try:
+        from ..utils import profiler, cancellation
+
+        mode = params.get('mode', 'sample')
+        top = int(params.get('top', 30))
+
+        if mode == 'commands':
+            if 'count' not in params:
+                return {"success": False, "error": "Missing required parameter: count"}
+            count = int(params['count'])
+            if count < 1:
+                return {"success": False, "error": "count must be at least 1"}
+            profiler.command_profiler.arm(count, params.get('command'))
+            return {"success": True, "armed": count, "command": params.get('command')}
+
+        if mode == 'result':
+            return {"success": True, **profiler.command_profiler.status(params.get('sort', 'cumulative'), top)}
+
+        if mode == 'cancel':
+            profiler.command_profiler.cancel()
+            return {"success": True, **profiler.command_profiler.status(params.get('sort', 'cumulative'), top)}
+
+        if mode != 'sample':
+            return {"success": False, "error": f"Invalid mode: {mode} (use 'sample', 'commands', 'result' or 'cancel')"}
+
+        duration = min(float(params.get('duration', 5)), profiler.MAX_SAMPLE_DURATION)
+        interval = max(float(params.get('interval_ms', 5)), 1) / 1000
+
+        if params.get('background', False):
+            from ..utils.job_manager import manager
+
+            def run(job):
+                result = profiler.sample_main_thread(
+                    duration, interval, should_stop=job.is_cancelled, on_progress=job.set_progress
+                )
+                return profiler.summarize_samples(result, top)
+
+            job = manager.submit(f"Profile main thread for {duration}s", run)
+            return {"success": True, "job_id": job.job_id, "status": job.status}
+
+        # Leave a second of the client's deadline for sending the result
+        token = cancellation.current()
+        remaining = token.remaining()
+        if remaining is not None:
+            duration = min(duration, max(0.0, remaining - 1))
+
+        result = profiler.sample_main_thread(duration, interval, should_stop=lambda: token.cancelled)
+        return {"success": True, **profiler.summarize_samples(result, top)}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
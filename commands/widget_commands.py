@@ -1,46 +1,89 @@
 """Widget control commands - Programmatic UI interaction via PyQt5"""
 
 
+def _widget_from_handle(params):
+    """
+    Resolve params['handle'] to a widget
+
+    Returns:
+        tuple: (widget, None) on success, (None, error_response) for a stale
+        or unknown handle, (None, None) when no handle was given
+    """
+    if params.get('handle') is None:
+        return None, None
+
+    from ..utils.widget_handles import handles, StaleHandleError
+
+    try:
+        return handles.resolve(params['handle']), None
+    except (StaleHandleError, TypeError, ValueError) as e:
+        return None, {
+            "success": False,
+            "stale_handle": isinstance(e, StaleHandleError),
+            "handle": params['handle'],
+            "error": str(e)
+        }
+
+
 def widget_list_windows(params):
     """
     List all top-level windows/dialogs
 
+    Served from the window registry (topmost first) while the event hub is
+    installed; otherwise the top-level widgets are scanned.
+
     Args:
         params (dict): Command parameters
             - visible_only (bool, optional): Only return visible windows, defaults to True
+            - since (int, optional): Also return lifecycle changes after this token
 
     Returns:
-        dict: {"success": bool, "windows": list, "count": int}
+        dict: {"success": bool, "windows": list, "count": int, "token": int,
+               "changes": list (with since)}
     """
     try:
         from PyQt5.QtWidgets import QApplication
+        from ..utils.window_registry import registry, describe
 
         visible_only = params.get('visible_only', True)
+        since = params.get('since')
+
+        if registry.running and visible_only:
+            # Read the token first so changes racing with this call are reported next time
+            token = registry.token
+            windows = registry.windows()
+            result = {
+                "success": True,
+                "windows": windows,
+                "count": len(windows),
+                "token": token,
+                "source": "registry"
+            }
+            if since is not None:
+                changes, complete = registry.changes(int(since))
+                result["changes"] = [c for c in changes if c["token"] <= token]
+                result["complete"] = complete
+            return result
+
+        if since is not None:
+            return {
+                "success": False,
+                "error": "since requires the window registry (event hub not installed) and visible_only"
+            }
+
         windows = []
 
         for widget in QApplication.topLevelWidgets():
             if visible_only and not widget.isVisible():
                 continue
 
-            windows.append({
-                "class": widget.__class__.__name__,
-                "title": widget.windowTitle(),
-                "objectName": widget.objectName(),
-                "visible": widget.isVisible(),
-                "enabled": widget.isEnabled(),
-                "modal": widget.isModal() if hasattr(widget, 'isModal') else False,
-                "geometry": {
-                    "x": widget.x(),
-                    "y": widget.y(),
-                    "width": widget.width(),
-                    "height": widget.height()
-                }
-            })
+            windows.append(describe(widget))
 
         return {
             "success": True,
             "windows": windows,
-            "count": len(windows)
+            "count": len(windows),
+            "source": "scan"
         }
     except Exception as e:
         return {
@@ -59,9 +102,13 @@ def widget_find(params):
             - value (str): Value to search for
             - parent (str, optional): Parent widget objectName to search within
             - exact (bool, optional): Exact match vs contains, defaults to False
+            - fields (list, optional): Only return these fields per widget
+            - max_text_len (int, optional): Truncate text fields, defaults to 4096 (0 = no limit)
+            - max_results (int, optional): Stop after this many matches
 
     Returns:
-        dict: {"success": bool, "widgets": list, "count": int}
+        dict: {"success": bool, "widgets": list, "count": int, "truncated": bool}
+              Each widget carries a handle usable by later commands
     """
     if 'type' not in params or 'value' not in params:
         return {
@@ -71,11 +118,14 @@ def widget_find(params):
 
     try:
         from PyQt5.QtWidgets import QApplication
+        from ..utils.widget_handles import handles
+        from ..utils.widget_projection import Projection
 
         search_type = params['type']
         search_value = params['value']
         parent_name = params.get('parent')
         exact = params.get('exact', False)
+        projection = Projection.from_params(params)
 
         matches = []
 
@@ -92,7 +142,7 @@ def widget_find(params):
         else:
             root_widgets = QApplication.topLevelWidgets()
 
-        # Search recursively
+        # Search recursively; returns False once max_results is exceeded
         def search_widget(widget, depth=0):
             # Check current widget
             match = False
@@ -105,7 +155,7 @@ def widget_find(params):
             elif search_type == 'text':
                 widget_value = widget.text() if hasattr(widget, 'text') else ''
             else:
-                return
+                return False
 
             if exact:
                 match = widget_value == search_value
@@ -113,29 +163,36 @@ def widget_find(params):
                 match = search_value.lower() in widget_value.lower()
 
             if match:
-                matches.append({
-                    "class": widget.__class__.__name__,
-                    "objectName": widget.objectName(),
-                    "title": widget.windowTitle() if hasattr(widget, 'windowTitle') else '',
-                    "text": widget.text() if hasattr(widget, 'text') else '',
-                    "visible": widget.isVisible(),
-                    "enabled": widget.isEnabled(),
-                    "depth": depth
-                })
+                if projection.full(len(matches)):
+                    return False
+                matches.append(projection.collect({
+                    "class": lambda: widget.__class__.__name__,
+                    "objectName": widget.objectName,
+                    "title": lambda: widget.windowTitle() if hasattr(widget, 'windowTitle') else '',
+                    "text": lambda: widget.text() if hasattr(widget, 'text') else '',
+                    "visible": widget.isVisible,
+                    "enabled": widget.isEnabled,
+                    "depth": lambda: depth,
+                    "handle": lambda: handles.handle_for(widget)
+                }))
 
             # Search children
             if hasattr(widget, 'children'):
                 for child in widget.children():
                     if hasattr(child, 'isVisible'):  # Only QWidgets
-                        search_widget(child, depth + 1)
+                        if not search_widget(child, depth + 1):
+                            return False
+            return True
 
         for root in root_widgets:
-            search_widget(root)
+            if not search_widget(root):
+                break
 
         return {
             "success": True,
             "widgets": matches,
             "count": len(matches),
+            "truncated": projection.truncated,
             "search": {
                 "type": search_type,
                 "value": search_value,
@@ -156,29 +213,40 @@ def widget_inspect(params):
     Args:
         params (dict): Command parameters
             - objectName (str): Widget objectName to inspect
+            - handle (int, optional): Widget handle from an earlier result (instead of objectName)
             - include_children (bool, optional): Include child widgets, defaults to False
+            - fields (list, optional): Only return these properties (and child fields)
+            - max_text_len (int, optional): Truncate text properties, defaults to 4096 (0 = no limit)
+            - max_results (int, optional): Maximum number of children to return
 
     Returns:
-        dict: {"success": bool, "widget": dict, "children": list}
+        dict: {"success": bool, "widget": dict, "children": list, "truncated": bool}
     """
-    if 'objectName' not in params:
+    if 'objectName' not in params and 'handle' not in params:
         return {
             "success": False,
-            "error": "Missing required parameter: objectName"
+            "error": "Missing required parameter: objectName (or handle)"
         }
 
     try:
-        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtWidgets import QApplication, QWidget
+        from ..utils.widget_projection import Projection
+        from ..utils.widget_handles import handles
 
-        object_name = params['objectName']
         include_children = params.get('include_children', False)
+        projection = Projection.from_params(params)
 
-        # Find the widget
-        widget = None
-        for w in QApplication.allWidgets():
-            if w.objectName() == object_name:
-                widget = w
-                break
+        # Find the widget (a handle skips the name lookup)
+        widget, error = _widget_from_handle(params)
+        if error:
+            return error
+        object_name = widget.objectName() if widget else params.get('objectName')
+
+        if widget is None:
+            for w in QApplication.allWidgets():
+                if w.objectName() == object_name:
+                    widget = w
+                    break
 
         if not widget:
             return {
@@ -186,43 +254,41 @@ def widget_inspect(params):
                 "error": f"Widget not found: {object_name}"
             }
 
-        # Get properties
-        properties = {
-            "class": widget.__class__.__name__,
-            "objectName": widget.objectName(),
-            "visible": widget.isVisible(),
-            "enabled": widget.isEnabled(),
-            "geometry": {
+        # Get properties (type-specific ones only where the widget has them)
+        getters = {
+            "handle": lambda: handles.handle_for(widget),
+            "class": lambda: widget.__class__.__name__,
+            "objectName": widget.objectName,
+            "visible": widget.isVisible,
+            "enabled": widget.isEnabled,
+            "geometry": lambda: {
                 "x": widget.x(),
                 "y": widget.y(),
                 "width": widget.width(),
                 "height": widget.height()
             },
-            "size": {
+            "size": lambda: {
                 "width": widget.width(),
                 "height": widget.height(),
                 "minimumWidth": widget.minimumWidth(),
                 "minimumHeight": widget.minimumHeight()
             }
         }
-
-        # Add type-specific properties
-        if hasattr(widget, 'windowTitle'):
-            properties['title'] = widget.windowTitle()
-        if hasattr(widget, 'text'):
-            properties['text'] = widget.text()
-        if hasattr(widget, 'isChecked'):
-            properties['checked'] = widget.isChecked()
-        if hasattr(widget, 'currentText'):
-            properties['currentText'] = widget.currentText()
-        if hasattr(widget, 'placeholderText'):
-            properties['placeholderText'] = widget.placeholderText()
-        if hasattr(widget, 'toolTip'):
-            properties['toolTip'] = widget.toolTip()
+        optional_getters = {
+            "title": 'windowTitle',
+            "text": 'text',
+            "checked": 'isChecked',
+            "currentText": 'currentText',
+            "placeholderText": 'placeholderText',
+            "toolTip": 'toolTip'
+        }
+        for field, method in optional_getters.items():
+            if hasattr(widget, method):
+                getters[field] = getattr(widget, method)
 
         result = {
             "success": True,
-            "widget": properties
+            "widget": projection.collect(getters)
         }
 
         # Include children if requested
@@ -230,15 +296,19 @@ def widget_inspect(params):
             children = []
             for child in widget.children():
                 if hasattr(child, 'objectName'):
-                    children.append({
-                        "class": child.__class__.__name__,
-                        "objectName": child.objectName(),
-                        "visible": child.isVisible() if hasattr(child, 'isVisible') else False,
-                        "enabled": child.isEnabled() if hasattr(child, 'isEnabled') else False
-                    })
+                    if projection.full(len(children)):
+                        break
+                    children.append(projection.collect({
+                        "handle": lambda: handles.handle_for(child) if isinstance(child, QWidget) else None,
+                        "class": lambda: child.__class__.__name__,
+                        "objectName": child.objectName,
+                        "visible": lambda: child.isVisible() if hasattr(child, 'isVisible') else False,
+                        "enabled": lambda: child.isEnabled() if hasattr(child, 'isEnabled') else False
+                    }))
             result['children'] = children
             result['child_count'] = len(children)
 
+        result['truncated'] = projection.truncated
         return result
 
     except Exception as e:
@@ -248,30 +318,176 @@ def widget_inspect(params):
         }
 
 
+def widget_get_properties(params):
+    """
+    Read properties of many widgets in one call
+
+    Property getters come from per-class tables built once from QMetaObject,
+    so any readable Qt property can be requested by name.
+
+    Args:
+        params (dict): Command parameters
+            - objectNames (list, optional): Widgets to read by objectName
+            - handles (list, optional): Widgets to read by handle (at least one of the two)
+            - properties (list or str, optional): Qt property names (e.g. 'text',
+              'value', 'checked', 'currentText', 'geometry'), '*' for all,
+              defaults to a common set
+            - max_text_len (int, optional): Truncate text properties, defaults to 4096 (0 = no limit)
+
+    Returns:
+        dict: {"success": bool, "widgets": list, "not_found": list, "stale_handles": list,
+               "invalid_handles": list, "count": int, "truncated": bool}
+    """
+    object_names = params.get('objectNames') or []
+    handle_ids = params.get('handles') or []
+    if not isinstance(object_names, list) or not isinstance(handle_ids, list) \
+            or not (object_names or handle_ids):
+        return {
+            "success": False,
+            "error": "Missing required parameter: objectNames or handles (list)"
+        }
+
+    try:
+        from ..utils.property_reader import read_many
+        from ..utils.widget_projection import DEFAULT_MAX_TEXT_LEN
+
+        result = read_many(
+            object_names,
+            handle_ids,
+            properties=params.get('properties'),
+            max_text_len=params.get('max_text_len', DEFAULT_MAX_TEXT_LEN)
+        )
+
+        return {
+            "success": True,
+            "count": len(result["widgets"]),
+            **result
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def widget_at_point(params):
+    """
+    Find the topmost widget at a screen coordinate
+
+    Uses a per-window spatial index that is kept current from geometry
+    events, so repeated queries do not walk the widget tree.
+
+    Args:
+        params (dict): Command parameters
+            - x (int): Screen X coordinate
+            - y (int): Screen Y coordinate
+            - include_ancestors (bool, optional): Include the parent chain up to the window, defaults to True
+
+    Returns:
+        dict: {"success": bool, "found": bool, "widget": dict, "ancestors": list}
+    """
+    if 'x' not in params or 'y' not in params:
+        return {
+            "success": False,
+            "error": "Missing required parameters: x, y"
+        }
+
+    try:
+        from ..utils import main_thread
+        from ..utils.spatial_index import spatial_index
+        from ..utils.widget_handles import handles
+        from ..utils.coordinate_helper import CoordinateHelper
+
+        x, y = int(params['x']), int(params['y'])
+        include_ancestors = params.get('include_ancestors', True)
+
+        def describe(widget):
+            info = {
+                "handle": handles.handle_for(widget),
+                "objectName": widget.objectName(),
+                "class": widget.__class__.__name__
+            }
+            if hasattr(widget, 'text'):
+                try:
+                    info["text"] = widget.text()
+                except Exception:
+                    pass
+            return info
+
+        def lookup():
+            widget = spatial_index.widget_at(x, y)
+            if widget is None:
+                return None
+            result = {"widget": describe(widget)}
+            result["widget"]["screen_rect"] = CoordinateHelper.widget_to_screen(widget)
+            if include_ancestors:
+                ancestors = []
+                parent = widget.parentWidget()
+                while parent is not None:
+                    ancestors.append(describe(parent))
+                    parent = parent.parentWidget()
+                result["ancestors"] = ancestors
+            return result
+
+        result = main_thread.call(lookup)
+        if result is None:
+            return {
+                "success": True,
+                "found": False,
+                "x": x,
+                "y": y
+            }
+
+        return {
+            "success": True,
+            "found": True,
+            "x": x,
+            "y": y,
+            **result
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
 def widget_click(params):
     """
     Click a widget programmatically
 
+    The click is queued on the GUI thread. If it opens a modal dialog the
+    command returns as soon as the dialog is up (instead of hanging until it
+    closes) with an action_id for action.wait / action.status.
+
     Args:
         params (dict): Command parameters
             - objectName (str): Widget objectName to click
+            - handle (int, optional): Widget handle from an earlier result (instead of objectName)
             - button (str, optional): Mouse button - 'left', 'right', 'middle', defaults to 'left'
+            - wait (float, optional): Max seconds to wait for the click to finish, defaults to 0.5
 
     Returns:
-        dict: {"success": bool, "clicked": bool, "widget_class": str}
+        dict: {"success": bool, "clicked": bool, "widget_class": str, "action_id": int, "status": str}
     """
-    if 'objectName' not in params:
+    if 'objectName' not in params and 'handle' not in params:
         return {
             "success": False,
-            "error": "Missing required parameter: objectName"
+            "error": "Missing required parameter: objectName (or handle)"
         }
 
     try:
         from PyQt5.QtWidgets import QApplication, QPushButton, QToolButton, QAbstractButton
         from PyQt5.QtCore import Qt, QPoint
         from PyQt5.QtTest import QTest
+        from ..utils.action_tracker import tracker
 
-        object_name = params['objectName']
+        widget, error = _widget_from_handle(params)
+        if error:
+            return error
+        object_name = widget.objectName() if widget else params['objectName']
         button_name = params.get('button', 'left')
 
         # Map button names to Qt constants
@@ -282,12 +498,12 @@ def widget_click(params):
         }
         button = button_map.get(button_name, Qt.LeftButton)
 
-        # Find the widget
-        widget = None
-        for w in QApplication.allWidgets():
-            if w.objectName() == object_name:
-                widget = w
-                break
+        # Find the widget (unless a handle already resolved it)
+        if widget is None:
+            for w in QApplication.allWidgets():
+                if w.objectName() == object_name:
+                    widget = w
+                    break
 
         if not widget:
             return {
@@ -310,18 +526,32 @@ def widget_click(params):
         # Click the widget
         widget_class = widget.__class__.__name__
 
-        # For buttons, use click() method if available
-        if isinstance(widget, QAbstractButton):
-            widget.click()
-        else:
-            # For other widgets, use QTest to simulate mouse click
-            QTest.mouseClick(widget, button, Qt.NoModifier, QPoint(widget.width()//2, widget.height()//2))
+        def do_click():
+            # For buttons, use click() method if available
+            if isinstance(widget, QAbstractButton):
+                widget.click()
+            else:
+                # For other widgets, use QTest to simulate mouse click
+                QTest.mouseClick(widget, button, Qt.NoModifier, QPoint(widget.width()//2, widget.height()//2))
+
+        action_id = tracker.post(f"widget.click {object_name}", do_click)
+        action = tracker.wait(action_id, params.get('wait', 0.5), until="dialog")
+
+        if action["status"] == "error":
+            return {
+                "success": False,
+                "action_id": action_id,
+                "error": action["error"]
+            }
 
         return {
             "success": True,
             "clicked": True,
             "widget_class": widget_class,
-            "objectName": object_name
+            "objectName": object_name,
+            "action_id": action_id,
+            "status": action["status"],
+            "dialog": action["dialog"]
         }
 
     except Exception as e:
@@ -338,13 +568,16 @@ def widget_wait_for(params):
     Args:
         params (dict): Command parameters
             - objectName (str, optional): Widget objectName to wait for (if checking specific widget)
+            - handle (int, optional): Widget handle to watch (a destroyed widget counts as 'gone')
             - type (str, optional): Search type for finding widget - 'objectName', 'title', 'class'
             - value (str, optional): Search value (alternative to objectName)
             - state (str): State to wait for - 'visible', 'hidden', 'enabled', 'disabled', 'exists', 'gone'
             - timeout (int, optional): Timeout in seconds, defaults to 5
+              (shortened to the request deadline, if the client sent one)
 
     Returns:
-        dict: {"success": bool, "condition_met": bool, "elapsed_time": float}
+        dict: {"success": bool, "condition_met": bool, "elapsed_time": float,
+               "cancelled": bool (only when the request deadline cut the wait short)}
     """
     if 'state' not in params:
         return {
@@ -352,17 +585,21 @@ def widget_wait_for(params):
             "error": "Missing required parameter: state"
         }
 
-    if 'objectName' not in params and ('type' not in params or 'value' not in params):
+    if 'objectName' not in params and 'handle' not in params \
+            and ('type' not in params or 'value' not in params):
         return {
             "success": False,
-            "error": "Must provide either objectName OR (type and value)"
+            "error": "Must provide either objectName, handle OR (type and value)"
         }
 
     try:
         from PyQt5.QtWidgets import QApplication
         from PyQt5.QtCore import QTimer, QEventLoop
         import time
+        from ..utils.widget_handles import handles, StaleHandleError
+        from ..utils import cancellation
 
+        token = cancellation.current()
         state = params['state']
         timeout = params.get('timeout', 5)
         object_name = params.get('objectName')
@@ -376,7 +613,12 @@ def widget_wait_for(params):
             # Find widget
             widget = None
 
-            if object_name:
+            if params.get('handle') is not None:
+                try:
+                    widget = handles.resolve(params['handle'])
+                except StaleHandleError:
+                    widget = None
+            elif object_name:
                 for w in QApplication.allWidgets():
                     if w.objectName() == object_name:
                         widget = w
@@ -409,8 +651,8 @@ def widget_wait_for(params):
             else:
                 return False
 
-        # Poll until condition met or timeout
-        while time.time() - start_time < timeout:
+        # Poll until condition met, timeout, or the client gives up
+        while time.time() - start_time < timeout and not token.cancelled:
             if check_condition():
                 return {
                     "success": True,
@@ -424,13 +666,16 @@ def widget_wait_for(params):
             time.sleep(poll_interval)
 
         # Timeout
-        return {
+        result = {
             "success": True,
             "condition_met": False,
             "elapsed_time": time.time() - start_time,
             "state": state,
             "timeout": True
         }
+        if token.cancelled:
+            result["cancelled"] = True
+        return result
 
     except Exception as e:
         return {
@@ -443,51 +688,61 @@ def error_detect(params):
     """
     Detect error dialogs currently visible
 
+    Answered from the error monitor's history (fed by Show/Hide events) when
+    it is running; otherwise the top-level windows are scanned.
+
     Args:
-        params (dict): Command parameters (no parameters required)
+        params (dict): Command parameters
+            - since (float, optional): Also return errors shown after this
+              timestamp (epoch seconds), even if they were already closed.
+              Pass the previous response's server_time to catch everything
+              between polls.
 
     Returns:
-        dict: {"success": bool, "errors": list, "count": int}
+        dict: {"success": bool, "errors": list, "count": int, "server_time": float}
     """
     try:
-        from PyQt5.QtWidgets import QApplication, QMessageBox, QDialog
-
+        import time
+        from PyQt5.QtWidgets import QApplication
+        from ..utils.error_monitor import monitor, classify
+
+        server_time = time.time()
+        since = params.get('since')
+
+        if monitor.running:
+            errors = monitor.visible()
+            result = {
+                "success": True,
+                "errors": errors,
+                "count": len(errors),
+                "has_errors": len(errors) > 0,
+                "source": "monitor",
+                "server_time": server_time
+            }
+            if since is not None:
+                recent = monitor.since(float(since))
+                result["since"] = since
+                result["recent_errors"] = recent
+                result["recent_count"] = len(recent)
+                result["has_errors"] = bool(errors or recent)
+            return result
+
+        # Monitor not running - check all top-level widgets for error dialogs
         errors = []
-
-        # Check all top-level widgets for error dialogs
         for widget in QApplication.topLevelWidgets():
             if not widget.isVisible():
                 continue
-
-            is_error = False
-            error_info = {
-                "class": widget.__class__.__name__,
-                "objectName": widget.objectName(),
-                "title": widget.windowTitle() if hasattr(widget, 'windowTitle') else '',
-            }
-
-            # Check if it's a QMessageBox
-            if isinstance(widget, QMessageBox):
-                is_error = True
-                error_info["type"] = "QMessageBox"
-                error_info["text"] = widget.text() if hasattr(widget, 'text') else ''
-                error_info["icon"] = widget.icon() if hasattr(widget, 'icon') else None
-
-            # Check for error keywords in title
-            elif isinstance(widget, QDialog):
-                title_lower = error_info["title"].lower()
-                if any(keyword in title_lower for keyword in ['error', 'warning', 'failed', 'exception']):
-                    is_error = True
-                    error_info["type"] = "Dialog with error keyword"
-
-            if is_error:
+            error_info = classify(widget)
+            if error_info is not None:
                 errors.append(error_info)
 
         return {
             "success": True,
             "errors": errors,
             "count": len(errors),
-            "has_errors": len(errors) > 0
+            "has_errors": len(errors) > 0,
+            "source": "scan",
+            "server_time": server_time
         }
 
     except Exception as e:
@@ -518,6 +773,7 @@ def dialog_close(params):
 
     try:
         from PyQt5.QtWidgets import QApplication, QDialog
+        from ..utils.window_registry import registry
 
         object_name = params.get('objectName')
         title = params.get('title')
@@ -525,13 +781,17 @@ def dialog_close(params):
 
         # Find the dialog
         dialog = None
-        for widget in QApplication.topLevelWidgets():
-            if object_name and widget.objectName() == object_name:
-                dialog = widget
-                break
-            elif title and hasattr(widget, 'windowTitle') and title in widget.windowTitle():
-                dialog = widget
-                break
+        if registry.running:
+            dialog = registry.find(object_name, title)
+        if dialog is None:
+            # Registry not running, or the dialog is hidden
+            for widget in QApplication.topLevelWidgets():
+                if object_name and widget.objectName() == object_name:
+                    dialog = widget
+                    break
+                elif title and hasattr(widget, 'windowTitle') and title in widget.windowTitle():
+                    dialog = widget
+                    break
 
         if not dialog:
             return {
@@ -579,13 +839,116 @@ def dialog_close(params):
         }
 
 
+def dialog_add_rule(params):
+    """
+    Register an auto-response rule for dialogs shown from now on
+
+    Args:
+        params (dict): Command parameters
+            - match (dict): Any of title (substring), class (class name, subclasses
+              match too), text (regex over the dialog's text), objectName
+            - action (str): 'accept', 'reject', 'close' or 'click'
+            - button (str, required for 'click'): Button text, objectName or
+              standard button name (e.g. 'Discard')
+            - name (str, optional): Label used in the decision log
+            - once (bool, optional): Disable the rule after its first match, defaults to False
+
+    Returns:
+        dict: {"success": bool, "rule": dict, "engine_running": bool}
+    """
+    if 'action' not in params:
+        return {
+            "success": False,
+            "error": "Missing required parameter: action"
+        }
+
+    try:
+        from ..utils.dialog_rules import engine
+
+        rule = engine.add(params)
+
+        return {
+            "success": True,
+            "rule": rule.to_dict(),
+            "engine_running": engine.running
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def dialog_list_rules(params):
+    """
+    List dialog auto-response rules and their recent decisions
+
+    Args:
+        params (dict): Command parameters
+            - decisions (int, optional): Recent decisions to include, defaults to 20 (0 for none)
+
+    Returns:
+        dict: {"success": bool, "rules": list, "decisions": list, "engine_running": bool}
+    """
+    try:
+        from ..utils.dialog_rules import engine
+
+        limit = int(params.get('decisions', 20))
+
+        return {
+            "success": True,
+            "rules": [rule.to_dict() for rule in engine.rules()],
+            "decisions": engine.decisions(limit) if limit > 0 else [],
+            "engine_running": engine.running
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def dialog_remove_rule(params):
+    """
+    Remove a dialog auto-response rule
+
+    Args:
+        params (dict): Command parameters
+            - rule_id (int): Rule to remove
+
+    Returns:
+        dict: {"success": bool, "removed": dict}
+    """
+    if 'rule_id' not in params:
+        return {
+            "success": False,
+            "error": "Missing required parameter: rule_id"
+        }
+
+    try:
+        from ..utils.dialog_rules import engine
+
+        rule = engine.remove(int(params['rule_id']))
+
+        return {
+            "success": True,
+            "removed": rule.to_dict()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
 def widget_set_text(params):
     """
     Set text in a text input widget (QLineEdit, QTextEdit, QPlainTextEdit)
 
     Args:
         params (dict): Command parameters
-            - objectName (str, required): Widget to set text in
+            - objectName (str, required unless handle is given): Widget to set text in
+            - handle (int, optional): Widget handle from an earlier result
             - text (str, required): Text to set
             - clear_first (bool, optional): Clear existing text first, defaults to True
 
@@ -596,8 +959,8 @@ def widget_set_text(params):
             "text_set": str
         }
     """
-    if 'objectName' not in params:
-        return {"success": False, "error": "Missing required parameter: objectName"}
+    if 'objectName' not in params and 'handle' not in params:
+        return {"success": False, "error": "Missing required parameter: objectName (or handle)"}
     if 'text' not in params:
         return {"success": False, "error": "Missing required parameter: text"}
 
@@ -605,12 +968,16 @@ def widget_set_text(params):
         from qgis.utils import iface
         from PyQt5.QtWidgets import QApplication
 
-        object_name = params['objectName']
+        widget, error = _widget_from_handle(params)
+        if error:
+            return error
+        object_name = widget.objectName() if widget else params['objectName']
         text = params['text']
         clear_first = params.get('clear_first', True)
 
-        # Find widget
-        widget = iface.mainWindow().findChild(object, object_name)
+        # Find widget (unless a handle already resolved it)
+        if widget is None:
+            widget = iface.mainWindow().findChild(object, object_name)
         if not widget:
             return {
                 "success": False,
@@ -664,7 +1031,8 @@ def widget_select_item(params):
 
     Args:
         params (dict): Command parameters
-            - objectName (str, required): Widget to select from
+            - objectName (str, required unless handle is given): Widget to select from
+            - handle (int, optional): Widget handle from an earlier result
             - value (str or int, required): Item text or index to select
             - by_index (bool, optional): Select by index instead of text, defaults to False
 
@@ -676,8 +1044,8 @@ def widget_select_item(params):
             "current_text": str
         }
     """
-    if 'objectName' not in params:
-        return {"success": False, "error": "Missing required parameter: objectName"}
+    if 'objectName' not in params and 'handle' not in params:
+        return {"success": False, "error": "Missing required parameter: objectName (or handle)"}
     if 'value' not in params:
         return {"success": False, "error": "Missing required parameter: value"}
 
@@ -685,12 +1053,16 @@ def widget_select_item(params):
         from qgis.utils import iface
         from PyQt5.QtWidgets import QApplication
 
-        object_name = params['objectName']
+        widget, error = _widget_from_handle(params)
+        if error:
+            return error
+        object_name = widget.objectName() if widget else params['objectName']
         value = params['value']
         by_index = params.get('by_index', False)
 
-        # Find widget
-        widget = iface.mainWindow().findChild(object, object_name)
+        # Find widget (unless a handle already resolved it)
+        if widget is None:
+            widget = iface.mainWindow().findChild(object, object_name)
         if not widget:
             return {
                 "success": False,
@@ -758,6 +1130,58 @@ def widget_select_item(params):
         }
 
 
+def widget_fill_form(params):
+    """
+    Set many widgets at once (one lookup pass, one event-loop pump)
+
+    Args:
+        params (dict): Command parameters
+            - fields (dict, required): objectName -> value. Text widgets take
+              strings, combos/lists item text or {"index": n}, checkboxes
+              booleans, spin boxes/sliders numbers, QGIS file/CRS/layer
+              widgets a path, auth ID ('EPSG:4326') or layer ID/name
+            - window_title (str, optional): Only search windows whose title contains this
+            - block_signals (bool, optional): Set values silently, then emit one change
+              notification per field, defaults to False
+
+    Returns:
+        dict: {
+            "success": bool,
+            "set": dict,
+            "not_found": list,
+            "errors": dict,
+            "elapsed_ms": float
+        }
+    """
+    fields = params.get('fields')
+    if not isinstance(fields, dict) or not fields:
+        return {"success": False, "error": "Missing required parameter: fields (objectName -> value)"}
+
+    try:
+        import time
+        from ..utils.form_filler import fill_form
+
+        start = time.perf_counter()
+        result = fill_form(
+            fields,
+            window_title=params.get('window_title'),
+            block_signals=params.get('block_signals', False)
+        )
+
+        return {
+            "success": not result["not_found"] and not result["errors"],
+            "count": len(result["set"]),
+            **result,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 2)
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
 def widget_send_keys(params):
     """
     Send keyboard input to a widget or globally
@@ -765,14 +1189,26 @@ def widget_send_keys(params):
     Args:
         params (dict): Command parameters
             - objectName (str, optional): Widget to send keys to (if None, sends globally)
-            - keys (str, required): Keys to send (e.g., "Ctrl+S", "Enter", "text")
-            - delay (float, optional): Delay between key presses in seconds, defaults to 0.1
+            - handle (int, optional): Widget handle from an earlier result (instead of objectName)
+            - keys (str or list, required): A single key/chord/text (e.g., "Ctrl+S",
+              "Enter", "text"), or a macro list like
+              ["Ctrl+A", "text:C:/data/in.shp", "Tab", "Enter", "delay:0.5"]
+            - delay (float, optional): Delay between key presses in seconds, defaults to 0
+            - fast_text (bool, optional): Insert text directly into editable widgets
+              instead of one key event per character, defaults to True
+            - wait_idle (bool, optional): Wait for QGIS to go idle afterwards, defaults to False
+            - idle_timeout (float, optional): Max seconds to wait with wait_idle, defaults to 2
 
     Returns:
         dict: {
             "success": bool,
-            "keys_sent": str,
-            "target": str
+            "keys_sent": str or list,
+            "target": str,
+            "steps": int,
+            "steps_done": int,
+            "cancelled": bool (the deadline cut the macro short; success is then False),
+            "elapsed_ms": float,
+            "idle": bool (only with wait_idle)
         }
     """
     if 'keys' not in params:
@@ -780,17 +1216,19 @@ def widget_send_keys(params):
 
     try:
         from qgis.utils import iface
-        from PyQt5.QtWidgets import QApplication
-        from PyQt5.QtCore import Qt
-        from PyQt5.QtTest import QTest
-        import time
+        from ..utils import idle_detector
+        from ..utils.key_macro import run_macro
 
-        keys_str = params['keys']
+        keys = params['keys']
         object_name = params.get('objectName')
-        delay = params.get('delay', 0.1)
 
         # Find target widget
-        if object_name:
+        target_widget, error = _widget_from_handle(params)
+        if error:
+            return error
+        if target_widget is not None:
+            target = f"handle:{params['handle']}"
+        elif object_name:
             target_widget = iface.mainWindow().findChild(object, object_name)
             if not target_widget:
                 return {
@@ -799,78 +1237,39 @@ def widget_send_keys(params):
                 }
             target = f"widget:{object_name}"
         else:
-            target_widget = QApplication.focusWidget() or iface.mainWindow()
+            target_widget = None
             target = "focused widget"
 
-        # Parse key combination
-        key_map = {
-            'Enter': Qt.Key_Return,
-            'Return': Qt.Key_Return,
-            'Tab': Qt.Key_Tab,
-            'Escape': Qt.Key_Escape,
-            'Esc': Qt.Key_Escape,
-            'Space': Qt.Key_Space,
-            'Backspace': Qt.Key_Backspace,
-            'Delete': Qt.Key_Delete,
-            'Up': Qt.Key_Up,
-            'Down': Qt.Key_Down,
-            'Left': Qt.Key_Left,
-            'Right': Qt.Key_Right,
-            'Home': Qt.Key_Home,
-            'End': Qt.Key_End,
-            'PageUp': Qt.Key_PageUp,
-            'PageDown': Qt.Key_PageDown,
-        }
-
-        modifier_map = {
-            'Ctrl': Qt.ControlModifier,
-            'Shift': Qt.ShiftModifier,
-            'Alt': Qt.AltModifier,
-            'Meta': Qt.MetaModifier,
-        }
-
-        # Parse key combination (e.g., "Ctrl+S" or "Enter" or "text")
-        parts = keys_str.split('+')
-
-        if len(parts) > 1:
-            # Has modifiers
-            modifiers = Qt.NoModifier
-            for part in parts[:-1]:
-                part = part.strip()
-                if part in modifier_map:
-                    modifiers |= modifier_map[part]
-
-            key_part = parts[-1].strip()
-            if key_part in key_map:
-                key = key_map[key_part]
-            elif len(key_part) == 1:
-                key = ord(key_part.upper())
-            else:
-                return {
-                    "success": False,
-                    "error": f"Unknown key: {key_part}"
-                }
-
-            # Send key with modifiers
-            QTest.keyClick(target_widget, key, modifiers, int(delay * 1000))
-
-        elif keys_str in key_map:
-            # Single special key
-            QTest.keyClick(target_widget, key_map[keys_str], Qt.NoModifier, int(delay * 1000))
-
-        else:
-            # Plain text input
-            QTest.keyClicks(target_widget, keys_str, Qt.NoModifier, int(delay * 1000))
-
-        # Process events
-        QApplication.processEvents()
-        time.sleep(delay)
-
-        return {
-            "success": True,
-            "keys_sent": keys_str,
-            "target": target
+        # A single string keeps the old behaviour: unknown keys are typed as text
+        result = run_macro(
+            keys,
+            target=target_widget,
+            delay=params.get('delay', 0),
+            fast_text=params.get('fast_text', True),
+            text_fallback=isinstance(keys, str)
+        )
+
+        response = {
+            "success": not result["cancelled"],
+            "keys_sent": keys,
+            "target": target,
+            "steps": result["steps"],
+            "steps_done": result["steps_done"],
+            "cancelled": result["cancelled"],
+            "keystrokes": result["keystrokes"],
+            "chars_inserted": result["chars_inserted"],
+            "focus": result["focus"],
+            "elapsed_ms": result["elapsed_ms"]
         }
+        if result["cancelled"]:
+            # The deadline passed mid-macro: the remaining steps were never sent
+            response["error"] = (
+                f"Request deadline exceeded after {result['steps_done']} of {result['steps']} steps"
+            )
+        elif params.get('wait_idle', False):
+            # Wait for whatever the keys triggered to settle
+            response["idle"] = idle_detector.wait_for_idle(timeout=params.get('idle_timeout', 2))["idle"]
+        return response
 
     except Exception as e:
         return {
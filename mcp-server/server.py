@@ -2,10 +2,13 @@
 """QGIS MCP Server - Unified control for QGIS (OS-level + API)"""
 import asyncio
 import json
+import logging
+import os
 import requests
 import subprocess
 import time
 import psutil
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any, Optional
 
@@ -25,6 +28,20 @@ QGIS_EXE = QGIS_ROOT / "bin" / "qgis-ltr-bin.exe"
 # QGIS Plugin API endpoint
 QGIS_API = "http://127.0.0.1:5557/api/command"
 
+# Seconds to wait for a plugin API response. Sent along as an absolute
+# X-Request-Deadline so the plugin stops work nobody is waiting for.
+REQUEST_TIMEOUT = 10
+
+# Retries of a command rejected with 429 (server busy) before giving up
+BUSY_RETRIES = 3
+
+# Request tracing: spans (Zipkin v2 JSON, one per line) go to a rotating
+# file; the plugin continues each trace from the traceparent header
+TRACE_DIR = Path(__file__).parent / "traces"
+TRACE_MAX_BYTES = 5 * 1024 * 1024
+TRACE_BACKUP_COUNT = 3
+_span_log = None
+
 # Create MCP server
 app = Server("qgis-control")
 
@@ -37,13 +54,18 @@ def qgis_launch(params: dict) -> dict:
     """
     Launch QGIS executable (OS-level command)
 
+    Instead of a fixed sleep, polls the plugin API until it answers and then
+    waits for QGIS to go idle (qgis.wait_idle), so the call returns as soon
+    as QGIS is actually usable.
+
     Args:
         params: {
             "project_path": str (optional) - Path to .qgz/.qgs file to open
+            "startup_timeout": float (optional) - Max seconds to wait, defaults to 60
         }
 
     Returns:
-        {"success": bool, "pid": int, "message": str}
+        {"success": bool, "pid": int, "ready": bool, "message": str}
     """
     try:
         args = [str(QGIS_EXE)]
@@ -51,15 +73,46 @@ def qgis_launch(params: dict) -> dict:
         if project_path:
             args.append(project_path)
 
+        startup_timeout = params.get("startup_timeout", 60)
         process = subprocess.Popen(args)
-
-        # Wait for QGIS to start
-        time.sleep(3)
+        start = time.time()
+
+        # Wait for the plugin API to come up
+        ready = False
+        while time.time() - start < startup_timeout:
+            if process.poll() is not None:
+                return {
+                    "success": False,
+                    "pid": process.pid,
+                    "error": f"QGIS exited during startup (code {process.returncode})"
+                }
+            try:
+                response = requests.post(QGIS_API, json={"command": "qgis.status"}, timeout=2)
+                ready = response.ok
+            except requests.RequestException:
+                ready = False
+            if ready:
+                break
+            time.sleep(0.25)
+
+        # Then wait for startup work (plugin loading, project rendering) to settle
+        if ready:
+            remaining = max(1.0, startup_timeout - (time.time() - start))
+            try:
+                requests.post(
+                    QGIS_API,
+                    json={"command": "qgis.wait_idle", "params": {"timeout": remaining}},
+                    timeout=remaining + 5
+                )
+            except requests.RequestException:
+                pass
 
         return {
             "success": True,
             "pid": process.pid,
-            "message": f"QGIS launched with PID {process.pid}"
+            "ready": ready,
+            "startup_time": round(time.time() - start, 2),
+            "message": f"QGIS launched with PID {process.pid}" + ("" if ready else " (API not responding yet)")
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -157,40 +210,131 @@ async def list_tools() -> list[Tool]:
     ]
 
 
+def _span_logger() -> logging.Logger:
+    """Logger writing one span per line to a rotating file in TRACE_DIR"""
+    global _span_log
+    if _span_log is None:
+        TRACE_DIR.mkdir(exist_ok=True)
+        handler = RotatingFileHandler(
+            TRACE_DIR / "spans.jsonl",
+            maxBytes=TRACE_MAX_BYTES,
+            backupCount=TRACE_BACKUP_COUNT,
+            encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        span_log = logging.getLogger("qgis_mcp.traces")
+        span_log.setLevel(logging.INFO)
+        span_log.propagate = False
+        span_log.addHandler(handler)
+        _span_log = span_log
+    return _span_log
+
+
+def _record_span(trace_id: str, span_id: str, parent_id: Optional[str], name: str,
+                 start: float, duration: float, kind: str, tags: dict):
+    """Write a finished span in Zipkin v2 JSON"""
+    span = {
+        "traceId": trace_id,
+        "id": span_id,
+        "name": name,
+        "kind": kind,
+        "timestamp": int(start * 1_000_000),
+        "duration": max(1, int(duration * 1_000_000)),
+        "localEndpoint": {"serviceName": "qgis-mcp"},
+        "tags": {k: str(v) for k, v in tags.items()}
+    }
+    if parent_id:
+        span["parentId"] = parent_id
+    try:
+        _span_logger().info(json.dumps(span, separators=(',', ':')))
+    except OSError:
+        pass
+
+
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """Execute QGIS control command"""
+    """Execute QGIS control command (traced as one mcp.call_tool span)"""
     if name != "qgis_control":
         raise ValueError(f"Unknown tool: {name}")
 
     command = arguments.get("command")
     params = arguments.get("params", {})
 
+    trace_id = os.urandom(16).hex()
+    span_id = os.urandom(8).hex()
+    start, t0 = time.time(), time.perf_counter()
+    try:
+        return await _run_command(command, params, trace_id, span_id)
+    finally:
+        _record_span(trace_id, span_id, None, "mcp.call_tool", start,
+                     time.perf_counter() - t0, "SERVER", {"command": command})
+
+
+async def _run_command(command: str, params: dict, trace_id: str, parent_id: str) -> list[TextContent]:
     # Check if this is an OS-level command
     if command in OS_COMMANDS:
-        result = OS_COMMANDS[command](params)
+        # Blocking (qgis.launch polls for up to a minute): keep the event loop free
+        result = await asyncio.to_thread(OS_COMMANDS[command], params)
         return [TextContent(
             type="text",
-            text=json.dumps(result, indent=2)
+            text=json.dumps(result, separators=(',', ':'))
         )]
 
-    # Otherwise, forward to QGIS API
+    # Otherwise, forward to QGIS API. The plugin already returns compact
+    # JSON, so the body is passed through as-is instead of being parsed and
+    # re-serialized (requests transparently decompresses gzip/zstd). Its
+    # error statuses (404/429/503) carry JSON error payloads too; anything
+    # that is not JSON is wrapped in an error result.
     try:
-        response = requests.post(
-            QGIS_API,
-            json={"command": command, "params": params},
-            timeout=10
-        )
-        result = response.json()
+        for attempt in range(BUSY_RETRIES + 1):
+            # One client span per HTTP attempt; the plugin's spans hang below it
+            span_id = os.urandom(8).hex()
+            start, t0 = time.time(), time.perf_counter()
+            status = None
+            try:
+                response = requests.post(
+                    QGIS_API,
+                    json={"command": command, "params": params},
+                    headers={
+                        "Accept": "application/json",
+                        "X-Request-Deadline": str(time.time() + REQUEST_TIMEOUT),
+                        "traceparent": f"00-{trace_id}-{span_id}-01"
+                    },
+                    timeout=REQUEST_TIMEOUT
+                )
+                status = response.status_code
+            finally:
+                _record_span(trace_id, span_id, parent_id, "mcp.http_post", start,
+                             time.perf_counter() - t0, "CLIENT",
+                             {"command": command, "attempt": attempt, "http.status_code": status})
+            # 429: the plugin's dispatch queue is full - back off as told
+            if response.status_code != 429 or attempt == BUSY_RETRIES:
+                break
+            await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+
+        content_type = response.headers.get("Content-Type", "")
+        if content_type.split(";")[0].strip().lower() != "application/json":
+            # Not a command result (e.g. an HTML 500 page from Flask)
+            result = {
+                "success": False,
+                "error": f"QGIS API returned HTTP {response.status_code} "
+                         f"({content_type or 'no content type'}) instead of JSON",
+                "status_code": response.status_code,
+                "body": response.text[:500]
+            }
+            return [TextContent(
+                type="text",
+                text=json.dumps(result, separators=(',', ':'))
+            )]
 
         return [TextContent(
             type="text",
-            text=json.dumps(result, indent=2)
+            text=response.content.decode("utf-8")
         )]
     except Exception as e:
         return [TextContent(
             type="text",
-            text=json.dumps({"success": False, "error": str(e)}, indent=2)
+            text=json.dumps({"success": False, "error": str(e)}, separators=(',', ':'))
         )]
 
 
@@ -0,0 +1,263 @@
+"""
+Index of the main window's QActions for fast action lookup
+
+Scanning every QObject under the QGIS main window on each qgis.execute_action
+call is slow once many plugins are loaded. The index maps objectName to
+QAction (with menu path, text and shortcut) and is built once on the GUI
+thread. An event filter on the main window and its menu bar marks it stale
+when children/actions are added or removed (plugin load/unload); stale
+entries are rebuilt lazily, and a lookup miss forces one rebuild.
+"""
+
+import difflib
+import threading
+
+from PyQt5.QtCore import QObject, QEvent
+
+from . import main_thread
+
+# Minimum similarity for fuzzy text/menu path matches
+FUZZY_CUTOFF = 0.75
+
+_WATCHED_EVENTS = (
+    QEvent.ChildAdded, QEvent.ChildRemoved,
+    QEvent.ActionAdded, QEvent.ActionRemoved
+)
+
+
+def _strip_mnemonic(text: str) -> str:
+    """Remove '&' accelerator markers ('&&' is a literal ampersand)"""
+    return (text or "").replace("&&", "\0").replace("&", "").replace("\0", "&").strip()
+
+
+def normalize(text: str) -> str:
+    """Lowercase menu text without mnemonics, ellipses or extra spaces"""
+    text = _strip_mnemonic(text)
+    text = text.replace("…", "").replace("...", "")
+    return " ".join(text.lower().split())
+
+
+def _normalize_path(path: str) -> str:
+    parts = [normalize(p) for p in path.replace("/", ">").split(">")]
+    return " > ".join(p for p in parts if p)
+
+
+def _is_alive(obj) -> bool:
+    from qgis.PyQt import sip
+    return obj is not None and not sip.isdeleted(obj)
+
+
+class _ChangeWatcher(QObject):
+    """Event filter that marks the index stale on structural changes"""
+
+    def __init__(self, index):
+        super().__init__()
+        self._index = index
+
+    def eventFilter(self, obj, event):
+        if event.type() in _WATCHED_EVENTS:
+            self._index.mark_stale()
+        return False
+
+
+class ActionIndex:
+    """objectName / menu path / text -> QAction lookup"""
+
+    def __init__(self):
+        self._by_name = {}
+        self._by_path = {}
+        self._by_text = {}
+        self._entries = []
+        self._stale = True
+        self._lock = threading.Lock()
+        self._watcher = None
+        self._watched = []
+        self.builds = 0
+
+    def mark_stale(self):
+        self._stale = True
+
+    def _install_watcher(self, main_window):
+        """Watch the main window and menu bar (GUI thread)"""
+        if self._watcher is not None:
+            return
+        self._watcher = _ChangeWatcher(self)
+        self._watched = [main_window, main_window.menuBar()]
+        for obj in self._watched:
+            obj.installEventFilter(self._watcher)
+
+    def shutdown(self):
+        """Remove the event filter (call on plugin unload, GUI thread)"""
+        if self._watcher is None:
+            return
+        for obj in self._watched:
+            if _is_alive(obj):
+                obj.removeEventFilter(self._watcher)
+        self._watched = []
+        self._watcher = None
+        self._stale = True
+
+    def _build(self):
+        """Collect actions and their menu paths (GUI thread)"""
+        from PyQt5.QtWidgets import QAction
+        from qgis.PyQt import sip
+        from qgis.utils import iface
+
+        main_window = iface.mainWindow()
+        self._install_watcher(main_window)
+        # Reset before scanning so changes made during the scan mark it stale again
+        self._stale = False
+
+        # Keyed by C++ pointer: menu.actions() and findChildren() return
+        # different (short-lived) wrappers for the same QAction
+        menu_paths = {}
+
+        def walk_menu(menu, prefix):
+            for action in menu.actions():
+                if action.isSeparator():
+                    continue
+                label = _strip_mnemonic(action.text())
+                path = f"{prefix} > {label}" if prefix else label
+                if action.menu() is not None:
+                    walk_menu(action.menu(), path)
+                else:
+                    menu_paths.setdefault(sip.unwrapinstance(action), path)
+
+        walk_menu(main_window.menuBar(), "")
+
+        by_name, by_path, by_text, entries = {}, {}, {}, []
+        for action in main_window.findChildren(QAction):
+            if action.isSeparator() or action.menu() is not None:
+                continue
+
+            name = action.objectName()
+            entry = {
+                "action": action,
+                "name": name,
+                "text": _strip_mnemonic(action.text()),
+                "menu_path": menu_paths.get(sip.unwrapinstance(action)),
+                "shortcut": action.shortcut().toString()
+            }
+            entries.append(entry)
+
+            if name:
+                by_name.setdefault(name, entry)
+            if entry["menu_path"]:
+                by_path.setdefault(_normalize_path(entry["menu_path"]), entry)
+            if entry["text"]:
+                by_text.setdefault(normalize(entry["text"]), []).append(entry)
+
+        return by_name, by_path, by_text, entries
+
+    def rebuild(self):
+        """Rebuild the index now"""
+        by_name, by_path, by_text, entries = main_thread.call(self._build)
+        with self._lock:
+            self._by_name = by_name
+            self._by_path = by_path
+            self._by_text = by_text
+            self._entries = entries
+            self.builds += 1
+
+    def _ensure_built(self):
+        if self._stale:
+            self.rebuild()
+
+    def _lookup(self, query: str):
+        """Resolve query without rebuilding; returns (entry, match, candidates)"""
+        with self._lock:
+            entry = self._by_name.get(query)
+            if entry is not None:
+                return entry, "name", []
+
+            path = _normalize_path(query)
+            entry = self._by_path.get(path)
+            if entry is not None:
+                return entry, "menu_path", []
+
+            # Partial path such as "Vector > Buffer"
+            if " > " in path:
+                suffix = [e for p, e in self._by_path.items() if p.endswith(" > " + path)]
+                if len(suffix) == 1:
+                    return suffix[0], "menu_path", []
+                if suffix:
+                    return None, None, suffix
+
+            texts = self._by_text.get(normalize(query), [])
+            if len(texts) == 1:
+                return texts[0], "text", []
+            if texts:
+                return None, None, texts
+
+            keys = list(self._by_path) + list(self._by_text)
+            close = difflib.get_close_matches(path, keys, n=5, cutoff=FUZZY_CUTOFF)
+            candidates = []
+            for key in close:
+                candidates.extend([self._by_path[key]] if key in self._by_path else self._by_text[key])
+            if len(candidates) == 1:
+                return candidates[0], "fuzzy", []
+            return None, None, candidates
+
+    def find(self, query: str) -> dict:
+        """Find an action by objectName, menu path ("Project > New") or text.
+
+        Exact objectName hits are served straight from the index; other
+        lookups rebuild a stale index first, and a miss forces one rebuild.
+
+        Returns:
+            dict: {"action": QAction or None, "match": str, "candidates": list}
+        """
+        # A live action keeps its identity even while the index is stale
+        entry = self._by_name.get(query)
+        if entry is not None and _is_alive(entry["action"]) and entry["action"].objectName() == query:
+            return {"action": entry["action"], "match": "name", "candidates": []}
+
+        self._ensure_built()
+        entry, match, candidates = self._lookup(query)
+        if entry is None or not _is_alive(entry["action"]):
+            self.rebuild()
+            entry, match, candidates = self._lookup(query)
+
+        return {
+            "action": entry["action"] if entry is not None else None,
+            "match": match,
+            "candidates": [self.describe(e) for e in candidates]
+        }
+
+    def list(self, search: str = None) -> list:
+        """Describe indexed actions, optionally filtered by a search string"""
+        self._ensure_built()
+        with self._lock:
+            entries = list(self._entries)
+
+        words = normalize(search).split() if search else []
+        results = []
+        for entry in entries:
+            if not _is_alive(entry["action"]):
+                continue
+            if words:
+                haystack = normalize(" ".join(
+                    filter(None, [entry["name"], entry["text"], entry["menu_path"], entry["shortcut"]])
+                ))
+                if not all(w in haystack for w in words):
+                    continue
+            results.append(self.describe(entry))
+        return results
+
+    @staticmethod
+    def describe(entry: dict) -> dict:
+        """JSON-serializable view of an index entry"""
+        action = entry["action"]
+        return {
+            "name": entry["name"],
+            "text": entry["text"],
+            "menu_path": entry["menu_path"],
+            "shortcut": entry["shortcut"],
+            "enabled": action.isEnabled() if _is_alive(action) else False,
+            "checkable": action.isCheckable() if _is_alive(action) else False,
+            "checked": action.isChecked() if _is_alive(action) else False
+        }
+
+
+# Global action index instance
+index = ActionIndex()
@@ -0,0 +1,177 @@
+"""
+Action handles for UI interactions posted to the GUI thread
+
+A click or action trigger that opens a modal dialog does not return until
+the dialog closes (QDialog.exec_() runs a nested event loop). Interactions
+are therefore queued on the GUI thread and tracked by an action ID, so the
+API call can return right away and a later call can wait for completion or
+for the dialog that the interaction opened.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+
+from . import cancellation, main_thread
+
+# Finished actions kept for status queries
+MAX_ACTIONS = 200
+
+# How often a running action checks for a newly opened modal dialog
+MODAL_POLL_MS = 50
+
+TERMINAL_STATES = ("done", "error")
+
+
+class ActionTracker:
+    """Posts interactions to the GUI thread and tracks their progress"""
+
+    def __init__(self):
+        self._actions = OrderedDict()
+        self._ids = itertools.count(1)
+        self._changed = threading.Condition()
+
+    def post(self, description: str, fn) -> int:
+        """Queue an interaction on the GUI thread.
+
+        Args:
+            description: Human-readable summary (e.g. "widget.click btnOk")
+            fn: Zero-argument callable performing the interaction
+
+        Returns:
+            int: Action ID
+        """
+        with self._changed:
+            action_id = next(self._ids)
+            self._actions[action_id] = {
+                "action_id": action_id,
+                "description": description,
+                "status": "queued",
+                "posted_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "result": None,
+                "error": None,
+                "dialog": None
+            }
+            self._evict()
+
+        future = main_thread.post(self._run, action_id, fn)
+        future.add_done_callback(lambda f: self._on_not_run(action_id, f))
+        return action_id
+
+    def _on_not_run(self, action_id: int, future):
+        """Finish actions skipped because the request's deadline passed while queued"""
+        if isinstance(future.exception(), cancellation.RequestCancelled):
+            self._update(action_id, status="error", finished_at=time.time(),
+                         error="Request deadline exceeded before the action started")
+
+    def _evict(self):
+        """Drop the oldest finished actions beyond MAX_ACTIONS (lock held)"""
+        excess = len(self._actions) - MAX_ACTIONS
+        for action_id in list(self._actions):
+            if excess <= 0:
+                break
+            if self._actions[action_id]["status"] in TERMINAL_STATES:
+                del self._actions[action_id]
+                excess -= 1
+
+    def _update(self, action_id: int, **changes):
+        with self._changed:
+            action = self._actions.get(action_id)
+            if action is not None:
+                action.update(changes)
+            self._changed.notify_all()
+
+    def _run(self, action_id: int, fn):
+        """Run an interaction on the GUI thread, watching for modal dialogs"""
+        from PyQt5.QtCore import QTimer
+        from PyQt5.QtWidgets import QApplication
+
+        modal_before = QApplication.activeModalWidget()
+
+        # Fires inside a modal dialog's nested event loop while fn is blocked
+        watcher = QTimer()
+        watcher.setInterval(MODAL_POLL_MS)
+        watcher.timeout.connect(lambda: self._check_modal(action_id, modal_before))
+
+        self._update(action_id, status="running", started_at=time.time())
+        watcher.start()
+        try:
+            result = fn()
+            self._update(action_id, status="done", result=result, finished_at=time.time())
+        except Exception as e:
+            self._update(action_id, status="error", error=str(e), finished_at=time.time())
+        finally:
+            watcher.stop()
+
+    def _check_modal(self, action_id: int, modal_before):
+        from PyQt5.QtWidgets import QApplication
+
+        modal = QApplication.activeModalWidget()
+        if modal is None or modal is modal_before:
+            return
+
+        with self._changed:
+            action = self._actions.get(action_id)
+            if action is None or action["dialog"] is not None:
+                return
+
+        self._update(action_id, status="blocked_on_dialog", dialog={
+            "class": modal.__class__.__name__,
+            "objectName": modal.objectName(),
+            "title": modal.windowTitle()
+        })
+
+    def get(self, action_id: int) -> dict:
+        """Get a copy of an action's state.
+
+        Raises:
+            ValueError: If the action ID is unknown (or was evicted)
+        """
+        with self._changed:
+            action = self._actions.get(action_id)
+            if action is None:
+                raise ValueError(f"Unknown action ID: {action_id}")
+            return dict(action)
+
+    def wait(self, action_id: int, timeout: float, until: str = "done") -> dict:
+        """Wait for an action to finish (or to open a modal dialog).
+
+        Args:
+            action_id: ID returned by post()
+            timeout: Maximum seconds to wait
+            until: 'done' - wait for the interaction to return,
+                   'dialog' - also return as soon as it opens a modal dialog
+
+        Returns:
+            dict: Action state when the condition was met or the timeout expired
+        """
+        # The action itself needs the GUI thread - blocking it here would deadlock
+        if main_thread.is_main_thread():
+            return self.get(action_id)
+
+        # Stop waiting once the requesting client has given up
+        deadline = time.time() + cancellation.current().clamp(timeout)
+
+        def condition_met():
+            action = self._actions.get(action_id)
+            if action is None:
+                return True
+            if action["status"] in TERMINAL_STATES:
+                return True
+            return until == "dialog" and action["status"] == "blocked_on_dialog"
+
+        with self._changed:
+            while not condition_met():
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+
+        return self.get(action_id)
+
+
+# Global tracker instance
+tracker = ActionTracker()
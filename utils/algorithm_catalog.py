@@ -0,0 +1,168 @@
+"""
+Cached, searchable index of QGIS Processing algorithms
+
+Walking QgsApplication.processingRegistry() and describing every parameter
+is slow (hundreds of algorithms), so the catalog is built once and reused
+until a provider is added, removed or reloads its algorithms.
+"""
+
+import threading
+
+from . import main_thread
+
+# Longest help text kept per algorithm
+MAX_HELP_LEN = 1000
+
+
+def to_json_value(value):
+    """Make a parameter default/option JSON-serializable"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [to_json_value(v) for v in value]
+    return str(value)
+
+
+def _describe_parameter(param) -> dict:
+    from qgis.core import QgsProcessingParameterDefinition
+
+    info = {
+        "name": param.name(),
+        "description": param.description(),
+        "type": param.type(),
+        "optional": bool(param.flags() & QgsProcessingParameterDefinition.FlagOptional),
+        "advanced": bool(param.flags() & QgsProcessingParameterDefinition.FlagAdvanced),
+        "default": to_json_value(param.defaultValue())
+    }
+    if hasattr(param, 'options'):
+        info["options"] = to_json_value(param.options())
+    if hasattr(param, 'allowMultiple'):
+        info["multiple"] = param.allowMultiple()
+    return info
+
+
+def _describe_algorithm(alg) -> dict:
+    from qgis.core import QgsProcessingAlgorithm, QgsProcessingParameterDefinition
+
+    provider = alg.provider()
+    help_text = alg.shortHelpString() or ""
+    return {
+        "id": alg.id(),
+        "name": alg.displayName(),
+        "provider": provider.id() if provider else None,
+        "group": alg.group(),
+        "tags": list(alg.tags()),
+        "help": help_text[:MAX_HELP_LEN],
+        "no_threading": bool(alg.flags() & QgsProcessingAlgorithm.FlagNoThreading),
+        "parameters": [
+            _describe_parameter(p) for p in alg.parameterDefinitions()
+            if not p.flags() & QgsProcessingParameterDefinition.FlagHidden
+        ],
+        "outputs": [
+            {"name": o.name(), "type": o.type(), "description": o.description()}
+            for o in alg.outputDefinitions()
+        ]
+    }
+
+
+class AlgorithmCatalog:
+    """Lazily built algorithm index, invalidated on provider changes"""
+
+    def __init__(self):
+        # (entries, by_id, search_text), or None when it must be rebuilt
+        self._index = None
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._connected_providers = set()
+        self._registry_connected = False
+        self.builds = 0
+
+    def invalidate(self, *args):
+        """Drop the cached index (connected to registry/provider signals)"""
+        with self._lock:
+            self._index = None
+            self._generation += 1
+
+    def _connect(self, registry):
+        """Watch the registry and each provider for changes (GUI thread)"""
+        if not self._registry_connected:
+            registry.providerAdded.connect(self.invalidate)
+            registry.providerRemoved.connect(self.invalidate)
+            self._registry_connected = True
+
+        for provider in registry.providers():
+            if provider.id() in self._connected_providers:
+                continue
+            if hasattr(provider, 'algorithmsLoaded'):
+                provider.algorithmsLoaded.connect(self.invalidate)
+            self._connected_providers.add(provider.id())
+
+    def _build(self) -> list:
+        """Describe every registered algorithm (GUI thread)"""
+        from qgis.core import QgsApplication
+
+        registry = QgsApplication.processingRegistry()
+        self._connect(registry)
+
+        entries = []
+        for alg in registry.algorithms():
+            try:
+                entries.append(_describe_algorithm(alg))
+            except Exception:
+                continue
+        entries.sort(key=lambda e: e["id"])
+        return entries
+
+    def _get_index(self) -> tuple:
+        """Return the cached index, building it if needed"""
+        with self._lock:
+            if self._index is not None:
+                return self._index
+            generation = self._generation
+
+        entries = main_thread.call(self._build)
+        index = (
+            entries,
+            {e["id"]: e for e in entries},
+            {
+                e["id"]: " ".join([e["id"], e["name"], e["group"] or "", " ".join(e["tags"])]).lower()
+                for e in entries
+            }
+        )
+
+        with self._lock:
+            # A provider changed while building - serve this result but rebuild next time
+            if generation == self._generation:
+                self._index = index
+                self.builds += 1
+        return index
+
+    def entries(self) -> list:
+        """All algorithm descriptions"""
+        return self._get_index()[0]
+
+    def get(self, algorithm_id: str) -> dict:
+        """Get one algorithm description.
+
+        Raises:
+            ValueError: If no algorithm has that ID
+        """
+        entry = self._get_index()[1].get(algorithm_id)
+        if entry is None:
+            raise ValueError(f"Algorithm not found: {algorithm_id}")
+        return entry
+
+    def search(self, query: str = None, provider: str = None) -> list:
+        """Find algorithms whose id/name/group/tags contain every word of query"""
+        entries, _, search_text = self._get_index()
+        words = (query or "").lower().split()
+
+        return [
+            e for e in entries
+            if (not provider or e["provider"] == provider)
+            and all(w in search_text[e["id"]] for w in words)
+        ]
+
+
+# Global catalog instance
+catalog = AlgorithmCatalog()
@@ -0,0 +1,93 @@
+"""
+Per-request deadlines and cancellation tokens
+
+Clients send an absolute deadline (epoch seconds) in the X-Request-Deadline
+header. The API router wraps it in a CancellationToken and makes it the
+current token of the thread executing the command; main_thread.post()
+carries it over to the GUI thread. Work queued for a request whose deadline
+has passed is skipped, and long-running handlers (waits, key macros) poll
+the token so they stop once the client has given up.
+
+Requests without a deadline get a token that is never cancelled.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+DEADLINE_HEADER = "X-Request-Deadline"
+
+_local = threading.local()
+
+
+class RequestCancelled(Exception):
+    """The request's deadline passed (or it was cancelled) before the work ran"""
+
+
+class CancellationToken:
+    """Deadline (epoch seconds, or None for no deadline) plus an explicit cancel flag"""
+
+    def __init__(self, deadline: float = None):
+        self.deadline = deadline
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if self._cancelled.is_set():
+            return True
+        return self.deadline is not None and time.time() >= self.deadline
+
+    def remaining(self) -> float:
+        """Seconds until the deadline (None without one, 0 once cancelled)"""
+        if self._cancelled.is_set():
+            return 0.0
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.time())
+
+    def clamp(self, timeout: float) -> float:
+        """Shorten a handler's own timeout to the time the client still waits"""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise RequestCancelled("Request deadline exceeded")
+
+
+# Token used outside requests and for requests without a deadline
+NEVER = CancellationToken()
+
+
+def from_header(value) -> CancellationToken:
+    """Token for an X-Request-Deadline header value (invalid values are ignored)"""
+    try:
+        return CancellationToken(float(value)) if value else CancellationToken()
+    except (TypeError, ValueError):
+        return CancellationToken()
+
+
+def current() -> CancellationToken:
+    """Token of the request this thread is working for"""
+    return getattr(_local, 'token', NEVER)
+
+
+@contextmanager
+def activate(token: CancellationToken):
+    """Make token the current token of this thread for the duration of the block"""
+    previous = getattr(_local, 'token', None)
+    _local.token = token
+    try:
+        yield token
+    finally:
+        if previous is None:
+            del _local.token
+        else:
+            _local.token = previous
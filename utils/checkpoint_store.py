@@ -0,0 +1,315 @@
+"""
+Persistent, content-addressed storage for crash recovery checkpoints
+
+Snapshot files are split into chunks stored once under their SHA-256 hash,
+so consecutive checkpoints of a large project only write the chunks that
+changed. Each checkpoint is a small JSON manifest listing its chunks.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+# Checkpoints live inside the plugin folder, next to the workflow library
+DEFAULT_ROOT = Path(__file__).parent.parent / "checkpoints"
+
+# Text (project XML) is cut at content-defined line boundaries so an edit
+# early in the file does not shift every later chunk
+TEXT_MIN_CHUNK = 16 * 1024
+TEXT_MAX_CHUNK = 256 * 1024
+TEXT_BOUNDARY_MASK = 0x7F  # ~1 in 128 lines ends a chunk once past the minimum
+
+# Binary sidecars (auxiliary storage is SQLite) change in whole pages, so
+# fixed-size blocks dedup well
+BINARY_CHUNK = 64 * 1024
+
+TEXT_SUFFIXES = {".qgs", ".xml", ".qml", ".json"}
+
+
+def _chunk_text(data: bytes):
+    """Split text into content-defined chunks at line boundaries"""
+    start = 0
+    size = 0
+    for line in data.splitlines(keepends=True):
+        size += len(line)
+        at_boundary = (zlib.crc32(line) & TEXT_BOUNDARY_MASK) == 0
+        if (size >= TEXT_MIN_CHUNK and at_boundary) or size >= TEXT_MAX_CHUNK:
+            yield data[start:start + size]
+            start += size
+            size = 0
+    if size:
+        yield data[start:start + size]
+
+
+def _chunk_binary(data: bytes):
+    """Split binary data into fixed-size blocks"""
+    for offset in range(0, len(data), BINARY_CHUNK):
+        yield data[offset:offset + BINARY_CHUNK]
+
+
+class CheckpointStore:
+    """Content-addressed chunk store plus one manifest per checkpoint"""
+
+    def __init__(self, root: Path = None):
+        self.root = Path(root) if root else DEFAULT_ROOT
+        self.chunk_dir = self.root / "chunks"
+        self.manifest_dir = self.root / "manifests"
+        self.restore_dir = self.root / "restore"
+
+    @staticmethod
+    def new_id() -> str:
+        """Generate a unique checkpoint ID.
+
+        Microsecond timestamp keeps IDs sortable; the random suffix keeps
+        two saves in the same instant from colliding.
+
+        Returns:
+            str like "checkpoint_20260129_143022_123456_a1b2c3"
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        return f"checkpoint_{timestamp}_{uuid.uuid4().hex[:6]}"
+
+    def _manifest_path(self, checkpoint_id: str) -> Path:
+        """Get the manifest path for a checkpoint (rejects path-like IDs)"""
+        if not checkpoint_id or Path(checkpoint_id).name != checkpoint_id:
+            raise ValueError(f"Invalid checkpoint ID: {checkpoint_id}")
+        return self.manifest_dir / f"{checkpoint_id}.json"
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.chunk_dir / digest[:2] / digest
+
+    def _put_chunk(self, chunk: bytes) -> tuple:
+        """Store a chunk unless it already exists.
+
+        Returns:
+            tuple: (digest, bytes written to disk - 0 if deduplicated)
+        """
+        digest = hashlib.sha256(chunk).hexdigest()
+        path = self._chunk_path(digest)
+        if path.exists():
+            return digest, 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = zlib.compress(chunk, 6)
+        tmp_path = path.with_name(f"{digest}.{uuid.uuid4().hex[:6]}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(tmp_path, path)
+        return digest, len(compressed)
+
+    def put_files(self, files: dict) -> dict:
+        """Chunk captured snapshot files into the store.
+
+        Args:
+            files: Mapping of relative file name -> file contents (bytes)
+
+        Returns:
+            dict: {"files": list, "size_bytes": int, "stored_bytes": int}
+        """
+        entries = []
+        size_bytes = 0
+        stored_bytes = 0
+
+        for name in sorted(files):
+            data = files[name]
+            chunker = _chunk_text if Path(name).suffix.lower() in TEXT_SUFFIXES else _chunk_binary
+
+            digests = []
+            for chunk in chunker(data):
+                digest, written = self._put_chunk(chunk)
+                digests.append(digest)
+                stored_bytes += written
+
+            entries.append({
+                "name": name,
+                "size": len(data),
+                "chunks": digests
+            })
+            size_bytes += len(data)
+
+        return {"files": entries, "size_bytes": size_bytes, "stored_bytes": stored_bytes}
+
+    def write_manifest(self, checkpoint_id: str, manifest: dict):
+        """Write a checkpoint manifest atomically.
+
+        The manifest is written after all of its chunks, so a checkpoint
+        interrupted by a crash mid-save is never listed.
+        """
+        path = self._manifest_path(checkpoint_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def read_manifest(self, checkpoint_id: str) -> dict:
+        """Read a checkpoint manifest.
+
+        Raises:
+            ValueError: If the checkpoint does not exist
+        """
+        path = self._manifest_path(checkpoint_id)
+        if not path.exists():
+            raise ValueError(f"Checkpoint not found: {checkpoint_id}")
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def list(self) -> list:
+        """List manifests of all checkpoints, oldest first"""
+        if not self.manifest_dir.exists():
+            return []
+
+        manifests = []
+        for path in self.manifest_dir.glob("*.json"):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    manifests.append(json.load(f))
+            except (OSError, ValueError):
+                # Skip unreadable/corrupt manifests rather than failing the listing
+                continue
+
+        manifests.sort(key=lambda manifest: manifest.get("checkpoint_id", ""))
+        return manifests
+
+    def materialize(self, checkpoint_id: str) -> Path:
+        """Reassemble a checkpoint's files into a fresh restore directory.
+
+        Previous restore directories are removed first; the newest one is
+        kept because QGIS holds its auxiliary storage open.
+
+        Returns:
+            Path: Directory containing the reassembled files
+        """
+        manifest = self.read_manifest(checkpoint_id)
+
+        shutil.rmtree(self.restore_dir, ignore_errors=True)
+        target_dir = self.restore_dir / checkpoint_id
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        for file_entry in manifest["files"]:
+            target = target_dir / file_entry["name"]
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(target, 'wb') as f:
+                for digest in file_entry["chunks"]:
+                    path = self._chunk_path(digest)
+                    if not path.exists():
+                        raise ValueError(f"Checkpoint {checkpoint_id} is missing chunk {digest}")
+                    f.write(zlib.decompress(path.read_bytes()))
+
+        return target_dir
+
+    def delete(self, checkpoint_id: str):
+        """Delete a checkpoint manifest (chunks are reclaimed by gc())"""
+        path = self._manifest_path(checkpoint_id)
+        if path.exists():
+            path.unlink()
+
+    def disk_usage(self) -> int:
+        """Total bytes used by stored chunks"""
+        if not self.chunk_dir.exists():
+            return 0
+        return sum(p.stat().st_size for p in self.chunk_dir.rglob("*") if p.is_file())
+
+    def gc(self) -> dict:
+        """Delete chunks no longer referenced by any manifest.
+
+        Returns:
+            dict: {"chunks_removed": int, "bytes_freed": int}
+        """
+        referenced = set()
+        for manifest in self.list():
+            for file_entry in manifest.get("files", []):
+                referenced.update(file_entry["chunks"])
+
+        removed = 0
+        freed = 0
+        if self.chunk_dir.exists():
+            for path in self.chunk_dir.rglob("*"):
+                if not path.is_file():
+                    continue
+                # Stale *.tmp files are leftovers from a crash mid-write
+                if path.name not in referenced:
+                    freed += path.stat().st_size
+                    path.unlink()
+                    removed += 1
+
+        return {"chunks_removed": removed, "bytes_freed": freed}
+
+    def apply_retention(self, max_count: int = None, max_age_hours: float = None,
+                        max_bytes: int = None, keep: tuple = ()) -> list:
+        """Delete old checkpoints until the retention policy is satisfied.
+
+        Oldest checkpoints go first. IDs in `keep` are never deleted, and the
+        newest checkpoint always survives the size limit.
+
+        Args:
+            max_count: Maximum number of checkpoints to keep
+            max_age_hours: Delete checkpoints older than this
+            max_bytes: Upper bound on total chunk storage
+            keep: Checkpoint IDs that must not be deleted
+
+        Returns:
+            list: Deleted checkpoint IDs
+        """
+        deleted = []
+        manifests = self.list()
+
+        def drop(manifest):
+            self.delete(manifest["checkpoint_id"])
+            deleted.append(manifest["checkpoint_id"])
+
+        if max_age_hours:
+            cutoff = time.time() - max_age_hours * 3600
+            for manifest in list(manifests):
+                if manifest["checkpoint_id"] in keep:
+                    continue
+                if manifest.get("created", time.time()) < cutoff:
+                    drop(manifest)
+                    manifests.remove(manifest)
+
+        if max_count:
+            removable = [m for m in manifests if m["checkpoint_id"] not in keep]
+            while len(manifests) > max_count and removable:
+                oldest = removable.pop(0)
+                drop(oldest)
+                manifests.remove(oldest)
+
+        if max_bytes:
+            # Storage after GC is the size of the chunks still referenced, so
+            # drops are accounted in memory and GC runs once at the end
+            refs = {}
+            for manifest in manifests:
+                for digest in self._chunks_of(manifest):
+                    refs[digest] = refs.get(digest, 0) + 1
+            sizes = {digest: self._chunk_size(digest) for digest in refs}
+            usage = sum(sizes.values())
+
+            removable = [m for m in manifests[:-1] if m["checkpoint_id"] not in keep]
+            while removable and usage > max_bytes:
+                manifest = removable.pop(0)
+                drop(manifest)
+                for digest in self._chunks_of(manifest):
+                    refs[digest] -= 1
+                    if refs[digest] == 0:
+                        usage -= sizes[digest]
+
+        if deleted:
+            self.gc()
+
+        return deleted
+
+    @staticmethod
+    def _chunks_of(manifest: dict) -> set:
+        return {digest for file_entry in manifest.get("files", []) for digest in file_entry["chunks"]}
+
+    def _chunk_size(self, digest: str) -> int:
+        try:
+            return self._chunk_path(digest).stat().st_size
+        except OSError:
+            return 0
@@ -0,0 +1,32 @@
+"""
+Plugin configuration access for command handlers
+"""
+
+import json
+from pathlib import Path
+
+CONFIG_PATH = Path(__file__).parent.parent / "config.json"
+
+
+def load_config() -> dict:
+    """Load config.json (returns an empty dict if it is missing or invalid)"""
+    try:
+        with open(CONFIG_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def get_section(name: str, defaults: dict = None) -> dict:
+    """Get one config section merged over defaults.
+
+    Args:
+        name: Top-level section name (e.g. "checkpoints")
+        defaults: Values used for keys missing from config.json
+
+    Returns:
+        dict with the section's settings
+    """
+    section = dict(defaults or {})
+    section.update(load_config().get(name) or {})
+    return section
@@ -2,9 +2,118 @@
 Coordinate conversion utilities for widget positioning
 """
 
-from PyQt5.QtCore import QPoint
+import threading
+
+from PyQt5.QtCore import QPoint, QEvent
 from PyQt5.QtWidgets import QWidget
 
+# Events after which a window's cached screen geometry is no longer valid
+GEOMETRY_EVENTS = (
+    QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide,
+    QEvent.ChildAdded, QEvent.ChildRemoved, QEvent.ParentChange
+)
+
+
+class GeometryCache:
+    """Screen rects for every widget of a window, computed in one pass.
+
+    A window's rects are computed by one traversal that adds each child's
+    pos() to its parent's screen origin (one mapToGlobal call per window
+    instead of one per widget). They stay cached until the shared event hub
+    reports a geometry change anywhere in that window. Without the hub
+    installed nothing is cached.
+    """
+
+    def __init__(self):
+        # window -> {widget: (x, y, width, height)}
+        self._windows = {}
+        self._lock = threading.Lock()
+        self._subscribed = False
+        # Bumped on every invalidation so a pass racing with a change is not cached
+        self._changes = 0
+        self.passes = 0
+
+    def _subscribe(self):
+        from . import ui_events
+
+        if not ui_events.is_installed():
+            return False
+        if not self._subscribed:
+            ui_events.get_hub().subscribe(GEOMETRY_EVENTS, self._on_event)
+            self._subscribed = True
+        return True
+
+    def _on_event(self, obj, event):
+        if not self._windows or not obj.isWidgetType():
+            return
+        window = obj.window()
+        with self._lock:
+            self._changes += 1
+            self._windows.pop(window, None)
+            # A moved/shown child window also changes what its parent covers
+            if window is obj and obj.parentWidget() is not None:
+                self._windows.pop(obj.parentWidget().window(), None)
+
+    def invalidate(self, window: QWidget = None):
+        """Drop cached rects for one window (or all)"""
+        with self._lock:
+            self._changes += 1
+            if window is None:
+                self._windows.clear()
+            else:
+                self._windows.pop(window, None)
+
+    @staticmethod
+    def compute(window: QWidget) -> dict:
+        """Compute screen rects of window and all its non-window descendants"""
+        origin = window.mapToGlobal(QPoint(0, 0))
+        rects = {window: (origin.x(), origin.y(), window.width(), window.height())}
+
+        stack = [(window, origin.x(), origin.y())]
+        while stack:
+            parent, px, py = stack.pop()
+            for child in parent.children():
+                if not child.isWidgetType() or child.isWindow():
+                    continue
+                pos = child.pos()
+                x, y = px + pos.x(), py + pos.y()
+                rects[child] = (x, y, child.width(), child.height())
+                stack.append((child, x, y))
+        return rects
+
+    def window_rects(self, window: QWidget) -> dict:
+        """Screen rects for all widgets in window (cached while the hub is installed)"""
+        cacheable = self._subscribe()
+        if cacheable:
+            with self._lock:
+                rects = self._windows.get(window)
+                changes = self._changes
+            if rects is not None:
+                return rects
+
+        rects = self.compute(window)
+        self.passes += 1
+        if cacheable:
+            with self._lock:
+                if changes == self._changes:
+                    self._windows[window] = rects
+        return rects
+
+    def rect(self, widget: QWidget) -> tuple:
+        """Screen rect (x, y, width, height) of one widget"""
+        rects = self.window_rects(widget.window())
+        rect = rects.get(widget)
+        if rect is None:
+            # Created after the pass but before its events reached the hub
+            self.invalidate(widget.window())
+            origin = widget.mapToGlobal(QPoint(0, 0))
+            rect = (origin.x(), origin.y(), widget.width(), widget.height())
+        return rect
+
+
+# Shared cache instance
+geometry_cache = GeometryCache()
+
 
 class CoordinateHelper:
     """Helper for converting between widget and screen coordinates"""
@@ -13,6 +122,9 @@ class CoordinateHelper:
     def widget_to_screen(widget: QWidget) -> dict:
         """Convert widget position to screen coordinates.
 
+        Uses the window's cached subtree geometry, so converting many widgets
+        of one window costs a single traversal.
+
         Args:
             widget: QWidget instance
 
@@ -22,21 +134,29 @@ class CoordinateHelper:
         if not widget:
             return None
 
-        # Get widget geometry
-        rect = widget.geometry()
-
-        # Convert to global/screen coordinates
-        global_pos = widget.mapToGlobal(QPoint(0, 0))
+        x, y, width, height = geometry_cache.rect(widget)
 
         return {
-            "screen_x": global_pos.x(),
-            "screen_y": global_pos.y(),
-            "width": rect.width(),
-            "height": rect.height(),
-            "center_x": global_pos.x() + rect.width() // 2,
-            "center_y": global_pos.y() + rect.height() // 2
+            "screen_x": x,
+            "screen_y": y,
+            "width": width,
+            "height": height,
+            "center_x": x + width // 2,
+            "center_y": y + height // 2
         }
 
+    @staticmethod
+    def subtree_to_screen(root: QWidget) -> dict:
+        """Screen rects of root's window and all its widgets in one pass.
+
+        Args:
+            root: Any widget of the window
+
+        Returns:
+            dict of widget -> (x, y, width, height)
+        """
+        return geometry_cache.window_rects(root.window())
+
     @staticmethod
     def get_widget_center(widget: QWidget) -> tuple:
         """Get the center point of a widget in screen coordinates.
@@ -0,0 +1,272 @@
+"""
+Auto-response rules for known dialogs
+
+Rules match windows as they are shown (via the shared event hub) on title,
+class, text regex and/or objectName, and answer them without a round trip:
+accept, reject, close, or click a named button. The response is deferred
+with a zero-delay timer so it runs once the dialog is up (inside exec_()'s
+nested event loop for modal dialogs), never inside the Show event itself.
+
+Rules come from the "dialog_rules" section of config.json at start and from
+the dialog.add_rule command at runtime. Every decision is kept in a bounded
+log and written to the plugin log.
+"""
+
+import itertools
+import re
+import threading
+import time
+from collections import deque
+
+from PyQt5.QtCore import QEvent, QTimer
+
+# Decisions kept in memory
+MAX_DECISIONS = 200
+
+ACTIONS = ('accept', 'reject', 'close', 'click')
+MATCH_KEYS = ('title', 'class', 'text', 'objectName')
+
+RULE_DEFAULTS = {
+    "rules": []
+}
+
+
+def _button_text(button) -> str:
+    return button.text().replace('&', '').strip().lower()
+
+
+def dialog_text(widget) -> str:
+    """Visible text of a dialog (message box text, else its labels)"""
+    from PyQt5.QtWidgets import QMessageBox, QLabel
+
+    if isinstance(widget, QMessageBox):
+        return "\n".join(t for t in (widget.text(), widget.informativeText()) if t)
+    return "\n".join(label.text() for label in widget.findChildren(QLabel) if label.text())
+
+
+def find_button(widget, name: str):
+    """Button of widget by text (ignoring '&' and case), objectName or standard button name"""
+    from PyQt5.QtWidgets import QAbstractButton, QMessageBox
+
+    wanted = name.replace('&', '').strip().lower()
+    buttons = widget.findChildren(QAbstractButton)
+
+    for button in buttons:
+        if button.isVisible() and _button_text(button) == wanted:
+            return button
+    for button in buttons:
+        if button.objectName() == name:
+            return button
+    if isinstance(widget, QMessageBox):
+        standard = getattr(QMessageBox, name, None)
+        if isinstance(standard, QMessageBox.StandardButton):
+            return widget.button(standard)
+    return None
+
+
+def _role_button(widget, roles):
+    """First message box button with one of roles"""
+    for button in widget.buttons():
+        if widget.buttonRole(button) in roles:
+            return button
+    return None
+
+
+class DialogRule:
+    """One match -> action rule"""
+
+    def __init__(self, rule_id: int, spec: dict, source: str):
+        match = spec.get('match') or {k: spec[k] for k in MATCH_KEYS if k in spec}
+        unknown = set(match) - set(MATCH_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown match keys: {sorted(unknown)} (use {list(MATCH_KEYS)})")
+        if not any(match.get(k) for k in MATCH_KEYS):
+            raise ValueError(f"Rule needs at least one of: {list(MATCH_KEYS)}")
+
+        action = spec.get('action')
+        if action not in ACTIONS:
+            raise ValueError(f"Invalid action: {action} (use {list(ACTIONS)})")
+        if action == 'click' and not spec.get('button'):
+            raise ValueError("Action 'click' needs a button (text, objectName or standard button name)")
+
+        self.id = rule_id
+        self.name = spec.get('name') or f"rule-{rule_id}"
+        self.match = {k: v for k, v in match.items() if v}
+        self.action = action
+        self.button = spec.get('button')
+        self.once = bool(spec.get('once', False))
+        self.enabled = bool(spec.get('enabled', True))
+        self.source = source
+        self.hits = 0
+        self._text_re = re.compile(self.match['text']) if 'text' in self.match else None
+
+    def matches(self, widget) -> bool:
+        match = self.match
+        if 'objectName' in match and widget.objectName() != match['objectName']:
+            return False
+        if 'class' in match and not any(c.__name__ == match['class'] for c in type(widget).__mro__):
+            return False
+        if 'title' in match and match['title'].lower() not in (widget.windowTitle() or '').lower():
+            return False
+        # Text last: collecting label text is the expensive part
+        if self._text_re is not None and not self._text_re.search(dialog_text(widget)):
+            return False
+        return True
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "match": dict(self.match),
+            "action": self.action,
+            "button": self.button,
+            "once": self.once,
+            "enabled": self.enabled,
+            "source": self.source,
+            "hits": self.hits
+        }
+
+
+class DialogRuleEngine:
+    """Matches shown windows against rules and answers them"""
+
+    def __init__(self):
+        # Replaced (never mutated) so the GUI thread can read it without the lock
+        self._rules = ()
+        self._decisions = deque(maxlen=MAX_DECISIONS)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._started = False
+
+    @property
+    def running(self) -> bool:
+        from . import ui_events
+        return self._started and ui_events.is_installed()
+
+    def start(self):
+        """Load rules from config.json and subscribe to the event hub (GUI thread)"""
+        from . import ui_events
+        from .config import get_section
+
+        if self._started:
+            return
+        for spec in get_section("dialog_rules", RULE_DEFAULTS).get("rules") or []:
+            try:
+                self.add(spec, source="config")
+            except (ValueError, re.error) as e:
+                self._log(f"Ignoring dialog rule from config.json: {e}", warning=True)
+        ui_events.get_hub().subscribe((QEvent.Show,), self._on_show)
+        self._started = True
+
+    # -- rule management (any thread) -----------------------------------
+
+    def add(self, spec: dict, source: str = "api") -> DialogRule:
+        """Register a rule; raises ValueError (or re.error) for invalid specs"""
+        with self._lock:
+            rule = DialogRule(next(self._ids), spec, source)
+            self._rules = self._rules + (rule,)
+        return rule
+
+    def remove(self, rule_id: int) -> DialogRule:
+        with self._lock:
+            for rule in self._rules:
+                if rule.id == rule_id:
+                    self._rules = tuple(r for r in self._rules if r is not rule)
+                    return rule
+        raise ValueError(f"Unknown rule: {rule_id}")
+
+    def rules(self) -> list:
+        return list(self._rules)
+
+    def decisions(self, limit: int = None) -> list:
+        with self._lock:
+            decisions = [dict(d) for d in self._decisions]
+        return decisions[-limit:] if limit else decisions
+
+    # -- matching (GUI thread) -------------------------------------------
+
+    def _on_show(self, obj, event):
+        if not self._rules or not obj.isWidgetType() or not obj.isWindow():
+            return
+        for rule in self._rules:
+            if rule.enabled and rule.matches(obj):
+                if rule.once:
+                    rule.enabled = False
+                rule.hits += 1
+                QTimer.singleShot(0, lambda widget=obj, rule=rule: self._respond(widget, rule))
+                return
+
+    def _respond(self, widget, rule: DialogRule):
+        from qgis.PyQt import sip
+
+        if sip.isdeleted(widget) or not widget.isVisible():
+            # Closed by the user (or another rule) before the timer fired
+            return
+
+        decision = {
+            "time": time.time(),
+            "rule_id": rule.id,
+            "rule": rule.name,
+            "class": widget.__class__.__name__,
+            "objectName": widget.objectName(),
+            "title": widget.windowTitle() or '',
+            "action": rule.action,
+            "button": rule.button,
+        }
+        try:
+            decision["method"] = self._apply(widget, rule)
+            decision["success"] = True
+            self._log(f"Dialog rule '{rule.name}' answered '{decision['title']}' with {decision['method']}")
+        except Exception as e:
+            decision["success"] = False
+            decision["error"] = str(e)
+            self._log(f"Dialog rule '{rule.name}' failed on '{decision['title']}': {e}", warning=True)
+
+        with self._lock:
+            self._decisions.append(decision)
+
+    @staticmethod
+    def _apply(widget, rule: DialogRule) -> str:
+        from PyQt5.QtWidgets import QDialog, QMessageBox
+
+        if rule.action == 'click':
+            button = find_button(widget, rule.button)
+            if button is None:
+                raise ValueError(f"Button not found: {rule.button}")
+            button.click()
+            return f"click({_button_text(button) or button.objectName()})"
+
+        if isinstance(widget, QMessageBox):
+            # Message boxes report the clicked button, so answer through one
+            if rule.action == 'accept':
+                button = _role_button(widget, (QMessageBox.AcceptRole, QMessageBox.YesRole)) \
+                    or widget.defaultButton()
+            elif rule.action == 'reject':
+                button = widget.escapeButton() \
+                    or _role_button(widget, (QMessageBox.RejectRole, QMessageBox.NoRole))
+            else:
+                button = None
+            if button is not None:
+                button.click()
+                return f"click({_button_text(button)})"
+
+        if rule.action == 'accept' and isinstance(widget, QDialog):
+            widget.accept()
+            return "accept()"
+        if rule.action == 'reject' and isinstance(widget, QDialog):
+            widget.reject()
+            return "reject()"
+        widget.close()
+        return "close()"
+
+    @staticmethod
+    def _log(message: str, warning: bool = False):
+        from qgis.core import QgsMessageLog, Qgis
+        from . import log_buffer
+
+        QgsMessageLog.logMessage(message, 'QGIS AI Bridge', Qgis.Warning if warning else Qgis.Info)
+        log_buffer.add_message(message, 'warning' if warning else 'info', 'QGIS AI Bridge')
+
+
+# Global engine instance (started from initGui)
+engine = DialogRuleEngine()
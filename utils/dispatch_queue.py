@@ -0,0 +1,196 @@
+"""
+Bounded, prioritized dispatch queue for API commands
+
+Request threads do not execute commands themselves: they submit them here
+and wait. A fixed pool of workers executes queued commands in priority
+order (lower value first, FIFO within a priority). Some workers are
+reserved for critical commands so status/log/cancel calls are never stuck
+behind long waits or tree dumps. At most heavy_workers general workers run
+heavy commands (waits, profiling, tree dumps) at once, so the interactions
+those waits are waiting for always find a free worker.
+
+When too many commands are pending, submit() raises QueueFullError and the
+server answers 429 with Retry-After; commands that waited longer than
+max_queue_wait without starting fail with QueueTimeoutError (503).
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+
+PRIORITY_CRITICAL = 0
+PRIORITY_NORMAL = 1
+PRIORITY_HEAVY = 2
+
+# Used when config.json has no "dispatch" section
+DISPATCH_DEFAULTS = {
+    "workers": 4,
+    "critical_workers": 1,
+    "heavy_workers": 2,
+    "max_pending": 32,
+    "retry_after": 1,
+    "max_queue_wait": 30
+}
+
+
+class QueueFullError(Exception):
+    """Too many pending commands of this priority (HTTP 429)"""
+
+    def __init__(self, retry_after):
+        super().__init__(f"Server busy: too many pending commands, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class QueueTimeoutError(Exception):
+    """Command did not start within max_queue_wait, or the queue is stopped (HTTP 503)"""
+
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class DispatchQueue:
+    """Priority heap served by a fixed set of worker threads"""
+
+    def __init__(self, config: dict = None):
+        settings = dict(DISPATCH_DEFAULTS)
+        settings.update(config or {})
+        self.workers = max(1, int(settings["workers"]))
+        self.critical_workers = max(0, int(settings["critical_workers"]))
+        # Always leave at least one general worker for normal commands
+        self.heavy_workers = max(1, min(int(settings["heavy_workers"]), self.workers - 1))
+        self.max_pending = max(1, int(settings["max_pending"]))
+        self.retry_after = settings["retry_after"]
+        self.max_queue_wait = settings["max_queue_wait"]
+
+        self._heap = []          # (priority, seq, queued_at, future, fn)
+        self._seq = itertools.count()
+        self._pending = {}       # priority -> count
+        self._heavy_running = 0
+        self._cond = threading.Condition()
+        self._threads = []
+        self._running = False
+        # Bumped by start() so workers of a stopped pool never rejoin a restarted one
+        self._generation = 0
+        self.executed = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._generation += 1
+            generation = self._generation
+        kinds = [False] * self.workers + [True] * self.critical_workers
+        for i, critical_only in enumerate(kinds):
+            thread = threading.Thread(
+                target=self._work, args=(critical_only, generation),
+                name=f"ai-bridge-dispatch-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """Stop workers; pending commands fail with QueueTimeoutError"""
+        with self._cond:
+            self._running = False
+            heap, self._heap = self._heap, []
+            self._pending.clear()
+            self._cond.notify_all()
+        for item in heap:
+            item[3].set_exception(QueueTimeoutError("Server is shutting down", self.retry_after))
+        self._threads = []
+
+    def submit(self, priority: int, fn) -> Future:
+        """Queue fn() and return its future.
+
+        Raises:
+            QueueFullError: If max_pending commands of this priority are waiting
+            QueueTimeoutError: If the queue is not running
+        """
+        future = Future()
+        with self._cond:
+            if not self._running:
+                raise QueueTimeoutError("Server is not accepting commands", self.retry_after)
+            if self._pending.get(priority, 0) >= self.max_pending:
+                self.rejected += 1
+                raise QueueFullError(self.retry_after)
+            self._pending[priority] = self._pending.get(priority, 0) + 1
+            heapq.heappush(self._heap, (priority, next(self._seq), time.monotonic(), future, fn))
+            self._cond.notify_all()
+        return future
+
+    def _eligible(self, critical_only: bool) -> bool:
+        """Whether this worker may pop the heap head (lock held)"""
+        priority = self._heap[0][0]
+        if critical_only:
+            return priority == PRIORITY_CRITICAL
+        # The head is only heavy when nothing lighter is queued
+        return priority != PRIORITY_HEAVY or self._heavy_running < self.heavy_workers
+
+    def _take(self, critical_only: bool, generation: int):
+        """Pop the next item this worker may run (blocks); None when stopped"""
+        with self._cond:
+            while True:
+                if not self._running or generation != self._generation:
+                    return None
+                if self._heap and self._eligible(critical_only):
+                    item = heapq.heappop(self._heap)
+                    self._pending[item[0]] -= 1
+                    if item[0] == PRIORITY_HEAVY:
+                        self._heavy_running += 1
+                    return item
+                self._cond.wait()
+
+    def _release(self, priority: int):
+        """A taken item is done; wake workers waiting for a heavy slot"""
+        if priority == PRIORITY_HEAVY:
+            with self._cond:
+                self._heavy_running -= 1
+                self._cond.notify_all()
+
+    def _work(self, critical_only: bool, generation: int):
+        while True:
+            item = self._take(critical_only, generation)
+            if item is None:
+                return
+            priority, _, queued_at, future, fn = item
+            try:
+                if time.monotonic() - queued_at > self.max_queue_wait:
+                    self.timed_out += 1
+                    future.set_exception(QueueTimeoutError(
+                        f"Command waited more than {self.max_queue_wait}s in the queue", self.retry_after
+                    ))
+                    continue
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(fn())
+                except BaseException as e:
+                    future.set_exception(e)
+                self.executed += 1
+            finally:
+                self._release(priority)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "running": self._running,
+                "workers": self.workers,
+                "critical_workers": self.critical_workers,
+                "heavy_workers": self.heavy_workers,
+                "heavy_running": self._heavy_running,
+                "max_pending": self.max_pending,
+                "pending": {str(p): n for p, n in self._pending.items() if n},
+                "executed": self.executed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out
+            }
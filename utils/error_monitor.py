@@ -0,0 +1,142 @@
+"""
+Continuous error-dialog monitor
+
+Subscribes to Show/Hide events on the shared event hub and classifies
+windows as they appear: every QMessageBox, and any QDialog whose title
+contains an error keyword. Each appearance is recorded in a bounded history
+with its text and timestamps, so error.detect answers from memory and can
+report errors that were shown and closed between two polls (since=).
+Open dialogs are tracked by C++ pointer and weak widget handle, so a
+recorded dialog can still be garbage-collected.
+"""
+
+import itertools
+import threading
+import time
+from collections import deque
+
+from PyQt5.QtCore import QEvent
+
+# Error appearances kept in memory
+MAX_HISTORY = 200
+
+ERROR_KEYWORDS = ('error', 'warning', 'failed', 'exception')
+
+_ICON_NAMES = {0: "none", 1: "information", 2: "warning", 3: "critical", 4: "question"}
+
+
+def classify(widget) -> dict:
+    """Describe widget if it is an error dialog, else return None"""
+    from PyQt5.QtWidgets import QMessageBox, QDialog
+
+    info = {
+        "class": widget.__class__.__name__,
+        "objectName": widget.objectName(),
+        "title": widget.windowTitle() or '',
+    }
+
+    if isinstance(widget, QMessageBox):
+        icon = int(widget.icon())
+        info["type"] = "QMessageBox"
+        info["text"] = widget.text()
+        info["informative_text"] = widget.informativeText()
+        info["icon"] = icon
+        info["icon_name"] = _ICON_NAMES.get(icon, str(icon))
+        return info
+
+    if isinstance(widget, QDialog):
+        title_lower = info["title"].lower()
+        if any(keyword in title_lower for keyword in ERROR_KEYWORDS):
+            info["type"] = "Dialog with error keyword"
+            return info
+
+    return None
+
+
+class ErrorMonitor:
+    """Records error dialogs as they are shown and hidden"""
+
+    def __init__(self):
+        self._history = deque(maxlen=MAX_HISTORY)
+        self._open = {}     # C++ pointer -> entry
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._started = False
+
+    @property
+    def running(self) -> bool:
+        from . import ui_events
+        return self._started and ui_events.is_installed()
+
+    def start(self):
+        """Subscribe to the event hub and record already visible errors (GUI thread)"""
+        from PyQt5.QtWidgets import QApplication
+        from . import ui_events
+
+        if self._started:
+            return
+        ui_events.get_hub().subscribe((QEvent.Show,), self._on_show)
+        ui_events.get_hub().subscribe((QEvent.Hide,), self._on_hide)
+        self._started = True
+
+        for widget in QApplication.topLevelWidgets():
+            if widget.isVisible():
+                self._record(widget)
+
+    def _record(self, widget):
+        info = classify(widget)
+        if info is None:
+            return
+        from qgis.PyQt import sip
+        from .widget_handles import handles
+
+        entry = {
+            "id": next(self._ids),
+            "shown_at": time.time(),
+            "closed_at": None,
+            "handle": handles.handle_for(widget),
+            **info
+        }
+        with self._lock:
+            self._history.append(entry)
+            self._open[sip.unwrapinstance(widget)] = entry
+
+    def _on_show(self, obj, event):
+        if obj.isWidgetType() and obj.isWindow():
+            self._record(obj)
+
+    def _on_hide(self, obj, event):
+        if not self._open:
+            return
+        from qgis.PyQt import sip
+
+        with self._lock:
+            entry = self._open.pop(sip.unwrapinstance(obj), None)
+            if entry is not None:
+                entry["closed_at"] = time.time()
+
+    def visible(self) -> list:
+        """Error dialogs currently open"""
+        from .widget_handles import handles, StaleHandleError
+
+        with self._lock:
+            # Dialogs deleted while visible may never send a Hide event
+            for pointer, entry in list(self._open.items()):
+                try:
+                    handles.resolve(entry["handle"])
+                except StaleHandleError:
+                    self._open.pop(pointer)["closed_at"] = time.time()
+            return [dict(e) for e in self._open.values()]
+
+    def since(self, timestamp: float) -> list:
+        """Errors shown after timestamp (including ones already closed)"""
+        with self._lock:
+            return [dict(e) for e in self._history if e["shown_at"] > timestamp]
+
+    def history(self) -> list:
+        with self._lock:
+            return [dict(e) for e in self._history]
+
+
+# Global monitor instance (started from initGui)
+monitor = ErrorMonitor()
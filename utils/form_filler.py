@@ -0,0 +1,228 @@
+"""
+Set many form widgets in one GUI-thread pass
+
+Targets are resolved with a single findChildren() walk per window, values
+are applied widget by widget, and the event loop is pumped once at the end.
+With block_signals, widgets are updated silently and each then emits one
+change notification, so dependent slots (enable/disable logic, previews)
+run once per field instead of on every intermediate change.
+"""
+
+from . import main_thread
+
+
+def _resolve(names, window_title: str = None) -> dict:
+    """Map objectNames to widgets with one tree walk per window (GUI thread)"""
+    from PyQt5.QtWidgets import QApplication, QWidget
+    from qgis.utils import iface
+
+    if window_title:
+        roots = [
+            w for w in QApplication.topLevelWidgets()
+            if w.isVisible() and window_title.lower() in (w.windowTitle() or "").lower()
+        ]
+    else:
+        # Active modal dialog first, then the main window, then other windows
+        roots = []
+        modal = QApplication.activeModalWidget()
+        if modal is not None:
+            roots.append(modal)
+        roots.append(iface.mainWindow())
+        roots.extend(w for w in QApplication.topLevelWidgets() if w.isVisible())
+
+    wanted = set(names)
+    found = {}
+    seen_roots = set()
+    for root in roots:
+        if id(root) in seen_roots:
+            continue
+        seen_roots.add(id(root))
+
+        if root.objectName() in wanted and root.objectName() not in found:
+            found[root.objectName()] = root
+        for widget in root.findChildren(QWidget):
+            name = widget.objectName()
+            if name in wanted and name not in found:
+                found[name] = widget
+        if len(found) == len(wanted):
+            break
+
+    return found
+
+
+def _set_combo(widget, value):
+    if isinstance(value, dict) and 'index' in value:
+        index = int(value['index'])
+    else:
+        text = str(value['text'] if isinstance(value, dict) else value)
+        index = widget.findText(text)
+        if index == -1:
+            if widget.isEditable():
+                widget.setEditText(text)
+                return "editText"
+            raise ValueError(f"Item not found: {text}")
+    if not 0 <= index < widget.count():
+        raise ValueError(f"Index out of range: {index}")
+    widget.setCurrentIndex(index)
+    return "currentIndex"
+
+
+def _set_list(widget, value):
+    from PyQt5.QtCore import Qt
+
+    if isinstance(value, dict) and 'index' in value:
+        widget.setCurrentRow(int(value['index']))
+    else:
+        text = str(value['text'] if isinstance(value, dict) else value)
+        items = widget.findItems(text, Qt.MatchExactly)
+        if not items:
+            raise ValueError(f"Item not found: {text}")
+        widget.setCurrentRow(widget.row(items[0]))
+    return "currentRow"
+
+
+def _apply(widget, value) -> str:
+    """Set value on widget according to its type; returns the property set"""
+    from PyQt5.QtWidgets import (
+        QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QAbstractButton,
+        QSpinBox, QDoubleSpinBox, QAbstractSlider, QListWidget
+    )
+
+    # QGIS widgets first - several wrap the Qt widgets below
+    if hasattr(widget, 'setFilePath'):
+        widget.setFilePath(str(value))
+        return "filePath"
+    if hasattr(widget, 'setCrs'):
+        from qgis.core import QgsCoordinateReferenceSystem
+        crs = QgsCoordinateReferenceSystem(str(value))
+        if not crs.isValid():
+            raise ValueError(f"Invalid CRS: {value}")
+        widget.setCrs(crs)
+        return "crs"
+    if hasattr(widget, 'setLayer') and isinstance(widget, QComboBox):
+        from qgis.core import QgsProject
+        project = QgsProject.instance()
+        layer = project.mapLayer(str(value))
+        if layer is None:
+            matches = project.mapLayersByName(str(value))
+            layer = matches[0] if matches else None
+        if layer is None:
+            raise ValueError(f"Layer not found: {value}")
+        widget.setLayer(layer)
+        return "layer"
+
+    if isinstance(widget, QLineEdit):
+        widget.setText(str(value))
+        return "text"
+    if isinstance(widget, (QTextEdit, QPlainTextEdit)):
+        widget.setPlainText(str(value))
+        return "plainText"
+    if isinstance(widget, QComboBox):
+        return _set_combo(widget, value)
+    if isinstance(widget, QAbstractButton) and widget.isCheckable():
+        widget.setChecked(bool(value))
+        return "checked"
+    if isinstance(widget, QSpinBox):
+        widget.setValue(int(value))
+        return "value"
+    if isinstance(widget, QDoubleSpinBox):
+        widget.setValue(float(value))
+        return "value"
+    if isinstance(widget, QAbstractSlider):
+        widget.setValue(int(value))
+        return "value"
+    if isinstance(widget, QListWidget):
+        return _set_list(widget, value)
+
+    raise ValueError(f"Widget {widget.__class__.__name__} doesn't support value setting")
+
+
+def _notify(widget, prop: str):
+    """Emit the change signal a user edit would have produced (signals unblocked)"""
+    from PyQt5.QtWidgets import (
+        QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QAbstractButton,
+        QAbstractSpinBox, QAbstractSlider, QListWidget
+    )
+
+    if prop == "filePath" and hasattr(widget, 'fileChanged'):
+        widget.fileChanged.emit(widget.filePath())
+    elif prop == "crs" and hasattr(widget, 'crsChanged'):
+        widget.crsChanged.emit(widget.crs())
+    elif prop == "layer" and hasattr(widget, 'layerChanged'):
+        widget.layerChanged.emit(widget.currentLayer())
+    elif isinstance(widget, QLineEdit):
+        widget.textChanged.emit(widget.text())
+        widget.editingFinished.emit()
+    elif isinstance(widget, (QTextEdit, QPlainTextEdit)):
+        widget.textChanged.emit()
+    elif isinstance(widget, QComboBox):
+        if prop == "editText":
+            widget.editTextChanged.emit(widget.currentText())
+        else:
+            widget.currentIndexChanged.emit(widget.currentIndex())
+            widget.currentTextChanged.emit(widget.currentText())
+    elif isinstance(widget, QAbstractButton):
+        widget.toggled.emit(widget.isChecked())
+    elif isinstance(widget, QAbstractSpinBox):
+        widget.valueChanged.emit(widget.value())
+        widget.editingFinished.emit()
+    elif isinstance(widget, QAbstractSlider):
+        widget.valueChanged.emit(widget.value())
+    elif isinstance(widget, QListWidget):
+        widget.currentRowChanged.emit(widget.currentRow())
+
+
+def _fill(fields: dict, window_title: str, block_signals: bool) -> dict:
+    """Resolve and set all fields, then pump events once (GUI thread)"""
+    from PyQt5.QtWidgets import QApplication
+
+    widgets = _resolve(fields.keys(), window_title)
+
+    applied = {}
+    errors = {}
+    for name, value in fields.items():
+        widget = widgets.get(name)
+        if widget is None:
+            continue
+        was_blocked = widget.blockSignals(True) if block_signals else None
+        try:
+            applied[name] = (widget, _apply(widget, value))
+        except Exception as e:
+            errors[name] = str(e)
+        finally:
+            if block_signals:
+                widget.blockSignals(was_blocked)
+
+    if block_signals:
+        for name, (widget, prop) in applied.items():
+            try:
+                _notify(widget, prop)
+            except Exception as e:
+                errors[name] = f"Value set but change notification failed: {e}"
+
+    QApplication.processEvents()
+
+    return {
+        "set": {
+            name: {"widget_class": widget.__class__.__name__, "property": prop}
+            for name, (widget, prop) in applied.items()
+        },
+        "not_found": [name for name in fields if name not in widgets],
+        "errors": errors
+    }
+
+
+def fill_form(fields: dict, window_title: str = None, block_signals: bool = False) -> dict:
+    """Set many widgets by objectName in one GUI-thread round trip.
+
+    Args:
+        fields: Mapping of objectName -> value. Combo/list values may be item
+            text or {"index": n}; checkable buttons take booleans; QGIS file,
+            CRS and layer widgets take a path, auth ID or layer ID/name.
+        window_title: Only search windows whose title contains this text
+        block_signals: Update silently, then emit one change notification per field
+
+    Returns:
+        dict: {"set": dict, "not_found": list, "errors": dict}
+    """
+    return main_thread.call(_fill, dict(fields), window_title, block_signals)
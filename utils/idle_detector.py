@@ -0,0 +1,121 @@
+"""
+Detect when QGIS is idle, replacing fixed sleeps after UI interactions
+
+QGIS counts as idle when all of these hold for a short settle period:
+- the event loop picks up a queued probe almost immediately (no backlog)
+- Qt reports no pending events
+- no QgsTask is running in the task manager
+- the map canvas is not rendering
+"""
+
+import time
+
+from . import cancellation, main_thread
+
+# A queued probe that waits longer than this means the event loop is busy
+MAX_PROBE_LATENCY_MS = 20
+
+# Consecutive idle samples required (spaced by POLL_INTERVAL)
+DEFAULT_SETTLE_MS = 150
+POLL_INTERVAL = 0.05
+
+
+def _sample_state(include_tasks: bool, include_canvas: bool) -> dict:
+    """Read idle-relevant state (GUI thread only)"""
+    from PyQt5.QtWidgets import QApplication
+
+    state = {
+        "pending_events": False,
+        "active_tasks": 0,
+        "canvas_rendering": False
+    }
+
+    app = QApplication.instance()
+    if hasattr(app, 'hasPendingEvents'):
+        state["pending_events"] = app.hasPendingEvents()
+
+    if include_tasks:
+        from qgis.core import QgsApplication
+        state["active_tasks"] = QgsApplication.taskManager().countActiveTasks()
+
+    if include_canvas:
+        from qgis.utils import iface
+        if iface is not None:
+            state["canvas_rendering"] = iface.mapCanvas().isDrawing()
+
+    return state
+
+
+def probe(include_tasks: bool = True, include_canvas: bool = True) -> dict:
+    """Take one idle sample.
+
+    The latency between queuing the probe and the GUI thread running it is
+    the zero-timer measure of event loop backlog.
+
+    Returns:
+        dict: {"idle": bool, "latency_ms": float, "pending_events": bool,
+               "active_tasks": int, "canvas_rendering": bool}
+    """
+    posted = time.perf_counter()
+
+    def sample():
+        state = _sample_state(include_tasks, include_canvas)
+        state["latency_ms"] = round((time.perf_counter() - posted) * 1000, 2)
+        return state
+
+    state = main_thread.call(sample)
+    state["idle"] = (
+        state["latency_ms"] <= MAX_PROBE_LATENCY_MS
+        and not state["pending_events"]
+        and state["active_tasks"] == 0
+        and not state["canvas_rendering"]
+    )
+    return state
+
+
+def wait_for_idle(timeout: float = 10, settle_ms: float = DEFAULT_SETTLE_MS,
+                  include_tasks: bool = True, include_canvas: bool = True) -> dict:
+    """Wait until QGIS has been idle for settle_ms, or until timeout.
+
+    Must be called from a worker thread - the GUI thread cannot wait on
+    itself. On the GUI thread a single sample is returned.
+
+    Args:
+        timeout: Maximum seconds to wait
+        settle_ms: How long QGIS must stay idle before returning
+        include_tasks: Require no running QgsTasks
+        include_canvas: Require the map canvas to have finished rendering
+
+    Returns:
+        dict: {"idle": bool, "elapsed_time": float, "samples": int, "state": dict}
+    """
+    start = time.time()
+    # Stop waiting once the requesting client has given up
+    timeout = cancellation.current().clamp(timeout)
+
+    if main_thread.is_main_thread():
+        state = probe(include_tasks, include_canvas)
+        return {"idle": state["idle"], "elapsed_time": 0.0, "samples": 1, "state": state}
+
+    samples = 0
+    idle_since = None
+    state = {}
+
+    while True:
+        state = probe(include_tasks, include_canvas)
+        samples += 1
+        now = time.time()
+
+        if state["idle"]:
+            if idle_since is None:
+                idle_since = now
+            if (now - idle_since) * 1000 >= settle_ms:
+                return {"idle": True, "elapsed_time": now - start, "samples": samples, "state": state}
+        else:
+            idle_since = None
+
+        if now - start >= timeout:
+            return {"idle": False, "elapsed_time": now - start, "samples": samples,
+                    "state": state, "timeout": True}
+
+        time.sleep(POLL_INTERVAL)
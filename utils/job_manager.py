@@ -0,0 +1,286 @@
+"""
+Asynchronous job subsystem for long-running commands
+
+Work is wrapped in a QgsTask (so it shows up in QGIS's task manager and runs
+on its thread pool) and tracked by a job ID. The submitting command returns
+the ID immediately; job.* commands report progress, wait, cancel and fetch
+results.
+
+Job functions receive the Job as their only argument and should call
+job.set_progress() and check job.is_cancelled() as they go.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+
+from . import main_thread
+
+# Finished jobs kept for status/result queries
+MAX_JOBS = 200
+
+TERMINAL_STATES = ("completed", "failed", "cancelled")
+
+
+class JobCancelled(Exception):
+    """Raised by job functions that stop early because of a cancel request"""
+
+
+class Job:
+    """State of one asynchronous job"""
+
+    def __init__(self, job_id: int, description: str):
+        self.job_id = job_id
+        self.description = description
+        self.status = "queued"
+        self.progress = 0.0
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        self.task = None
+        self._cancel_requested = threading.Event()
+        self._done = threading.Event()
+        self._cancel_callbacks = []
+        self._done_callbacks = []
+        # Guards the flag checks against callback registration: a callback
+        # added while the job finishes on another thread must run exactly once
+        self._lock = threading.Lock()
+
+    def set_progress(self, progress: float):
+        """Report progress (0-100) from inside the job function"""
+        self.progress = max(0.0, min(100.0, float(progress)))
+        task = self.task
+        if task is not None:
+            task.setProgress(self.progress)
+
+    def is_cancelled(self) -> bool:
+        """Check whether cancellation was requested"""
+        task = self.task
+        return self._cancel_requested.is_set() or (task is not None and task.isCanceled())
+
+    def request_cancel(self):
+        """Flag the job as cancelled and run its cancel callbacks (once)"""
+        with self._lock:
+            if self._cancel_requested.is_set():
+                return
+            self._cancel_requested.set()
+            callbacks = list(self._cancel_callbacks)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def on_cancel(self, callback):
+        """Call callback() when cancellation is requested (e.g. to stop feedback)"""
+        with self._lock:
+            self._cancel_callbacks.append(callback)
+            requested = self._cancel_requested.is_set()
+        if requested:
+            callback()
+
+    def add_done_callback(self, callback):
+        """Call callback(job) once the job reaches a terminal state.
+
+        Runs on whichever thread finishes the job; called immediately if the
+        job is already done.
+        """
+        with self._lock:
+            self._done_callbacks.append(callback)
+            done = self._done.is_set()
+        if done:
+            callback(self)
+
+    def raise_if_cancelled(self):
+        """Raise JobCancelled if cancellation was requested"""
+        if self.is_cancelled():
+            raise JobCancelled(f"Job {self.job_id} was cancelled")
+
+    def is_done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Wait for the job to finish; returns True if it did"""
+        return self._done.wait(timeout)
+
+    def mark_running(self):
+        """Move the job from queued to running"""
+        self.status = "running"
+        self.started_at = time.time()
+
+    def finish(self, status: str, result=None, error: str = None):
+        """Record the final state (first call wins) and run done callbacks"""
+        with self._lock:
+            if self._done.is_set():
+                return
+            self.status = status
+            self.result = result
+            self.error = error
+            self.finished_at = time.time()
+            if status == "completed":
+                self.progress = 100.0
+            self._done.set()
+            callbacks = list(self._done_callbacks)
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception:
+                pass
+
+    def run(self, fn):
+        """Run the job function on the current (worker) thread"""
+        if self.is_cancelled():
+            self.finish("cancelled")
+            return
+        self.mark_running()
+        try:
+            result = fn(self)
+        except JobCancelled:
+            self.finish("cancelled")
+        except Exception as e:
+            # Cancelled work often surfaces as an exception from the interrupted call
+            if self.is_cancelled():
+                self.finish("cancelled")
+            else:
+                self.finish("failed", error=str(e))
+        else:
+            self.finish("cancelled" if self.is_cancelled() else "completed", result=result)
+
+    def snapshot(self, include_result: bool = False) -> dict:
+        """JSON-serializable view of the job"""
+        info = {
+            "job_id": self.job_id,
+            "description": self.description,
+            "status": self.status,
+            "progress": round(self.progress, 1),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error
+        }
+        if self.finished_at and self.started_at:
+            info["duration"] = round(self.finished_at - self.started_at, 3)
+        if include_result:
+            info["result"] = self.result
+        return info
+
+
+def _make_task(job: Job, fn):
+    """Wrap a job in a QgsTask"""
+    from qgis.core import QgsTask
+
+    class _JobTask(QgsTask):
+        def __init__(self):
+            super().__init__(f"AI Bridge: {job.description}", QgsTask.CanCancel)
+
+        def run(self):
+            job.run(fn)
+            return job.status == "completed"
+
+        def finished(self, ok):
+            # Reached without run() when the task is cancelled before starting
+            if not job.is_done():
+                job.finish("cancelled" if job.is_cancelled() else "failed",
+                            error=None if job.is_cancelled() else "Task ended without running")
+            # The task manager deletes the task after this returns
+            job.task = None
+
+        def cancel(self):
+            job.request_cancel()
+            super().cancel()
+
+    return _JobTask()
+
+
+class JobManager:
+    """Submits jobs to the QGIS task manager and keeps their state"""
+
+    def __init__(self):
+        self._jobs = OrderedDict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, description: str, fn) -> Job:
+        """Start a job in the background.
+
+        Args:
+            description: Human-readable summary shown in QGIS's task manager
+            fn: Callable taking the Job and returning a JSON-serializable result
+
+        Returns:
+            Job: The new job (already queued)
+        """
+        return self.start(self.create(description), fn)
+
+    def start(self, job: Job, fn) -> Job:
+        """Queue fn for a job registered with create().
+
+        Lets callers attach callbacks and bookkeeping before the job can run.
+        """
+        task = _make_task(job, fn)
+        job.task = task
+
+        # QgsTaskManager must be driven from the GUI thread
+        main_thread.call(_add_task, task)
+        return job
+
+    def create(self, description: str) -> Job:
+        """Register a job without a task.
+
+        Used for jobs that coordinate other jobs (e.g. batches); the caller
+        drives its state with mark_running() and finish().
+        """
+        with self._lock:
+            job = Job(next(self._ids), description)
+            self._jobs[job.job_id] = job
+            self._evict()
+        return job
+
+    def _evict(self):
+        """Drop the oldest finished jobs beyond MAX_JOBS (lock held)"""
+        excess = len(self._jobs) - MAX_JOBS
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if self._jobs[job_id].is_done():
+                del self._jobs[job_id]
+                excess -= 1
+
+    def get(self, job_id: int) -> Job:
+        """Get a job by ID.
+
+        Raises:
+            ValueError: If the job ID is unknown (or was evicted)
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise ValueError(f"Unknown job ID: {job_id}")
+        return job
+
+    def list(self) -> list:
+        """All tracked jobs, oldest first"""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id: int) -> Job:
+        """Request cancellation of a job"""
+        job = self.get(job_id)
+        job.request_cancel()
+        task = job.task
+        if task is not None:
+            main_thread.call(task.cancel)
+        return job
+
+
+def _add_task(task):
+    """Add a task to the global QGIS task manager (GUI thread)"""
+    from qgis.core import QgsApplication
+    QgsApplication.taskManager().addTask(task)
+
+
+# Global job manager instance
+manager = JobManager()
@@ -0,0 +1,241 @@
+"""
+Key macro engine for fast keyboard input
+
+A macro is a list of steps run in one batch on the GUI thread:
+
+    ["Ctrl+A", "text:C:/data/input.shp", "Tab", "Enter"]
+
+Step syntax:
+- "Enter", "Tab", "F5", "a"    - single key
+- "Ctrl+A", "Ctrl+Shift+S"     - key chord
+- "text:..."                   - type text (inserted directly when the
+                                 focused widget supports it)
+- "delay:0.2"                  - pause for the given seconds
+
+Keys are sent with no delay between them unless one is requested. Each step
+goes to whichever widget has focus at that point, so "Tab" moves on to the
+next field just like a user would.
+"""
+
+import time
+
+from . import cancellation, main_thread
+
+TEXT_PREFIX = "text:"
+DELAY_PREFIX = "delay:"
+
+
+def _key_map() -> dict:
+    from PyQt5.QtCore import Qt
+
+    keys = {
+        'Enter': Qt.Key_Return,
+        'Return': Qt.Key_Return,
+        'Tab': Qt.Key_Tab,
+        'Backtab': Qt.Key_Backtab,
+        'Escape': Qt.Key_Escape,
+        'Esc': Qt.Key_Escape,
+        'Space': Qt.Key_Space,
+        'Backspace': Qt.Key_Backspace,
+        'Delete': Qt.Key_Delete,
+        'Del': Qt.Key_Delete,
+        'Insert': Qt.Key_Insert,
+        'Up': Qt.Key_Up,
+        'Down': Qt.Key_Down,
+        'Left': Qt.Key_Left,
+        'Right': Qt.Key_Right,
+        'Home': Qt.Key_Home,
+        'End': Qt.Key_End,
+        'PageUp': Qt.Key_PageUp,
+        'PageDown': Qt.Key_PageDown,
+    }
+    for n in range(1, 13):
+        keys[f'F{n}'] = getattr(Qt, f'Key_F{n}')
+    return keys
+
+
+def _modifier_map() -> dict:
+    from PyQt5.QtCore import Qt
+
+    return {
+        'Ctrl': Qt.ControlModifier,
+        'Control': Qt.ControlModifier,
+        'Shift': Qt.ShiftModifier,
+        'Alt': Qt.AltModifier,
+        'Meta': Qt.MetaModifier,
+    }
+
+
+def _parse_key(token: str):
+    """Parse "Ctrl+S" / "Enter" / "a" into (key, modifiers), or None"""
+    from PyQt5.QtCore import Qt
+
+    key_map = _key_map()
+    modifier_map = _modifier_map()
+
+    parts = [p.strip() for p in token.split('+')]
+    # "+" and "Ctrl++" mean the plus key
+    if token == '+':
+        parts = ['+']
+    elif token.endswith('++'):
+        parts = parts[:-2] + ['+']
+
+    modifiers = Qt.NoModifier
+    for part in parts[:-1]:
+        if part not in modifier_map:
+            return None
+        modifiers |= modifier_map[part]
+
+    key_part = parts[-1]
+    if key_part in key_map:
+        return key_map[key_part], modifiers
+    if len(key_part) == 1:
+        return ord(key_part.upper()), modifiers
+    return None
+
+
+def parse_steps(steps, text_fallback: bool = False) -> list:
+    """Parse macro steps into ("key", key, modifiers) / ("text", str) / ("delay", float).
+
+    Args:
+        steps: List of step strings (or a single string)
+        text_fallback: Treat strings that are not keys as plain text
+            (single-string send_keys compatibility)
+
+    Raises:
+        ValueError: On an unknown key or malformed step
+    """
+    if isinstance(steps, str):
+        steps = [steps]
+
+    parsed = []
+    for step in steps:
+        if not isinstance(step, str) or not step:
+            raise ValueError(f"Invalid macro step: {step!r}")
+
+        if step.startswith(TEXT_PREFIX):
+            parsed.append(("text", step[len(TEXT_PREFIX):]))
+        elif step.startswith(DELAY_PREFIX):
+            try:
+                parsed.append(("delay", float(step[len(DELAY_PREFIX):])))
+            except ValueError:
+                raise ValueError(f"Invalid delay step: {step}")
+        else:
+            key = _parse_key(step)
+            if key is not None:
+                parsed.append(("key", *key))
+            elif text_fallback:
+                parsed.append(("text", step))
+            else:
+                raise ValueError(f"Unknown key: {step} (use 'text:{step}' to type it)")
+
+    return parsed
+
+
+def _insert_text(widget, text: str) -> bool:
+    """Insert text directly into editable widgets; returns False if unsupported"""
+    from PyQt5.QtWidgets import (
+        QLineEdit, QTextEdit, QPlainTextEdit, QAbstractSpinBox, QComboBox
+    )
+
+    if isinstance(widget, QComboBox) and widget.isEditable():
+        widget = widget.lineEdit()
+    elif isinstance(widget, QAbstractSpinBox):
+        widget = widget.findChild(QLineEdit)
+
+    if isinstance(widget, QLineEdit):
+        if widget.isReadOnly():
+            return False
+        widget.insert(text)
+        return True
+    if isinstance(widget, (QTextEdit, QPlainTextEdit)):
+        if widget.isReadOnly():
+            return False
+        widget.insertPlainText(text)
+        return True
+    return False
+
+
+def _run(parsed: list, target, delay_ms: int, fast_text: bool) -> dict:
+    """Execute parsed steps (GUI thread)"""
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtTest import QTest
+
+    if target is not None and target.focusPolicy() != Qt.NoFocus:
+        target.setFocus(Qt.OtherFocusReason)
+
+    def current_widget():
+        # Within the target's window follow its focus even if the window is
+        # not active; otherwise use the application's focus widget
+        if target is not None:
+            return target.window().focusWidget() or target
+        return QApplication.focusWidget() or QApplication.activeWindow()
+
+    # Abandon the rest of the macro once the requesting client has given up
+    token = cancellation.current()
+    inserted = 0
+    keystrokes = 0
+    done = 0
+    for step in parsed:
+        if token.cancelled:
+            break
+        widget = current_widget()
+        if widget is None:
+            raise RuntimeError("No widget has keyboard focus")
+
+        if step[0] == "key":
+            QTest.keyClick(widget, step[1], step[2], delay_ms)
+            keystrokes += 1
+        elif step[0] == "text":
+            if fast_text and delay_ms == 0 and _insert_text(widget, step[1]):
+                inserted += len(step[1])
+            else:
+                QTest.keyClicks(widget, step[1], Qt.NoModifier, delay_ms)
+                keystrokes += len(step[1])
+        elif step[0] == "delay":
+            QTest.qWait(int(token.clamp(step[1]) * 1000))
+        done += 1
+
+    QApplication.processEvents()
+
+    focus = current_widget()
+    return {
+        "steps": len(parsed),
+        "steps_done": done,
+        "cancelled": done < len(parsed),
+        "keystrokes": keystrokes,
+        "chars_inserted": inserted,
+        "focus": focus.objectName() if focus is not None else None
+    }
+
+
+def run_macro(steps, target=None, delay: float = 0, fast_text: bool = True,
+              text_fallback: bool = False) -> dict:
+    """Parse and run a key macro on the GUI thread in one batch.
+
+    Args:
+        steps: List of step strings (see module docstring) or a single string
+        target: Widget to focus before the first step (None = current focus)
+        delay: Seconds between key events (0 = as fast as possible)
+        fast_text: Insert text directly into line/text edits instead of
+            synthesizing one key event per character (only when delay is 0)
+        text_fallback: Treat unrecognized steps as plain text
+
+    Returns:
+        dict: {"steps": int, "steps_done": int, "cancelled": bool, "keystrokes": int,
+               "chars_inserted": int, "focus": str, "elapsed_ms": float}
+        (cancelled: the request deadline passed before all steps ran)
+    """
+    parsed = parse_steps(steps, text_fallback=text_fallback)
+
+    start = time.perf_counter()
+    # Explicit pauses can exceed the default GUI-thread timeout
+    events = sum(len(s[1]) if s[0] == "text" else 1 for s in parsed if s[0] != "delay")
+    total_pause = delay * events + sum(s[1] for s in parsed if s[0] == "delay")
+    result = main_thread.call(
+        _run, parsed, target, int(delay * 1000), fast_text,
+        timeout=main_thread.DEFAULT_TIMEOUT + total_pause
+    )
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    return result
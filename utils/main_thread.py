@@ -0,0 +1,125 @@
+"""
+Run callables on the Qt main (GUI) thread from API server threads
+
+Flask handles each request on a worker thread, but QGIS project and widget
+APIs must only be touched from the GUI thread. Callables are handed over
+through a queued signal, which Qt delivers via the main event loop (including
+nested loops such as a modal dialog's exec_()).
+
+The caller's cancellation token travels with the callable: work whose
+request deadline passed while it sat in the queue is skipped, and the
+token is current on the GUI thread while the callable runs. So is the
+caller's trace span, under which the wait for the GUI thread and the run
+are recorded as spans. Work posted by a command running under the
+command profiler is profiled on the GUI thread as well.
+"""
+
+import threading
+from contextlib import nullcontext
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from PyQt5.QtCore import QObject, QThread, Qt, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+
+from . import cancellation, profiler, tracing
+
+# Default time to wait for the GUI thread before giving up (seconds)
+DEFAULT_TIMEOUT = 30
+
+_invoker = None
+_invoker_lock = threading.Lock()
+
+
+class _Invoker(QObject):
+    """QObject living on the main thread that runs queued callables"""
+
+    invoke = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.invoke.connect(self._run, Qt.QueuedConnection)
+
+    def _run(self, task):
+        task()
+
+
+def _get_invoker() -> _Invoker:
+    """Create the invoker on first use and bind it to the GUI thread"""
+    global _invoker
+    with _invoker_lock:
+        if _invoker is None:
+            invoker = _Invoker()
+            invoker.moveToThread(QApplication.instance().thread())
+            _invoker = invoker
+        return _invoker
+
+
+def is_main_thread() -> bool:
+    """Check whether the caller is running on the GUI thread"""
+    app = QApplication.instance()
+    return app is not None and QThread.currentThread() == app.thread()
+
+
+def post(fn, *args, **kwargs) -> Future:
+    """Queue fn(*args, **kwargs) on the GUI thread and return immediately.
+
+    Args:
+        fn: Callable to run on the main thread
+
+    Returns:
+        Future resolved with fn's return value (or exception; RequestCancelled
+        if the caller's request deadline passed before fn started)
+    """
+    future = Future()
+    token = cancellation.current()
+    parent = tracing.current()
+    profiled = profiler.is_profiling()
+    queued = tracing.tracer.start_span("main_thread.queue", parent) if parent else None
+
+    def task():
+        if queued is not None:
+            queued.finish()
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            token.raise_if_cancelled()
+            run_span = tracing.tracer.span("main_thread.run", fn=getattr(fn, '__qualname__', repr(fn))) \
+                if parent is not None else nullcontext()
+            with cancellation.activate(token), tracing.activate(parent), run_span:
+                if profiled:
+                    result = profiler.run_profiled(lambda: fn(*args, **kwargs))
+                else:
+                    result = fn(*args, **kwargs)
+            future.set_result(result)
+        except BaseException as e:
+            future.set_exception(e)
+
+    _get_invoker().invoke.emit(task)
+    return future
+
+
+def call(fn, *args, timeout: float = DEFAULT_TIMEOUT, **kwargs):
+    """Run fn(*args, **kwargs) on the GUI thread and wait for the result.
+
+    Runs fn directly when already on the GUI thread.
+
+    Args:
+        fn: Callable to run on the main thread
+        timeout: Seconds to wait for the GUI thread
+
+    Returns:
+        fn's return value
+
+    Raises:
+        TimeoutError: If the GUI thread did not run fn in time
+        Exception: Whatever fn raised
+    """
+    if is_main_thread():
+        return fn(*args, **kwargs)
+
+    future = post(fn, *args, **kwargs)
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        raise TimeoutError(f"GUI thread did not respond within {timeout}s")
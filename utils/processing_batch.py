@@ -0,0 +1,239 @@
+"""
+Run batches of Processing algorithms as parallel background jobs
+
+Each item becomes its own QgsTask-backed job (so QGIS's task manager spreads
+them over its thread pool); a parent job tracks the batch, launches items as
+slots free up and collects per-item results.
+
+Items are prepared and post-processed on the GUI thread and executed on the
+worker thread, mirroring QgsProcessingAlgRunnerTask: the context is pushed
+to the worker for runPrepared() and back afterwards, and output layers the
+algorithm asks to load are added to the project, as the Processing dialog
+does. Algorithms flagged FlagNoThreading run entirely on the GUI thread.
+"""
+
+import threading
+
+from . import main_thread
+from .algorithm_catalog import to_json_value
+from .job_manager import manager, JobCancelled
+
+
+def _load_layers(context, feedback):
+    """Add the context's layers-to-load-on-completion to their project (GUI thread)"""
+    from qgis.core import QgsProcessingUtils, QgsProject
+
+    for layer_id, details in context.layersToLoadOnCompletion().items():
+        layer = QgsProcessingUtils.mapLayerFromString(layer_id, context)
+        if layer is None:
+            feedback.reportError(f"Could not load output layer {layer_id}")
+            continue
+        details.setOutputLayerName(layer)
+        # Ownership moves from the context's temporary store to the project
+        context.temporaryLayerStore().takeMapLayer(layer)
+        (details.project or QgsProject.instance()).addMapLayer(layer)
+        if details.postProcessor() is not None:
+            details.postProcessor().postProcessLayer(layer, context, feedback)
+    context.setLayersToLoadOnCompletion({})
+
+
+def _run_algorithm(job, algorithm_id: str, parameters: dict) -> dict:
+    """Job function: run one algorithm and return its outputs"""
+    from PyQt5.QtCore import QCoreApplication, QThread
+    from qgis.core import (
+        QgsApplication, QgsProcessingAlgorithm, QgsProcessingContext,
+        QgsProcessingFeedback, QgsProject
+    )
+
+    feedback = QgsProcessingFeedback()
+    feedback.progressChanged.connect(job.set_progress)
+    job.on_cancel(feedback.cancel)
+
+    def prepare():
+        alg = QgsApplication.processingRegistry().createAlgorithmById(algorithm_id)
+        if alg is None:
+            raise ValueError(f"Algorithm not found: {algorithm_id}")
+
+        context = QgsProcessingContext()
+        context.setProject(QgsProject.instance())
+
+        ok, message = alg.checkParameterValues(parameters, context)
+        if not ok:
+            raise ValueError(f"Invalid parameters for {algorithm_id}: {message}")
+        if not alg.prepare(parameters, context, feedback):
+            raise RuntimeError(f"Could not prepare {algorithm_id}")
+        return alg, context
+
+    alg, context = main_thread.call(prepare)
+    job.raise_if_cancelled()
+
+    if alg.flags() & QgsProcessingAlgorithm.FlagNoThreading:
+        results = main_thread.call(alg.runPrepared, parameters, context, feedback, timeout=None)
+    else:
+        # The context (and its temporary layers) must live on the running thread
+        main_thread.call(context.pushToThread, QThread.currentThread())
+        try:
+            results = alg.runPrepared(parameters, context, feedback)
+        finally:
+            context.pushToThread(QCoreApplication.instance().thread())
+    if feedback.isCanceled():
+        raise JobCancelled(f"Job {job.job_id} was cancelled")
+
+    def finish():
+        post_results = alg.postProcess(context, feedback)
+        _load_layers(context, feedback)
+        return post_results
+
+    post_results = main_thread.call(finish)
+    if post_results:
+        results = post_results
+
+    return {name: to_json_value(value) for name, value in (results or {}).items()}
+
+
+class ProcessingBatch:
+    """A parent job that runs algorithm items with bounded concurrency"""
+
+    def __init__(self, items: list, max_concurrency: int, description: str = None):
+        """
+        Args:
+            items: List of {"algorithm_id": str, "parameters": dict}
+            max_concurrency: Most items running at once
+            description: Parent job description
+        """
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.items = [
+            {
+                "index": i,
+                "algorithm_id": item["algorithm_id"],
+                "parameters": item.get("parameters") or {},
+                "status": "queued",
+                "job_id": None,
+                "results": None,
+                "error": None,
+                "duration": None
+            }
+            for i, item in enumerate(items)
+        ]
+        if description is None:
+            if len(self.items) == 1:
+                description = f"processing.run {self.items[0]['algorithm_id']}"
+            else:
+                description = f"processing.run batch of {len(self.items)}"
+
+        self.job = manager.create(description)
+        self._children = {}
+        self._next = 0
+        self._running = 0
+        self._finished = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Launch the first items and return the parent job"""
+        self.job.mark_running()
+        self.job.on_cancel(self._cancel_children)
+        self._fill()
+        return self.job
+
+    def _fill(self):
+        """Launch queued items while there are free slots"""
+        to_launch = []
+        with self._lock:
+            while (self._running < self.max_concurrency
+                   and self._next < len(self.items)
+                   and not self.job.is_cancelled()):
+                to_launch.append(self.items[self._next])
+                self._next += 1
+                self._running += 1
+
+        for item in to_launch:
+            # Registered before it can run, so even an instant finish finds its entry
+            child = manager.create(
+                f"{item['algorithm_id']} (batch job {self.job.job_id}, item {item['index']})"
+            )
+            item["job_id"] = child.job_id
+            item["status"] = "running"
+            with self._lock:
+                self._children[item["index"]] = child
+            child.add_done_callback(lambda job, item=item: self._child_done(item, job))
+            if self.job.is_cancelled():
+                child.request_cancel()
+
+            try:
+                manager.start(
+                    child,
+                    lambda job, item=item: _run_algorithm(job, item["algorithm_id"], item["parameters"])
+                )
+            except Exception as e:
+                # Never queued: finishing it runs _child_done like any other outcome
+                child.finish("failed", error=str(e))
+
+        self._maybe_finish()
+
+    def _child_done(self, item: dict, child):
+        """Record an item's outcome and launch the next one"""
+        item["status"] = child.status
+        item["results"] = child.result
+        item["error"] = child.error
+        if child.started_at and child.finished_at:
+            item["duration"] = round(child.finished_at - child.started_at, 3)
+
+        with self._lock:
+            self._children.pop(item["index"], None)
+        self._item_done()
+        self._fill()
+
+    def _item_done(self):
+        with self._lock:
+            self._running -= 1
+            self._finished += 1
+            self.job.set_progress(self._finished * 100.0 / len(self.items))
+
+    def _cancel_children(self):
+        with self._lock:
+            children = list(self._children.values())
+        for child in children:
+            try:
+                manager.cancel(child.job_id)
+            except Exception:
+                pass
+
+    def _maybe_finish(self):
+        """Finish the parent once nothing is running and nothing more will start"""
+        with self._lock:
+            if self._running > 0:
+                return
+            if self._next < len(self.items) and not self.job.is_cancelled():
+                return
+            if self._closed:
+                return
+            self._closed = True
+
+        for item in self.items[self._next:]:
+            item["status"] = "cancelled"
+
+        counts = {state: 0 for state in ("completed", "failed", "cancelled")}
+        for item in self.items:
+            counts[item["status"]] = counts.get(item["status"], 0) + 1
+
+        result = {
+            "items": self.items,
+            "total": len(self.items),
+            **counts
+        }
+
+        if self.job.is_cancelled():
+            self.job.finish("cancelled", result=result)
+        elif counts["completed"] == 0:
+            errors = [item["error"] for item in self.items if item["error"]]
+            self.job.finish("failed", result=result,
+                            error=errors[0] if len(self.items) == 1 and errors
+                            else f"All {len(self.items)} items failed")
+        else:
+            self.job.finish("completed", result=result)
+
+
+def run_batch(items: list, max_concurrency: int, description: str = None):
+    """Start a processing batch and return its parent job"""
+    return ProcessingBatch(items, max_concurrency, description).start()
@@ -0,0 +1,236 @@
+"""
+In-process profiling of the QGIS main thread and of API commands
+
+Two modes, both usable on a running session without external tools:
+
+- Stack sampling: a background thread reads the GUI thread's Python stack
+  via sys._current_frames() every interval and aggregates identical stacks
+  into collapsed-stack lines ("outer;inner;leaf count", the input format of
+  flamegraph tools). The GUI thread itself is never paused or instrumented.
+  Samples where the GUI thread runs no Python code (idle in Qt's event loop,
+  or busy in C++) are counted separately.
+
+- Command profiling: the next K API commands run under cProfile; when the
+  last one finishes, the merged stats are kept as a pstats summary. GUI-thread
+  work posted by those commands (main_thread.post) is profiled too.
+"""
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+DEFAULT_INTERVAL = 0.005
+MAX_SAMPLE_DURATION = 300
+MAX_DEPTH = 128
+
+_local = threading.local()
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{Path(code.co_filename).name}:{code.co_name}"
+
+
+def sample_main_thread(duration: float, interval: float = DEFAULT_INTERVAL,
+                       should_stop=None, on_progress=None) -> dict:
+    """Sample the GUI thread's Python stack for duration seconds.
+
+    Must run off the GUI thread.
+
+    Args:
+        duration: Seconds to sample
+        interval: Seconds between samples
+        should_stop: Optional callable; sampling ends early when it returns True
+        on_progress: Optional callable receiving the percentage done
+
+    Returns:
+        dict: {"samples": int, "python_samples": int, "idle_samples": int,
+               "duration": float, "stacks": Counter of collapsed stack -> count}
+    """
+    from . import main_thread
+
+    if main_thread.is_main_thread():
+        raise RuntimeError("The main thread cannot sample itself")
+
+    target = main_thread.call(threading.get_ident)
+    stacks = Counter()
+    samples = idle = 0
+
+    start = time.perf_counter()
+    end = start + duration
+    while True:
+        now = time.perf_counter()
+        if now >= end or (should_stop is not None and should_stop()):
+            break
+
+        frame = sys._current_frames().get(target)
+        samples += 1
+        if frame is None:
+            idle += 1
+        else:
+            names = []
+            while frame is not None and len(names) < MAX_DEPTH:
+                names.append(_frame_name(frame))
+                frame = frame.f_back
+            stacks[";".join(reversed(names))] += 1
+        del frame
+
+        if on_progress is not None and samples % 100 == 0:
+            on_progress(min(100.0, (now - start) / duration * 100))
+        time.sleep(interval)
+
+    return {
+        "samples": samples,
+        "python_samples": samples - idle,
+        "idle_samples": idle,
+        "duration": round(time.perf_counter() - start, 3),
+        "stacks": stacks
+    }
+
+
+def summarize_samples(result: dict, top: int = 30) -> dict:
+    """JSON view of sample_main_thread() output: collapsed text plus hot leaves"""
+    stacks = result["stacks"]
+    python_samples = result["python_samples"] or 1
+
+    leaves = Counter()
+    for stack, count in stacks.items():
+        leaves[stack.rsplit(";", 1)[-1]] += count
+
+    return {
+        "samples": result["samples"],
+        "python_samples": result["python_samples"],
+        "idle_samples": result["idle_samples"],
+        "duration": result["duration"],
+        "unique_stacks": len(stacks),
+        "collapsed": "\n".join(f"{stack} {count}" for stack, count in stacks.most_common()),
+        "hot_functions": [
+            {"function": name, "samples": count, "percent": round(count * 100 / python_samples, 1)}
+            for name, count in leaves.most_common(top)
+        ]
+    }
+
+
+class CommandProfiler:
+    """Runs the next K API commands under cProfile and merges their stats"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._remaining = 0
+        self._only = None
+        self._stats = None
+        self._commands = []
+        self._armed_at = None
+        self._finished_at = None
+
+    def arm(self, count: int, command: str = None):
+        """Profile the next count commands (optionally only those named command)"""
+        with self._lock:
+            self._remaining = count
+            self._only = command
+            self._stats = None
+            self._commands = []
+            self._armed_at = time.time()
+            self._finished_at = None
+
+    def cancel(self):
+        with self._lock:
+            self._remaining = 0
+
+    @property
+    def armed(self) -> bool:
+        return self._remaining > 0
+
+    def _claim(self, command: str) -> bool:
+        with self._lock:
+            if self._remaining <= 0 or (self._only and command != self._only):
+                return False
+            self._remaining -= 1
+            return True
+
+    def _merge(self, profile):
+        with self._lock:
+            if self._stats is None:
+                self._stats = pstats.Stats(profile)
+            else:
+                self._stats.add(profile)
+
+    def run(self, command: str, fn):
+        """Run fn(), under cProfile if this command is one of the next K"""
+        if command == "qgis.profile" or not self.armed or not self._claim(command):
+            return fn()
+
+        profile = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler is active (e.g. a concurrent profiled command on 3.12+)
+            with self._lock:
+                self._remaining += 1
+            return fn()
+
+        previous = getattr(_local, 'profiling', False)
+        _local.profiling = True
+        try:
+            return fn()
+        finally:
+            profile.disable()
+            _local.profiling = previous
+            self._merge(profile)
+            with self._lock:
+                self._commands.append({
+                    "command": command,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 3)
+                })
+                if self._remaining == 0 and self._finished_at is None:
+                    self._finished_at = time.time()
+
+    def status(self, sort: str = "cumulative", top: int = 40) -> dict:
+        with self._lock:
+            info = {
+                "armed_at": self._armed_at,
+                "remaining": self._remaining,
+                "finished": self._finished_at is not None,
+                "finished_at": self._finished_at,
+                "commands": list(self._commands)
+            }
+            if self._stats is not None:
+                out = io.StringIO()
+                self._stats.stream = out
+                self._stats.sort_stats(sort).print_stats(top)
+                info["pstats"] = out.getvalue()
+        return info
+
+
+def is_profiling() -> bool:
+    """True while this thread runs a command under the command profiler"""
+    return getattr(_local, 'profiling', False)
+
+
+def run_profiled(fn):
+    """Run fn (GUI-thread work of a profiled command) under its own cProfile.
+
+    Before Python 3.12 cProfile only sees the thread it was enabled on; from
+    3.12 the command's profile already covers every thread and a second one
+    cannot be enabled, so fn simply runs.
+    """
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        return fn()
+    try:
+        return fn()
+    finally:
+        profile.disable()
+        command_profiler._merge(profile)
+
+
+# Global command profiler (consulted by the API router)
+command_profiler = CommandProfiler()
@@ -0,0 +1,168 @@
+"""
+Bulk widget property reads through cached per-class getter tables
+
+Each widget class's readable Qt properties are discovered once from its
+QMetaObject and kept as a name -> QMetaProperty table. Reading many widgets
+is then a dictionary lookup plus QMetaProperty.read() per property, with no
+hasattr() probing or repeated reflection.
+"""
+
+from functools import partial
+
+from . import main_thread
+from .widget_projection import Projection, DEFAULT_MAX_TEXT_LEN
+
+# Properties returned when the caller does not name any
+DEFAULT_PROPERTIES = [
+    "objectName", "visible", "enabled", "windowTitle", "text", "plainText",
+    "currentText", "currentIndex", "value", "checked", "toolTip"
+]
+
+# Extra pseudo-properties that are not Qt properties
+_EXTRA_GETTERS = {
+    "class": lambda w: w.__class__.__name__,
+    "isVisibleOnScreen": lambda w: w.isVisible() and not w.visibleRegion().isEmpty(),
+}
+
+_tables = {}
+
+
+def getter_table(widget) -> dict:
+    """Get (building once per class) the property name -> getter table for widget's class"""
+    # Keyed by the C++ class: sip wraps unbound C++ classes as their nearest
+    # bound base, so one Python type can cover several property tables
+    meta = widget.metaObject()
+    cls = meta.className()
+    table = _tables.get(cls)
+    if table is not None:
+        return table
+
+    table = dict(_EXTRA_GETTERS)
+    for i in range(meta.propertyCount()):
+        prop = meta.property(i)
+        if prop.isReadable():
+            table[prop.name()] = prop.read
+    _tables[cls] = table
+    return table
+
+
+def to_json_value(value):
+    """Convert common Qt value types into JSON-serializable values"""
+    from PyQt5.QtCore import QRect, QRectF, QSize, QSizeF, QPoint, QPointF
+    from PyQt5.QtGui import QColor, QFont, QIcon, QPixmap
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (QRect, QRectF)):
+        return {"x": value.x(), "y": value.y(), "width": value.width(), "height": value.height()}
+    if isinstance(value, (QSize, QSizeF)):
+        return {"width": value.width(), "height": value.height()}
+    if isinstance(value, (QPoint, QPointF)):
+        return {"x": value.x(), "y": value.y()}
+    if isinstance(value, QColor):
+        return value.name()
+    if isinstance(value, QFont):
+        return value.toString()
+    if isinstance(value, (QIcon, QPixmap)):
+        return None
+    if isinstance(value, (list, tuple)):
+        return [to_json_value(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): to_json_value(v) for k, v in value.items()}
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def read_properties(widget, properties: list = None, projection: Projection = None) -> dict:
+    """Read properties of one widget from its class table (GUI thread).
+
+    Args:
+        widget: Widget to read
+        properties: Property names, or a single name ("*" for all, None for the defaults)
+        projection: Used for text truncation (defaults to standard limits)
+
+    Returns:
+        dict of property -> JSON-serializable value; properties the class
+        does not have are left out
+    """
+    table = getter_table(widget)
+    if isinstance(properties, str) and properties != "*":
+        properties = [properties]
+    if properties is None:
+        names = [p for p in DEFAULT_PROPERTIES if p in table]
+    elif properties == "*" or properties == ["*"]:
+        names = list(table)
+    else:
+        names = [p for p in properties if p in table]
+
+    projection = projection or Projection()
+    values = projection.collect({name: partial(table[name], widget) for name in names})
+    return {name: to_json_value(value) for name, value in values.items()}
+
+
+def _read_many(object_names: list, handle_ids: list, properties, max_text_len) -> dict:
+    from PyQt5.QtWidgets import QApplication
+    from .widget_handles import handles, StaleHandleError
+
+    targets = []
+    stale = []
+    invalid = []
+    for handle in handle_ids:
+        try:
+            targets.append((handles.resolve(handle), None))
+        except StaleHandleError:
+            stale.append(handle)
+        except (TypeError, ValueError) as e:
+            # Not an integer: report it without failing the other reads
+            invalid.append({"handle": handle, "error": f"Invalid widget handle: {e}"})
+
+    found = {}
+    duplicates = {}
+    if object_names:
+        wanted = set(object_names)
+        for widget in QApplication.allWidgets():
+            name = widget.objectName()
+            if name in wanted:
+                if name in found:
+                    duplicates[name] = duplicates.get(name, 1) + 1
+                else:
+                    found[name] = widget
+        targets.extend((found[name], name) for name in object_names if name in found)
+
+    projection = Projection(max_text_len=max_text_len)
+    widgets = []
+    for widget, name in targets:
+        entry = {
+            "handle": handles.handle_for(widget),
+            "objectName": widget.objectName()
+        }
+        entry.update(read_properties(widget, properties, projection))
+        if name in duplicates:
+            entry["duplicates"] = duplicates[name]
+        widgets.append(entry)
+
+    return {
+        "widgets": widgets,
+        "not_found": [name for name in object_names if name not in found],
+        "stale_handles": stale,
+        "invalid_handles": invalid,
+        "truncated": projection.truncated
+    }
+
+
+def read_many(object_names: list = None, handle_ids: list = None, properties=None,
+              max_text_len: int = DEFAULT_MAX_TEXT_LEN) -> dict:
+    """Read properties of many widgets in one GUI-thread call.
+
+    Handles resolve directly; objectNames are resolved in a single pass over
+    QApplication.allWidgets() (for duplicates the first match is read).
+
+    Returns:
+        dict: {"widgets": list, "not_found": list, "stale_handles": list,
+               "invalid_handles": list, "truncated": bool}
+    """
+    return main_thread.call(
+        _read_many, list(object_names or []), list(handle_ids or []), properties, max_text_len
+    )
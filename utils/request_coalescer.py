@@ -0,0 +1,100 @@
+"""
+Coalescing of identical concurrent read-only requests
+
+When several clients send the same read-only command with the same params
+at the same moment, only the first executes; later callers wait on the
+first execution's future and get the same result. Only requests that
+overlap in time are merged - nothing is cached after the execution ends.
+
+The shared execution runs under its first caller's cancellation token, so a
+request only joins it if that token's deadline is no earlier than its own;
+otherwise it executes separately. Joined callers stop waiting at their own
+deadline.
+"""
+
+import json
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from . import cancellation
+
+
+def request_key(command: str, params: dict):
+    """Canonical key for command + params, or None if params can't be canonicalized"""
+    try:
+        return command + "\0" + json.dumps(params or {}, sort_keys=True, separators=(',', ':'))
+    except (TypeError, ValueError):
+        return None
+
+
+def _outlives(owner_deadline, deadline) -> bool:
+    """Whether an execution bounded by owner_deadline runs at least until deadline"""
+    return owner_deadline is None or (deadline is not None and deadline <= owner_deadline)
+
+
+class RequestCoalescer:
+    """In-flight executions keyed by canonical command + params"""
+
+    def __init__(self):
+        self._in_flight = {}     # key -> (Future, deadline of the executing request)
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+        self.unshared = 0
+
+    def run(self, command: str, params: dict, handler):
+        """Run handler(params), or join an identical execution already in flight"""
+        key = request_key(command, params)
+        if key is None:
+            return handler(params)
+
+        token = cancellation.current()
+        shared = future = None
+        with self._lock:
+            flight = self._in_flight.get(key)
+            if flight is None:
+                future = Future()
+                self._in_flight[key] = (future, token.deadline)
+                self.executed += 1
+            elif _outlives(flight[1], token.deadline):
+                shared = flight[0]
+                self.coalesced += 1
+            else:
+                # The running execution would be cancelled before this caller's deadline
+                self.unshared += 1
+        if shared is not None:
+            return self._join(shared, token)
+        if future is None:
+            return handler(params)
+
+        try:
+            result = handler(params)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    @staticmethod
+    def _join(future: Future, token):
+        """Wait for a shared execution until this caller's own deadline"""
+        try:
+            return future.result(timeout=token.remaining())
+        except FutureTimeoutError:
+            return {"success": False, "error": "Request deadline exceeded", "cancelled": True}
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": len(self._in_flight),
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "unshared": self.unshared
+            }
+
+
+# Shared coalescer used by the API router
+coalescer = RequestCoalescer()
@@ -0,0 +1,176 @@
+"""
+Response cache for introspection commands, invalidated by a global UI epoch
+
+The UI epoch is a counter bumped whenever something visible may have
+changed: structural/visual widget events on the shared event hub,
+QgsProject signals, Processing provider changes (plugin loads/reloads),
+and every command that is not read-only. Cached
+responses are tagged with the epoch they were computed in and are only
+served while the epoch is unchanged (and younger than ttl_seconds, a safety
+net for changes that produce no such event, such as a label updated from
+code or a value typed by the user).
+
+Without the event hub installed nothing is cached.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+
+from PyQt5.QtCore import QEvent
+
+from .request_coalescer import request_key
+
+# Widget events after which introspection results may differ (input events
+# are left out: whatever they change shows up as one of these or a command)
+UI_EVENTS = (
+    QEvent.Show, QEvent.Hide, QEvent.ChildAdded, QEvent.ChildRemoved,
+    QEvent.ParentChange, QEvent.WindowTitleChange, QEvent.EnabledChange,
+    QEvent.Move, QEvent.Resize
+)
+
+# QgsProject (and layer tree) signals that change layer listings
+PROJECT_SIGNALS = ('layersAdded', 'layersRemoved', 'cleared', 'readProject', 'crsChanged', 'dirtySet')
+LAYER_TREE_SIGNALS = ('visibilityChanged', 'nameChanged', 'addedChildren', 'removedChildren')
+
+CACHE_DEFAULTS = {
+    "enabled": True,
+    "ttl_seconds": 5,
+    "max_entries": 256
+}
+
+
+class UIEpoch:
+    """Global change counter with per-source bump counts"""
+
+    def __init__(self):
+        self._counter = itertools.count(1)
+        self.value = 0
+        self.bumps = {"ui": 0, "project": 0, "processing": 0, "command": 0}
+
+    def bump(self, source: str):
+        # next() on itertools.count is atomic, so concurrent bumps never collapse
+        self.value = next(self._counter)
+        self.bumps[source] += 1
+
+
+class ResponseCache:
+    """LRU of command responses tagged with the UI epoch they were computed in"""
+
+    def __init__(self):
+        self.epoch = UIEpoch()
+        self._entries = OrderedDict()    # key -> (epoch, timestamp, result)
+        self._lock = threading.Lock()
+        self._settings = dict(CACHE_DEFAULTS)
+        self._started = False
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def running(self) -> bool:
+        from . import ui_events
+        return self._started and self._settings["enabled"] and ui_events.is_installed()
+
+    def start(self):
+        """Subscribe to UI events, project and Processing registry signals (GUI thread)"""
+        from qgis.core import QgsApplication, QgsProject
+        from . import ui_events
+        from .config import get_section
+
+        if self._started:
+            return
+        self._settings = get_section("response_cache", CACHE_DEFAULTS)
+        ui_events.get_hub().subscribe(UI_EVENTS, self._on_ui_event)
+
+        project = QgsProject.instance()
+        sources = [(project, PROJECT_SIGNALS), (project.layerTreeRoot(), LAYER_TREE_SIGNALS)]
+        for emitter, names in sources:
+            for name in names:
+                signal = getattr(emitter, name, None)
+                if signal is not None:
+                    signal.connect(self._on_project_change)
+
+        # The algorithm catalog changes when plugins add, remove or reload providers
+        registry = QgsApplication.processingRegistry()
+        registry.providerAdded.connect(self._on_provider_added)
+        registry.providerRemoved.connect(self._on_processing_change)
+        for provider in registry.providers():
+            self._watch_provider(provider)
+        self._started = True
+
+    def _watch_provider(self, provider):
+        if hasattr(provider, 'algorithmsLoaded'):
+            provider.algorithmsLoaded.connect(self._on_processing_change)
+
+    def _on_provider_added(self, provider_id):
+        from qgis.core import QgsApplication
+
+        provider = QgsApplication.processingRegistry().providerById(provider_id)
+        if provider is not None:
+            self._watch_provider(provider)
+        self._on_processing_change()
+
+    def _on_processing_change(self, *args):
+        self.epoch.bump("processing")
+
+    def _on_ui_event(self, obj, event):
+        # Timers, render jobs and network objects add and remove children constantly
+        if obj.isWidgetType():
+            self.epoch.bump("ui")
+
+    def _on_project_change(self, *args):
+        self.epoch.bump("project")
+
+    def command_executed(self):
+        """A command with side effects ran (called by the API router)"""
+        self.epoch.bump("command")
+
+    def run(self, command: str, params: dict, handler):
+        """Serve handler(params) from cache while the epoch is unchanged"""
+        key = request_key(command, params) if self.running else None
+        if key is None:
+            return handler(params)
+
+        epoch = self.epoch.value
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == epoch and now - entry[1] < self._settings["ttl_seconds"]:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        result = handler(params)
+        if result.get('success'):
+            with self._lock:
+                # Tagged with the epoch read before computing: a change during
+                # the computation makes the entry stale on the next lookup
+                self._entries[key] = (epoch, now, result)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._settings["max_entries"]:
+                    self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.running,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "epoch": self.epoch.value,
+                "epoch_bumps": dict(self.epoch.bumps),
+                "ttl_seconds": self._settings["ttl_seconds"]
+            }
+
+
+# Shared cache used by the API router
+response_cache = ResponseCache()
@@ -0,0 +1,128 @@
+"""
+Pluggable response encoding for the API server
+
+Serializes command results with the fastest JSON library available and
+supports content negotiation for compact binary formats (MessagePack, CBOR)
+and compression (zstd, gzip). Every optional library is used only when it is
+installed; plain compact JSON is always available.
+"""
+
+import gzip
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+JSON_MIMETYPE = "application/json"
+MSGPACK_MIMETYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+CBOR_MIMETYPE = "application/cbor"
+
+# Used when config.json has no "encoding" section
+ENCODING_DEFAULTS = {
+    "compress_min_bytes": 1024,
+    "gzip_level": 5,
+    "zstd_level": 3
+}
+
+
+def _fallback(value):
+    """Serialize objects the encoders do not know (Qt enums, paths, ...) as strings"""
+    return str(value)
+
+
+def _dumps_json(payload) -> bytes:
+    """Compact JSON via orjson when available, stdlib json otherwise"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=_fallback, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers wider than 64 bits - the stdlib handles these
+            pass
+    return json.dumps(payload, separators=(',', ':'), ensure_ascii=False,
+                      default=_fallback).encode('utf-8')
+
+
+def _accepts(header: str, mimetype: str) -> bool:
+    """Check whether an Accept/Accept-Encoding header lists a value"""
+    values = [part.split(';')[0].strip().lower() for part in (header or '').split(',')]
+    return mimetype in values
+
+
+class ResponseEncoder:
+    """Encodes command results according to the request's Accept headers"""
+
+    def __init__(self, config: dict = None):
+        settings = dict(ENCODING_DEFAULTS)
+        settings.update(config or {})
+        self.compress_min_bytes = settings["compress_min_bytes"]
+        self.gzip_level = settings["gzip_level"]
+        self.zstd_level = settings["zstd_level"]
+
+    def serialize(self, payload, accept: str = None) -> tuple:
+        """Serialize a payload in the best format the client accepts.
+
+        Args:
+            payload: JSON-compatible result
+            accept: Request Accept header
+
+        Returns:
+            tuple: (body bytes, mimetype)
+        """
+        if msgpack is not None and any(_accepts(accept, m) for m in MSGPACK_MIMETYPES):
+            return msgpack.packb(payload, default=_fallback, use_bin_type=True), MSGPACK_MIMETYPES[0]
+        if cbor2 is not None and _accepts(accept, CBOR_MIMETYPE):
+            return cbor2.dumps(payload, default=lambda encoder, value: encoder.encode(str(value))), CBOR_MIMETYPE
+        return _dumps_json(payload), JSON_MIMETYPE
+
+    def compress(self, body: bytes, accept_encoding: str = None) -> tuple:
+        """Compress a body if the client accepts it and it is large enough.
+
+        Args:
+            body: Serialized response
+            accept_encoding: Request Accept-Encoding header
+
+        Returns:
+            tuple: (body bytes, content encoding or None)
+        """
+        if len(body) < self.compress_min_bytes:
+            return body, None
+        if zstandard is not None and _accepts(accept_encoding, "zstd"):
+            return zstandard.ZstdCompressor(level=self.zstd_level).compress(body), "zstd"
+        if _accepts(accept_encoding, "gzip"):
+            return gzip.compress(body, compresslevel=self.gzip_level), "gzip"
+        return body, None
+
+    def encode(self, payload, accept: str = None, accept_encoding: str = None) -> tuple:
+        """Serialize and compress a payload.
+
+        Returns:
+            tuple: (body bytes, headers dict)
+        """
+        body, mimetype = self.serialize(payload, accept)
+        body, content_encoding = self.compress(body, accept_encoding)
+
+        headers = {
+            "Content-Type": mimetype,
+            "Vary": "Accept, Accept-Encoding"
+        }
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
+        return body, headers
@@ -0,0 +1,274 @@
+"""
+Per-window grid index of visible widget rects for screen hit-testing
+
+Each top-level window gets a uniform grid (CELL_SIZE px cells) mapping cells
+to the visible widgets overlapping them. A point query looks at one cell and
+picks the topmost candidate that contains the point and is not clipped by
+an ancestor.
+
+Stacking order is the widget's path of sibling indices from the window
+(parents before children, later siblings above earlier ones), compared as
+tuples.
+
+The index is kept current from the shared event hub: Move/Resize/Show/Hide
+re-index only the affected widget's subtree; structural changes
+(ChildAdded/ChildRemoved/ZOrderChange) or a moved window trigger a full
+rebuild on the next query. All index work happens on the GUI thread.
+"""
+
+import threading
+
+from PyQt5.QtCore import QEvent, QPoint, Qt
+
+from . import main_thread
+
+CELL_SIZE = 64
+
+# Re-indexing more subtrees than this is slower than a rebuild
+MAX_INCREMENTAL = 50
+
+GEOMETRY_EVENTS = (QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide)
+STRUCTURE_EVENTS = (QEvent.ChildAdded, QEvent.ChildRemoved, QEvent.ZOrderChange)
+
+
+def _cells(rect):
+    x, y, w, h = rect
+    for cx in range(x // CELL_SIZE, (x + max(w, 1) - 1) // CELL_SIZE + 1):
+        for cy in range(y // CELL_SIZE, (y + max(h, 1) - 1) // CELL_SIZE + 1):
+            yield cx, cy
+
+
+def _contains(rect, x, y) -> bool:
+    rx, ry, rw, rh = rect
+    return rx <= x < rx + rw and ry <= y < ry + rh
+
+
+def _hit_testable(widget) -> bool:
+    return widget.isVisible() and not widget.testAttribute(Qt.WA_TransparentForMouseEvents)
+
+
+class WindowGridIndex:
+    """Grid of visible widget rects for one top-level window"""
+
+    def __init__(self, window):
+        self.window = window
+        self._grid = {}        # (cx, cy) -> set of widgets
+        self._entries = {}     # widget -> (rect, order_key, cells)
+        self._dirty = set()
+        self._needs_rebuild = True
+        self._lock = threading.Lock()
+        self.rebuilds = 0
+        self.incremental_updates = 0
+
+    # -- change tracking (called from the event hub) --------------------
+
+    def mark_dirty(self, widget):
+        with self._lock:
+            if widget is self.window:
+                self._needs_rebuild = True
+            else:
+                self._dirty.add(widget)
+
+    def mark_rebuild(self):
+        with self._lock:
+            self._needs_rebuild = True
+
+    # -- index maintenance (GUI thread) ---------------------------------
+
+    def _insert(self, widget, rect, key):
+        cells = list(_cells(rect))
+        for cell in cells:
+            self._grid.setdefault(cell, set()).add(widget)
+        self._entries[widget] = (rect, key, cells)
+
+    def _remove(self, widget):
+        entry = self._entries.pop(widget, None)
+        if entry is None:
+            return
+        for cell in entry[2]:
+            members = self._grid.get(cell)
+            if members is not None:
+                members.discard(widget)
+                if not members:
+                    del self._grid[cell]
+
+    def _index_subtree(self, root, x, y, key):
+        """Insert root (at screen x, y) and its visible descendants"""
+        stack = [(root, x, y, key)]
+        while stack:
+            widget, wx, wy, wkey = stack.pop()
+            if not _hit_testable(widget):
+                continue
+            self._insert(widget, (wx, wy, widget.width(), widget.height()), wkey)
+            for i, child in enumerate(widget.children()):
+                if child.isWidgetType() and not child.isWindow():
+                    pos = child.pos()
+                    stack.append((child, wx + pos.x(), wy + pos.y(), wkey + (i,)))
+
+    def _rebuild(self):
+        self._grid = {}
+        self._entries = {}
+        origin = self.window.mapToGlobal(QPoint(0, 0))
+        self._index_subtree(self.window, origin.x(), origin.y(), ())
+        self.rebuilds += 1
+
+    def _order_key(self, widget) -> tuple:
+        key = []
+        while widget is not None and widget is not self.window:
+            parent = widget.parentWidget()
+            if parent is None:
+                break
+            key.append(parent.children().index(widget))
+            widget = parent
+        return tuple(reversed(key))
+
+    def _reindex(self, widget):
+        """Re-index one widget's subtree after it moved/resized/showed/hid"""
+        from qgis.PyQt import sip
+
+        if sip.isdeleted(widget):
+            return
+
+        # Drop the subtree's old entries (walk all current descendants)
+        stack = [widget]
+        while stack:
+            w = stack.pop()
+            self._remove(w)
+            stack.extend(c for c in w.children() if c.isWidgetType() and not c.isWindow())
+
+        parent = widget.parentWidget()
+        if parent is None or parent.window() is not self.window:
+            return
+        if parent is not self.window and parent not in self._entries:
+            # Parent not indexed (hidden) - the subtree is not visible either
+            return
+
+        if parent in self._entries:
+            px, py = self._entries[parent][0][:2]
+        else:
+            origin = parent.mapToGlobal(QPoint(0, 0))
+            px, py = origin.x(), origin.y()
+        pos = widget.pos()
+        self._index_subtree(widget, px + pos.x(), py + pos.y(), self._order_key(widget))
+        self.incremental_updates += 1
+
+    def refresh(self):
+        """Apply pending changes (GUI thread)"""
+        with self._lock:
+            rebuild = self._needs_rebuild or len(self._dirty) > MAX_INCREMENTAL
+            dirty = self._dirty
+            self._dirty = set()
+            self._needs_rebuild = False
+
+        if rebuild:
+            self._rebuild()
+            return
+
+        # Parents first so children are placed relative to updated rects
+        for widget in sorted(dirty, key=lambda w: len(self._order_key(w))):
+            self._reindex(widget)
+
+    def hit_test(self, x: int, y: int):
+        """Topmost visible widget containing the screen point (GUI thread)"""
+        self.refresh()
+
+        best = None
+        best_key = None
+        for widget in self._grid.get((x // CELL_SIZE, y // CELL_SIZE), ()):
+            rect, key, _ = self._entries[widget]
+            if not _contains(rect, x, y):
+                continue
+            if best_key is not None and key <= best_key:
+                continue
+            if not self._inside_ancestors(widget, x, y):
+                continue
+            best, best_key = widget, key
+        return best
+
+    def _inside_ancestors(self, widget, x, y) -> bool:
+        """Children are clipped to their parents' rects"""
+        parent = widget.parentWidget()
+        while parent is not None and parent is not self.window:
+            entry = self._entries.get(parent)
+            if entry is None or not _contains(entry[0], x, y):
+                return False
+            parent = parent.parentWidget()
+        return True
+
+
+class SpatialIndex:
+    """Grid indexes for all top-level windows, kept current via the event hub"""
+
+    def __init__(self):
+        self._windows = {}
+        self._lock = threading.Lock()
+        self._subscribed = False
+
+    def _subscribe(self) -> bool:
+        from . import ui_events
+
+        if not ui_events.is_installed():
+            return False
+        if not self._subscribed:
+            hub = ui_events.get_hub()
+            hub.subscribe(GEOMETRY_EVENTS, self._on_geometry)
+            hub.subscribe(STRUCTURE_EVENTS, self._on_structure)
+            self._subscribed = True
+        return True
+
+    def _index_for(self, obj):
+        if not self._windows or not obj.isWidgetType():
+            return None
+        with self._lock:
+            return self._windows.get(obj.window())
+
+    def _on_geometry(self, obj, event):
+        index = self._index_for(obj)
+        if index is None:
+            return
+        if obj is index.window and event.type() == QEvent.Hide:
+            with self._lock:
+                self._windows.pop(obj, None)
+            return
+        index.mark_dirty(obj)
+
+    def _on_structure(self, obj, event):
+        index = self._index_for(obj)
+        if index is not None:
+            index.mark_rebuild()
+
+    def _get_index(self, window) -> WindowGridIndex:
+        if not self._subscribe():
+            # No change notifications - index from scratch every time
+            return WindowGridIndex(window)
+        with self._lock:
+            index = self._windows.get(window)
+            if index is None:
+                index = self._windows[window] = WindowGridIndex(window)
+        return index
+
+    def _widget_at(self, x: int, y: int):
+        from PyQt5.QtWidgets import QApplication
+
+        window = QApplication.topLevelAt(QPoint(x, y))
+        if window is None:
+            return None, None
+        index = self._get_index(window)
+        return index.hit_test(x, y) or window, index
+
+    def widget_at(self, x: int, y: int):
+        """Topmost widget at a screen point, or None (runs on the GUI thread)"""
+        return main_thread.call(lambda: self._widget_at(x, y)[0])
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "windows": len(self._windows),
+                "widgets": sum(len(i._entries) for i in self._windows.values()),
+                "rebuilds": sum(i.rebuilds for i in self._windows.values()),
+                "incremental_updates": sum(i.incremental_updates for i in self._windows.values())
+            }
+
+
+# Shared index instance
+spatial_index = SpatialIndex()
@@ -0,0 +1,275 @@
+"""
+Request tracing with W3C trace context and Zipkin v2 spans
+
+The MCP server starts a trace per tool call and passes it in a W3C
+traceparent header. The API router continues that trace with spans for
+the request, the time spent in the dispatch queue, the handler, GUI-thread
+queueing/execution (via main_thread.post) and response encoding.
+
+Finished spans are kept in memory for the qgis.traces command and written
+as Zipkin v2 JSON, one span per line, to a rotating file
+(traces/spans.jsonl next to the plugin) by a background writer thread, so
+finishing a span never does disk I/O on the thread that finished it (often
+the GUI thread). Requests without a traceparent get a new
+trace ID.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+TRACE_DIR = Path(__file__).parent.parent / "traces"
+SERVICE_NAME = "qgis-ai-bridge"
+
+# Finished spans kept in memory for qgis.traces
+MAX_SPANS = 5000
+
+# Used when config.json has no "tracing" section
+TRACING_DEFAULTS = {
+    "enabled": True,
+    "max_bytes": 5 * 1024 * 1024,
+    "backup_count": 3
+}
+
+_local = threading.local()
+
+
+def _new_id(n_bytes: int) -> str:
+    return os.urandom(n_bytes).hex()
+
+
+def parse_traceparent(value):
+    """(trace_id, parent_span_id) from a W3C traceparent header, or (None, None)"""
+    try:
+        version, trace_id, span_id, _flags = value.strip().split('-')
+    except (AttributeError, ValueError):
+        return None, None
+    if version != "00" or len(trace_id) != 32 or len(span_id) != 16:
+        return None, None
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None, None
+    return trace_id.lower(), span_id.lower()
+
+
+class Span:
+    """One timed operation; exported when finished"""
+
+    def __init__(self, tracer, name: str, trace_id: str, parent_id: str = None,
+                 kind: str = None, tags: dict = None):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.id = _new_id(8)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.tags = {k: str(v) for k, v in (tags or {}).items()}
+        self.timestamp = time.time()
+        self._start = time.perf_counter()
+        self.duration = None
+
+    def tag(self, key: str, value):
+        self.tags[key] = str(value)
+
+    def finish(self):
+        if self.duration is None:
+            self.duration = time.perf_counter() - self._start
+            self.tracer._export(self)
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.id}-01"
+
+    def to_zipkin(self) -> dict:
+        span = {
+            "traceId": self.trace_id,
+            "id": self.id,
+            "name": self.name,
+            "timestamp": int(self.timestamp * 1_000_000),
+            "duration": max(1, int((self.duration or 0) * 1_000_000)),
+            "localEndpoint": {"serviceName": SERVICE_NAME},
+        }
+        if self.parent_id:
+            span["parentId"] = self.parent_id
+        if self.kind:
+            span["kind"] = self.kind
+        if self.tags:
+            span["tags"] = dict(self.tags)
+        return span
+
+
+class Tracer:
+    """Creates spans and exports finished ones to memory and a rotating file"""
+
+    def __init__(self):
+        self._spans = deque(maxlen=MAX_SPANS)
+        self._lock = threading.Lock()
+        self._settings = None
+        self._file_logger = None
+        # Spans waiting for the writer thread (started on first export)
+        self._pending = None
+        self._writer = None
+
+    def _configure(self):
+        if self._settings is None:
+            from .config import get_section
+            self._settings = get_section("tracing", TRACING_DEFAULTS)
+        return self._settings
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._configure()["enabled"])
+
+    def _get_file_logger(self):
+        if self._file_logger is None:
+            settings = self._configure()
+            TRACE_DIR.mkdir(exist_ok=True)
+            handler = RotatingFileHandler(
+                TRACE_DIR / "spans.jsonl",
+                maxBytes=settings["max_bytes"],
+                backupCount=settings["backup_count"],
+                encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            file_logger = logging.getLogger("qgis_ai_bridge.traces")
+            file_logger.setLevel(logging.INFO)
+            file_logger.propagate = False
+            for old in list(file_logger.handlers):
+                # Left over from before a plugin reload
+                file_logger.removeHandler(old)
+                old.close()
+            file_logger.addHandler(handler)
+            self._file_logger = file_logger
+        return self._file_logger
+
+    def _export(self, span: Span):
+        if not self.enabled:
+            return
+        record = span.to_zipkin()
+        with self._lock:
+            self._spans.append(record)
+            if self._writer is None:
+                self._pending = queue.SimpleQueue()
+                self._writer = threading.Thread(
+                    target=self._write_loop, args=(self._pending,),
+                    name="ai-bridge-trace-writer", daemon=True
+                )
+                self._writer.start()
+            self._pending.put(record)
+
+    def _write_loop(self, pending):
+        """Append exported spans to the rotating file until shutdown() (writer thread)"""
+        while True:
+            record = pending.get()
+            if record is None:
+                return
+            try:
+                self._get_file_logger().info(json.dumps(record, separators=(',', ':')))
+            except OSError:
+                pass
+
+    def shutdown(self, timeout: float = 2.0):
+        """Write out pending spans and stop the writer thread (plugin unload)"""
+        with self._lock:
+            writer, pending = self._writer, self._pending
+            self._writer = self._pending = None
+        if writer is not None:
+            pending.put(None)
+            writer.join(timeout)
+
+    # -- span creation ---------------------------------------------------
+
+    def start_span(self, name: str, parent: Span = None, trace_id: str = None,
+                   parent_id: str = None, kind: str = None, **tags) -> Span:
+        """Start a span under parent (default: the current span), or a new trace"""
+        if parent is None and trace_id is None:
+            parent = current()
+        if parent is not None:
+            trace_id, parent_id = parent.trace_id, parent.id
+        return Span(self, name, trace_id or _new_id(16), parent_id, kind, tags)
+
+    @contextmanager
+    def span(self, name: str, **tags):
+        """Child span of the current span, current for the duration of the block"""
+        span = self.start_span(name, **tags)
+        try:
+            with activate(span):
+                yield span
+        finally:
+            span.finish()
+
+    # -- queries ---------------------------------------------------------
+
+    def spans(self, trace_id: str) -> list:
+        with self._lock:
+            spans = [dict(s) for s in self._spans if s["traceId"] == trace_id]
+        spans.sort(key=lambda s: s["timestamp"])
+        return spans
+
+    def traces(self, limit: int = 20, command: str = None, min_duration_ms: float = 0) -> list:
+        """Summaries of recent request traces, newest first"""
+        with self._lock:
+            spans = list(self._spans)
+
+        by_trace = {}
+        for span in spans:
+            by_trace.setdefault(span["traceId"], []).append(span)
+
+        summaries = []
+        for trace_id, trace_spans in by_trace.items():
+            root = next((s for s in trace_spans if s["name"] == "api.request"), None)
+            if root is None:
+                continue
+            tags = root.get("tags", {})
+            duration_ms = root["duration"] / 1000
+            if command and tags.get("command") != command:
+                continue
+            if duration_ms < min_duration_ms:
+                continue
+            summaries.append({
+                "trace_id": trace_id,
+                "command": tags.get("command"),
+                "status": tags.get("http.status_code"),
+                "timestamp": root["timestamp"] / 1_000_000,
+                "duration_ms": round(duration_ms, 3),
+                "spans": len(trace_spans),
+                "breakdown_ms": breakdown(trace_spans)
+            })
+
+        summaries.sort(key=lambda s: s["timestamp"], reverse=True)
+        return summaries[:limit]
+
+
+def breakdown(spans: list) -> dict:
+    """Total milliseconds per span name (excluding the request span itself)"""
+    totals = {}
+    for span in spans:
+        if span["name"] != "api.request":
+            totals[span["name"]] = totals.get(span["name"], 0) + span["duration"] / 1000
+    return {name: round(ms, 3) for name, ms in totals.items()}
+
+
+def current() -> Span:
+    """Span this thread is currently working in, or None"""
+    return getattr(_local, 'span', None)
+
+
+@contextmanager
+def activate(span: Span):
+    """Make span the current span of this thread for the duration of the block"""
+    previous = getattr(_local, 'span', None)
+    _local.span = span
+    try:
+        yield span
+    finally:
+        _local.span = previous
+
+
+# Global tracer instance
+tracer = Tracer()
@@ -0,0 +1,104 @@
+"""
+Shared application-wide event hub
+
+One event filter is installed on the QApplication (in initGui, removed in
+unload) and fans events out to subscribers by event type. Caches that must
+be invalidated by UI changes (widget geometry, windows, ...) subscribe here
+instead of each installing their own filter.
+
+Subscribers run on the GUI thread inside the event filter, so they must be
+cheap: mark something stale, bump a counter, record a rect.
+"""
+
+import threading
+
+from PyQt5.QtCore import QObject
+
+_hub = None
+_hub_lock = threading.Lock()
+
+
+class EventHub(QObject):
+    """Application event filter dispatching to per-event-type callbacks"""
+
+    def __init__(self):
+        super().__init__()
+        # event type -> list of callback(obj, event)
+        self._callbacks = {}
+        self._installed = False
+
+    @property
+    def installed(self) -> bool:
+        """True while the filter is active (subscribers can trust their caches)"""
+        return self._installed
+
+    def subscribe(self, event_types, callback):
+        """Call callback(obj, event) for every event of the given types"""
+        for event_type in event_types:
+            callbacks = self._callbacks.setdefault(event_type, [])
+            if callback not in callbacks:
+                callbacks.append(callback)
+
+    def unsubscribe(self, callback):
+        """Remove callback from all event types"""
+        for event_type in list(self._callbacks):
+            callbacks = [c for c in self._callbacks[event_type] if c != callback]
+            if callbacks:
+                self._callbacks[event_type] = callbacks
+            else:
+                del self._callbacks[event_type]
+
+    def eventFilter(self, obj, event):
+        callbacks = self._callbacks.get(event.type())
+        if callbacks:
+            for callback in callbacks:
+                try:
+                    callback(obj, event)
+                except Exception:
+                    pass
+        return False
+
+    def install(self):
+        """Install the filter on the application (GUI thread)"""
+        from PyQt5.QtWidgets import QApplication
+
+        if not self._installed:
+            QApplication.instance().installEventFilter(self)
+            self._installed = True
+
+    def uninstall(self):
+        """Remove the filter from the application (GUI thread)"""
+        from PyQt5.QtWidgets import QApplication
+
+        if self._installed:
+            app = QApplication.instance()
+            if app is not None:
+                app.removeEventFilter(self)
+            self._installed = False
+
+
+def get_hub() -> EventHub:
+    """Get the shared hub (created on first use, not installed)"""
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            from PyQt5.QtWidgets import QApplication
+            hub = EventHub()
+            # Filters only see events for objects in their own thread
+            hub.moveToThread(QApplication.instance().thread())
+            _hub = hub
+        return _hub
+
+
+def install():
+    """Install the shared hub (call from initGui)"""
+    get_hub().install()
+
+
+def uninstall():
+    """Remove the shared hub (call from unload)"""
+    get_hub().uninstall()
+
+
+def is_installed() -> bool:
+    return _hub is not None and _hub.installed
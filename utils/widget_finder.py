@@ -6,17 +6,22 @@ from typing import List, Optional, Dict
 from PyQt5.QtWidgets import QWidget, QApplication
 from PyQt5.QtCore import Qt
 
+from .widget_projection import Projection
+from .widget_handles import handles
+
 
 class WidgetFinder:
     """Utilities for finding and introspecting Qt widgets"""
 
     @staticmethod
-    def get_widget_tree(root: QWidget = None, include_invisible: bool = False) -> dict:
+    def get_widget_tree(root: QWidget = None, include_invisible: bool = False,
+                        projection: Projection = None) -> dict:
         """Get complete widget hierarchy as a tree.
 
         Args:
             root: Root widget (default: main window)
             include_invisible: Include non-visible widgets
+            projection: Field selection / truncation / node limit (default: all fields)
 
         Returns:
             dict representing widget tree
@@ -26,8 +31,14 @@ class WidgetFinder:
             from qgis.utils import iface
             root = iface.mainWindow()
 
+        if projection is None:
+            projection = Projection()
+        node_count = 0
+
         def build_tree(widget: QWidget, path: str = "") -> dict:
             """Recursively build widget tree"""
+            nonlocal node_count
+
             if not widget:
                 return None
 
@@ -35,31 +46,29 @@ class WidgetFinder:
             if not include_invisible and not widget.isVisible():
                 return None
 
+            if projection.full(node_count):
+                return None
+            node_count += 1
+
             object_name = widget.objectName() or f"<{widget.__class__.__name__}>"
             current_path = f"{path}.{object_name}" if path else object_name
 
-            node = {
-                "path": current_path,
-                "object_name": widget.objectName(),
-                "type": widget.__class__.__name__,
-                "visible": widget.isVisible(),
-                "enabled": widget.isEnabled(),
-                "geometry": {
+            node = projection.collect({
+                "handle": lambda: handles.handle_for(widget),
+                "path": lambda: current_path,
+                "object_name": widget.objectName,
+                "type": lambda: widget.__class__.__name__,
+                "visible": widget.isVisible,
+                "enabled": widget.isEnabled,
+                "geometry": lambda: {
                     "x": widget.x(),
                     "y": widget.y(),
                     "width": widget.width(),
                     "height": widget.height()
-                }
-            }
-
-            # Get text if available
-            if hasattr(widget, 'text'):
-                try:
-                    text = widget.text()
-                    if text:
-                        node["text"] = text
-                except:
-                    pass
+                },
+                # Get text if available
+                "text": lambda: (widget.text() or None) if hasattr(widget, 'text') else None
+            })
 
             # Get children
             children = []
@@ -77,7 +86,8 @@ class WidgetFinder:
         return build_tree(root)
 
     @staticmethod
-    def find_widgets(criteria: dict, root: QWidget = None, search_all_windows: bool = True) -> List[dict]:
+    def find_widgets(criteria: dict, root: QWidget = None, search_all_windows: bool = True,
+                     projection: Projection = None) -> List[dict]:
         """Find widgets matching criteria.
 
         Args:
@@ -88,12 +98,15 @@ class WidgetFinder:
                 - visible_only: bool (default True)
             root: Root widget to search from
             search_all_windows: If True and root is None, search all top-level widgets including dialogs
+            projection: Field selection / truncation / result limit (default: all fields)
 
         Returns:
             List of matching widgets with their info
         """
         results = []
         visible_only = criteria.get("visible_only", True)
+        if projection is None:
+            projection = Projection()
 
         # If no root specified and search_all_windows is True, search all top-level widgets
         if root is None and search_all_windows:
@@ -104,14 +117,14 @@ class WidgetFinder:
         else:
             roots_to_search = [root]
 
-        def search_widget(widget: QWidget, path: str = ""):
-            """Recursively search for matching widgets"""
+        def search_widget(widget: QWidget, path: str = "") -> bool:
+            """Recursively search for matching widgets (False = result limit hit)"""
             if not widget:
-                return
+                return True
 
             # Skip invisible if requested
             if visible_only and not widget.isVisible():
-                return
+                return True
 
             object_name = widget.objectName() or f"<{widget.__class__.__name__}>"
             current_path = f"{path}.{object_name}" if path else object_name
@@ -144,28 +157,34 @@ class WidgetFinder:
                     matches = False
 
             if matches:
-                widget_info = WidgetFinder.get_widget_info(widget, current_path)
+                if projection.full(len(results)):
+                    return False
+                widget_info = WidgetFinder.get_widget_info(widget, current_path, projection)
                 results.append(widget_info)
 
             # Search children
             for child in widget.children():
                 if isinstance(child, QWidget):
-                    search_widget(child, current_path)
+                    if not search_widget(child, current_path):
+                        return False
+            return True
 
         # Search all roots
         for root_widget in roots_to_search:
             if root_widget and root_widget.isVisible():
-                search_widget(root_widget)
+                if not search_widget(root_widget):
+                    break
 
         return results
 
     @staticmethod
-    def get_widget_info(widget: QWidget, path: str = None) -> dict:
+    def get_widget_info(widget: QWidget, path: str = None, projection: Projection = None) -> dict:
         """Get detailed information about a widget.
 
         Args:
             widget: QWidget instance
             path: Widget path (optional)
+            projection: Field selection / truncation (default: all fields)
 
         Returns:
             dict with widget information
@@ -175,63 +194,54 @@ class WidgetFinder:
         if not widget:
             return None
 
-        info = {
-            "path": path or widget.objectName(),
-            "object_name": widget.objectName(),
-            "type": widget.__class__.__name__,
-            "visible": widget.isVisible(),
-            "enabled": widget.isEnabled(),
-            "geometry": {
+        if projection is None:
+            projection = Projection()
+
+        # Screen position and center share one coordinate lookup
+        screen_coords = {}
+
+        def get_screen_coords():
+            if not screen_coords:
+                screen_coords.update(CoordinateHelper.widget_to_screen(widget) or {})
+            return screen_coords or None
+
+        def optional(method):
+            """Getter for a method only some widget classes have"""
+            if not hasattr(widget, method):
+                return lambda: None
+            return getattr(widget, method)
+
+        return projection.collect({
+            "handle": lambda: handles.handle_for(widget),
+            "path": lambda: path or widget.objectName(),
+            "object_name": widget.objectName,
+            "type": lambda: widget.__class__.__name__,
+            "visible": widget.isVisible,
+            "enabled": widget.isEnabled,
+            "geometry": lambda: {
                 "x": widget.x(),
                 "y": widget.y(),
                 "width": widget.width(),
                 "height": widget.height()
-            }
-        }
-
-        # Get screen position
-        screen_coords = CoordinateHelper.widget_to_screen(widget)
-        if screen_coords:
-            info["screen_position"] = {
+            },
+            # Get screen position
+            "screen_position": lambda: get_screen_coords() and {
                 "x": screen_coords["screen_x"],
                 "y": screen_coords["screen_y"]
-            }
-            info["screen_center"] = {
+            },
+            "screen_center": lambda: get_screen_coords() and {
                 "x": screen_coords["center_x"],
                 "y": screen_coords["center_y"]
-            }
-
-        # Get text if available
-        if hasattr(widget, 'text'):
-            try:
-                text = widget.text()
-                if text:
-                    info["text"] = text
-            except:
-                pass
-
-        # Get value if available (for input widgets)
-        if hasattr(widget, 'value'):
-            try:
-                info["value"] = widget.value()
-            except:
-                pass
-
-        # Get current text for combo boxes
-        if hasattr(widget, 'currentText'):
-            try:
-                info["current_text"] = widget.currentText()
-            except:
-                pass
-
-        # Get plain text for text edits
-        if hasattr(widget, 'toPlainText'):
-            try:
-                info["plain_text"] = widget.toPlainText()
-            except:
-                pass
-
-        return info
+            },
+            # Get text if available
+            "text": lambda: optional('text')() or None,
+            # Get value if available (for input widgets)
+            "value": optional('value'),
+            # Get current text for combo boxes
+            "current_text": optional('currentText'),
+            # Get plain text for text edits (can be huge - leave out of fields to skip it)
+            "plain_text": optional('toPlainText')
+        })
 
     @staticmethod
     def get_widget_by_path(path: str, root: QWidget = None) -> Optional[QWidget]:
@@ -281,9 +291,28 @@ class WidgetFinder:
     def list_all_dialogs() -> List[dict]:
         """List all currently open dialogs.
 
+        Served from the window registry while it is running.
+
         Returns:
             List of dialog information dicts
         """
+        from .window_registry import registry
+
+        if registry.running:
+            return [
+                {
+                    "title": entry["title"],
+                    "object_name": entry["objectName"],
+                    "type": entry["class"],
+                    "visible": True,
+                    "modal": entry["modal"],
+                    "handle": entry["handle"],
+                    "opened_at": entry["opened_at"]
+                }
+                for entry in registry.windows()
+                if entry["dialog"] and entry["title"]
+            ]
+
         dialogs = []
         for widget in QApplication.topLevelWidgets():
             # Check if it's a dialog and visible
@@ -0,0 +1,183 @@
+"""
+Stable numeric handles for widgets
+
+Introspection results carry a handle that later commands can pass instead of
+an objectName, skipping the name lookup (and its ambiguity: many QGIS
+widgets share or lack objectNames).
+
+A handle packs a slot index and that slot's generation counter. Slots are
+freed when the widget's destroyed() signal fires and their generation is
+bumped, so an old handle can never resolve to a different widget that later
+reuses the slot. The same widget always gets the same handle while it lives
+(keyed by its C++ pointer).
+"""
+
+import threading
+import weakref
+
+# Low bits of a handle hold the slot index, the rest the generation
+SLOT_BITS = 20
+SLOT_MASK = (1 << SLOT_BITS) - 1
+
+
+class StaleHandleError(ValueError):
+    """Raised for handles whose widget was destroyed (or never existed)"""
+
+
+def _pointer(widget) -> int:
+    from qgis.PyQt import sip
+    return sip.unwrapinstance(widget)
+
+
+def _is_deleted(widget) -> bool:
+    from qgis.PyQt import sip
+    return sip.isdeleted(widget)
+
+
+def _is_py_owned(widget) -> bool:
+    from qgis.PyQt import sip
+    return sip.ispyowned(widget)
+
+
+class WidgetHandleTable:
+    """Slot/generation table mapping handles to live widgets.
+
+    Slots hold only a weak reference to the widget's Python wrapper (plus its
+    C++ pointer), so the table never keeps a widget alive. For a widget owned
+    by Python the wrapper dying means the widget is gone and its slot is
+    freed; a C++-owned widget can outlive its wrapper, so it is re-wrapped
+    from its pointer until destroyed() frees the slot.
+    """
+
+    def __init__(self):
+        # Slot 0 is never used, so handles are always non-zero
+        self._refs = [None]           # slot -> weakref to the wrapper, or None if free
+        self._generations = [0]       # slot -> generation
+        self._pointers = [None]       # slot -> C++ pointer
+        self._py_owned = [False]      # slot -> wrapper owned the C++ object when registered
+        self._free = []
+        self._by_pointer = {}         # C++ pointer -> handle
+        # Slots whose wrapper was collected; weakref callbacks may run during
+        # garbage collection while the lock is held, so they only queue here
+        self._collected = []
+        self._lock = threading.Lock()
+
+    def _reap(self):
+        """Free slots of collected Python-owned widgets (lock held)"""
+        while self._collected:
+            slot, handle = self._collected.pop()
+            if self._handle_of(slot) == handle:
+                self._release(slot)
+
+    def _handle_of(self, slot: int) -> int:
+        return (self._generations[slot] << SLOT_BITS) | slot
+
+    def _on_collected(self, slot: int, handle: int):
+        self._collected.append((slot, handle))
+
+    def _weak(self, widget, slot: int):
+        """Weak reference to a slot's wrapper that queues the slot when collected"""
+        handle = self._handle_of(slot)
+        return weakref.ref(widget, lambda ref, slot=slot, handle=handle: self._on_collected(slot, handle))
+
+    def _widget(self, slot: int):
+        """Live widget in an occupied slot, or None if it is gone (lock held)"""
+        from qgis.PyQt import sip
+        from PyQt5.QtCore import QObject
+
+        widget = self._refs[slot]()
+        if widget is None:
+            if self._py_owned[slot]:
+                # The wrapper owned the widget - collecting it deleted the widget
+                return None
+            # C++-owned and still alive (destroyed() frees the slot under this lock)
+            widget = sip.wrapinstance(self._pointers[slot], QObject)
+            self._refs[slot] = self._weak(widget, slot)
+        if _is_deleted(widget):
+            return None
+        return widget
+
+    def handle_for(self, widget) -> int:
+        """Get the widget's handle, registering it on first use"""
+        pointer = _pointer(widget)
+        with self._lock:
+            self._reap()
+            handle = self._by_pointer.get(pointer)
+            if handle is not None:
+                slot = handle & SLOT_MASK
+                if self._refs[slot] is not None and self._widget(slot) is widget:
+                    return handle
+                # Pointer reused by a new widget before destroyed() was handled
+                self._release(slot)
+
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = len(self._refs)
+                if slot > SLOT_MASK:
+                    raise RuntimeError("Widget handle table is full")
+                self._refs.append(None)
+                self._generations.append(0)
+                self._pointers.append(None)
+                self._py_owned.append(False)
+
+            handle = self._handle_of(slot)
+            self._refs[slot] = self._weak(widget, slot)
+            self._pointers[slot] = pointer
+            self._py_owned[slot] = _is_py_owned(widget)
+            self._by_pointer[pointer] = handle
+
+        widget.destroyed.connect(lambda *args, slot=slot, handle=handle: self._on_destroyed(slot, handle))
+        return handle
+
+    def _release(self, slot: int):
+        """Free a slot and invalidate handles pointing at it (lock held)"""
+        if self._refs[slot] is None:
+            return
+        handle = self._handle_of(slot)
+        if self._by_pointer.get(self._pointers[slot]) == handle:
+            del self._by_pointer[self._pointers[slot]]
+        self._refs[slot] = None
+        self._pointers[slot] = None
+        self._py_owned[slot] = False
+        self._generations[slot] += 1
+        self._free.append(slot)
+
+    def _on_destroyed(self, slot: int, handle: int):
+        with self._lock:
+            if slot < len(self._generations) and self._handle_of(slot) == handle:
+                self._release(slot)
+
+    def resolve(self, handle: int):
+        """Get the live widget for a handle.
+
+        Raises:
+            StaleHandleError: If the widget was destroyed or the handle is unknown
+        """
+        handle = int(handle)
+        slot = handle & SLOT_MASK
+        generation = handle >> SLOT_BITS
+
+        with self._lock:
+            self._reap()
+            if slot == 0 or slot >= len(self._refs) or generation > self._generations[slot]:
+                raise StaleHandleError(f"Unknown widget handle: {handle}")
+            if generation != self._generations[slot] or self._refs[slot] is None:
+                raise StaleHandleError(
+                    f"Stale widget handle: {handle} (widget was destroyed; look it up again)"
+                )
+            widget = self._widget(slot)
+            if widget is None:
+                self._release(slot)
+                raise StaleHandleError(
+                    f"Stale widget handle: {handle} (widget was destroyed; look it up again)"
+                )
+        return widget
+
+    def __len__(self):
+        with self._lock:
+            self._reap()
+            return len(self._refs) - len(self._free) - 1
+
+# Global handle table
+handles = WidgetHandleTable()
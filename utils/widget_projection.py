@@ -0,0 +1,82 @@
+"""
+Field projection and truncation for widget introspection results
+
+Introspection commands describe each property as a getter instead of reading
+it eagerly. Only the getters for requested fields are ever called, so an
+expensive read such as toPlainText() on a large log pane is skipped unless
+the caller asked for it.
+"""
+
+# Strings longer than this are cut unless the caller asks otherwise
+DEFAULT_MAX_TEXT_LEN = 4096
+
+
+class Projection:
+    """Selects fields, truncates text and caps result counts"""
+
+    def __init__(self, fields: list = None, max_text_len: int = DEFAULT_MAX_TEXT_LEN,
+                 max_results: int = None):
+        """
+        Args:
+            fields: Field names to return (None = all fields)
+            max_text_len: Maximum length of string values (0/None = no limit)
+            max_results: Maximum number of results (None = no limit)
+        """
+        self.fields = set(fields) if fields else None
+        self.max_text_len = max_text_len or None
+        self.max_results = max_results or None
+        self.truncated = False
+
+    @classmethod
+    def from_params(cls, params: dict) -> "Projection":
+        """Build a projection from command params (fields, max_text_len, max_results)"""
+        return cls(
+            fields=params.get('fields'),
+            max_text_len=params.get('max_text_len', DEFAULT_MAX_TEXT_LEN),
+            max_results=params.get('max_results')
+        )
+
+    def wants(self, field: str) -> bool:
+        """Check whether a field was requested"""
+        return self.fields is None or field in self.fields
+
+    def text(self, value: str) -> str:
+        """Truncate a string to max_text_len, flagging the result as truncated"""
+        if self.max_text_len and len(value) > self.max_text_len:
+            self.truncated = True
+            return value[:self.max_text_len]
+        return value
+
+    def collect(self, getters: dict) -> dict:
+        """Read the requested fields.
+
+        Args:
+            getters: Mapping of field name -> zero-argument callable. Getters
+                that raise or return None are left out of the result.
+
+        Returns:
+            dict of field name -> value
+        """
+        result = {}
+        for field, getter in getters.items():
+            if not self.wants(field):
+                continue
+            try:
+                value = getter()
+            except Exception:
+                continue
+            if value is None:
+                continue
+            result[field] = self.text(value) if isinstance(value, str) else value
+        return result
+
+    def full(self, count: int) -> bool:
+        """Check whether another result would exceed max_results.
+
+        Call this when a further match is found; it flags the response as
+        truncated and the caller stops collecting.
+        """
+        if self.max_results and count >= self.max_results:
+            self.truncated = True
+            return True
+        return False
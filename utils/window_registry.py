@@ -0,0 +1,219 @@
+"""
+Registry of top-level windows kept current from the shared event hub
+
+Windows are registered when first shown and updated from Show, Hide,
+WindowTitleChange, Move/Resize, EnabledChange and WindowActivate events;
+entries are dropped when the widget is destroyed. widget.list_windows,
+WidgetFinder.list_all_dialogs and dialog.close read from memory instead of
+walking QApplication.topLevelWidgets() and querying each window.
+
+Every lifecycle change (opened, closed, title, destroyed) gets a
+monotonically increasing token. changes(since) returns what happened after
+a token the caller saw earlier, so new dialogs can be detected without
+diffing full window lists.
+
+Entries are keyed by the window's C++ pointer and reach the widget through
+its weak widget handle, so the registry never keeps a window alive.
+
+z is an activation counter: the most recently shown or activated window has
+the highest value (Qt has no global stacking order to query).
+"""
+
+import itertools
+import threading
+import time
+from collections import deque
+
+from PyQt5.QtCore import QEvent, Qt
+
+# Lifecycle changes kept for since= queries
+MAX_CHANGES = 500
+
+LIFECYCLE_EVENTS = (QEvent.Show, QEvent.Hide, QEvent.WindowTitleChange)
+STATE_EVENTS = (QEvent.Move, QEvent.Resize, QEvent.EnabledChange, QEvent.WindowActivate)
+
+
+def describe(widget) -> dict:
+    """Window fields as reported by widget.list_windows"""
+    return {
+        "class": widget.__class__.__name__,
+        "title": widget.windowTitle(),
+        "objectName": widget.objectName(),
+        "visible": widget.isVisible(),
+        "enabled": widget.isEnabled(),
+        "modal": widget.isModal() if hasattr(widget, 'isModal') else False,
+        "dialog": bool(widget.windowFlags() & Qt.Dialog),
+        "geometry": {
+            "x": widget.x(),
+            "y": widget.y(),
+            "width": widget.width(),
+            "height": widget.height()
+        }
+    }
+
+
+def _pointer(widget) -> int:
+    from qgis.PyQt import sip
+    return sip.unwrapinstance(widget)
+
+
+class WindowRegistry:
+    """Top-level windows and their lifecycle changes"""
+
+    def __init__(self):
+        self._entries = {}      # C++ pointer -> entry dict
+        self._changes = deque(maxlen=MAX_CHANGES)
+        self._token = 0
+        self._z = itertools.count(1)
+        self._lock = threading.Lock()
+        self._started = False
+
+    @property
+    def running(self) -> bool:
+        from . import ui_events
+        return self._started and ui_events.is_installed()
+
+    def start(self):
+        """Subscribe to the event hub and register visible windows (GUI thread)"""
+        from PyQt5.QtWidgets import QApplication
+        from . import ui_events
+
+        if self._started:
+            return
+        hub = ui_events.get_hub()
+        hub.subscribe(LIFECYCLE_EVENTS, self._on_lifecycle)
+        hub.subscribe(STATE_EVENTS, self._on_state)
+        self._started = True
+
+        for widget in QApplication.topLevelWidgets():
+            if widget.isVisible():
+                self._shown(widget)
+
+    # -- event handling (GUI thread) ------------------------------------
+
+    def _record(self, change: str, entry: dict):
+        """Append a lifecycle change (lock held)"""
+        self._token += 1
+        entry["token"] = self._token
+        self._changes.append({"token": self._token, "change": change, "window": self._public(entry)})
+
+    def _shown(self, widget):
+        from .widget_handles import handles
+
+        pointer = _pointer(widget)
+        with self._lock:
+            entry = self._entries.get(pointer)
+            new = entry is None
+            if new:
+                entry = self._entries[pointer] = {"handle": handles.handle_for(widget)}
+            entry.update(describe(widget))
+            entry["opened_at"] = time.time()
+            entry["closed_at"] = None
+            entry["z"] = next(self._z)
+            self._record("opened", entry)
+
+        if new:
+            widget.destroyed.connect(lambda *args, pointer=pointer: self._destroyed(pointer))
+
+    def _destroyed(self, pointer: int):
+        with self._lock:
+            entry = self._entries.pop(pointer, None)
+            if entry is not None:
+                entry["visible"] = False
+                self._record("destroyed", entry)
+
+    def _on_lifecycle(self, obj, event):
+        if not obj.isWidgetType() or not obj.isWindow():
+            return
+        kind = event.type()
+        if kind == QEvent.Show:
+            self._shown(obj)
+            return
+
+        with self._lock:
+            entry = self._entries.get(_pointer(obj))
+            if entry is None:
+                return
+            if kind == QEvent.Hide:
+                entry["visible"] = False
+                entry["closed_at"] = time.time()
+                self._record("closed", entry)
+            elif entry["title"] != obj.windowTitle():
+                entry["title"] = obj.windowTitle()
+                self._record("title", entry)
+
+    def _on_state(self, obj, event):
+        if not self._entries or not obj.isWidgetType() or not obj.isWindow():
+            return
+        entry = self._entries.get(_pointer(obj))
+        if entry is None:
+            return
+        with self._lock:
+            kind = event.type()
+            if kind == QEvent.WindowActivate:
+                entry["z"] = next(self._z)
+            elif kind == QEvent.EnabledChange:
+                entry["enabled"] = obj.isEnabled()
+            else:
+                entry["geometry"] = {
+                    "x": obj.x(),
+                    "y": obj.y(),
+                    "width": obj.width(),
+                    "height": obj.height()
+                }
+
+    # -- queries (any thread) -------------------------------------------
+
+    @staticmethod
+    def _public(entry: dict) -> dict:
+        public = dict(entry)
+        public["geometry"] = dict(entry["geometry"])
+        return public
+
+    @property
+    def token(self) -> int:
+        return self._token
+
+    def windows(self, visible_only: bool = True) -> list:
+        """Registered windows, topmost (highest z) first"""
+        with self._lock:
+            entries = [
+                self._public(e) for e in self._entries.values()
+                if e["visible"] or not visible_only
+            ]
+        entries.sort(key=lambda e: e["z"], reverse=True)
+        return entries
+
+    def changes(self, since: int):
+        """Lifecycle changes after token since.
+
+        Returns:
+            (changes, complete): complete is False if changes older than the
+            retained history were dropped (the caller should resync from windows())
+        """
+        with self._lock:
+            changes = [dict(c) for c in self._changes if c["token"] > since]
+            oldest = self._changes[0]["token"] if self._changes else self._token + 1
+        return changes, since >= oldest - 1
+
+    def find(self, object_name: str = None, title: str = None):
+        """Topmost visible window by objectName or title substring, or None"""
+        from .widget_handles import handles, StaleHandleError
+
+        with self._lock:
+            candidates = sorted(
+                (dict(e) for e in self._entries.values() if e["visible"]),
+                key=lambda e: e["z"], reverse=True
+            )
+        for entry in candidates:
+            if (object_name and entry["objectName"] == object_name) or (title and title in entry["title"]):
+                try:
+                    return handles.resolve(entry["handle"])
+                except StaleHandleError:
+                    # Destroyed since the snapshot; destroyed() drops the entry
+                    continue
+        return None
+
+
+# Global registry instance (started from initGui)
+registry = WindowRegistry()